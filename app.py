@@ -1,4 +1,6 @@
-from flask import Flask, render_template, request, Response, send_from_directory, g
+from flask import Flask, render_template, request, Response, send_from_directory, g, make_response
+from functools import wraps
+from markupsafe import Markup
 from datetime import date, datetime, timedelta, time
 import os
 import yaml
@@ -6,15 +8,21 @@ import pytz
 import calendar
 import json
 from pathlib import Path
-from location_utils import extract_location_info, get_region_name
-import io
-from icalendar import Calendar, Event as ICalEvent
+from location_utils import get_region_name
 import hashlib
-import xml.etree.ElementTree as ET  # nosec B405
-from email.utils import formatdate
 import db_utils  # Legacy — being phased out
-from site_config import get_config
-from event_utils import calculate_event_hash
+import site_config
+from site_config import get_config, get_sponsors
+from event_utils import as_event
+from event_utils import calculate_event_hash  # noqa: F401 - re-exported (from app import calculate_event_hash)
+from data_cache import EventSnapshot, FragmentCache, SnapshotCache, file_fingerprint, tree_fingerprint
+from event_index import EventIndex
+from day_view import DayViewModel
+from event_shards import EventShards
+from ics_writer import write_calendar
+from ndjson_export import iter_ndjson
+from rss_writer import upcoming_item, upcoming_item_key, write_feed
+from content_index import get_tree
 
 config = get_config()
 
@@ -27,97 +35,342 @@ DATA_DIR = '_data'
 SPONSORS_FILE = os.path.join(DATA_DIR, 'sponsors.json')
 
 app = Flask(__name__, template_folder='templates')
+# When True, feed and sitemap timestamps come from the event data instead of
+# the clock, so identical inputs produce identical files (see
+# get_content_time). freeze.py turns it on for builds.
+app.config['REPRODUCIBLE_BUILD'] = False
 
 def load_sponsors():
-    """Load sponsors from sponsors.json file"""
-    sponsors_file = os.path.join('_data', 'sponsors.json')
-
-    if not os.path.exists(sponsors_file):
-        return []
-
-    try:
-        with open(sponsors_file, 'r') as f:
-            return json.load(f)
-    except Exception as e:
-        print(f"Error loading sponsors: {e}")
-        return []
+    """Load sponsors from sponsors.json file (cached until the file changes)"""
+    return get_sponsors()
 
 @app.context_processor
 def inject_config():
     """Inject configuration variables into all templates"""
+    # get_config() refreshes the shared config dict if config.yaml changed
+    site = get_config()
     return {
-        'site_name': config.get('site_name', 'DC Tech Events'),
-        'tagline': config.get('tagline', 'Technology conferences and meetups in and around Washington, DC'),
-        'base_url': config.get('base_url', 'https://dctech.events'),
-        'add_events_link': config.get('add_events_link', 'https://dctech.events/edit/submit-event.html'),
+        'site_name': site.get('site_name', 'DC Tech Events'),
+        'tagline': site.get('tagline', 'Technology conferences and meetups in and around Washington, DC'),
+        'base_url': site.get('base_url', 'https://dctech.events'),
+        'add_events_link': site.get('add_events_link', 'https://dctech.events/edit/submit-event.html'),
         'newsletter_signup_link': 'https://k8w5eowyyb.execute-api.us-east-1.amazonaws.com/api/dctech',
         'sponsors': load_sponsors(),
         'categories': get_categories()
     }
 
-def get_events(include_hidden=False):
+_event_snapshots = SnapshotCache()
+
+def get_event_snapshot():
     """
-    Get events from the consolidated _data/all_events.json file.
+    Get the process-wide snapshot of upcoming events.
 
-    Args:
-        include_hidden: If True, include events marked as hidden. Default False.
+    The snapshot is rebuilt only when _data/all_events.json or a file in
+    _groups/ changes on disk, or when the local date rolls over.
 
     Returns:
-        A list of events
+        An EventSnapshot
     """
     events_file = os.path.join('_data', 'all_events.json')
-    
+    today = datetime.now(local_tz).date()
+    key = (file_fingerprint(events_file), tree_fingerprint('_groups'), today)
+    return _event_snapshots.get(key, lambda: _load_event_snapshot(events_file, today))
+
+def get_event_snapshot_stats():
+    """Get hit/miss counters for the event snapshot cache."""
+    return _event_snapshots.stats()
+
+def _load_event_snapshot(events_file, today):
+    """
+    Load all_events.json and build an EventSnapshot for the given date.
+
+    Args:
+        events_file: Path to all_events.json
+        today: Local date; events before it are dropped
+
+    Returns:
+        An EventSnapshot (empty if the file is missing or unreadable)
+    """
+    raw = b''
+    events = []
+    source_mtime = None
     try:
-        with open(events_file, 'r') as f:
-            events = json.load(f)
-            
-        # Filter out hidden and duplicate events unless explicitly requested
-        if not include_hidden:
-            events = [e for e in events if not e.get('hidden', False) and not e.get('duplicate_of')]
-        
-        # Ensure we only return future events (plus today)
-        today = datetime.now(local_tz).date().strftime('%Y-%m-%d')
-        events = [e for e in events if e.get('date', '') >= today]
-        
-        # Add group_website if missing by looking it up from groups
-        groups = get_approved_groups()
-        group_map = {g.get('name'): g for g in groups if g.get('name')}
-
-        for event in events:
-
-            if not event.get('group_website') and event.get('group'):
-                group = group_map.get(event['group'])
-                if group and group.get('website'):
-                    event['group_website'] = group['website']
-            
-        return events
+        with open(events_file, 'rb') as f:
+            raw = f.read()
+        events = json.loads(raw)
+        source_mtime = os.path.getmtime(events_file)
     except Exception as e:
         print(f"Error loading events from {events_file}: {e}")
-        return []
+
+    # Ensure we only return future events (plus today)
+    today_str = today.strftime('%Y-%m-%d')
+    events = [e for e in events if e.get('date', '') >= today_str]
+
+    # Add group_website if missing by looking it up from groups
+    groups = get_approved_groups()
+    group_websites = {g.get('name'): g.get('website') for g in groups if g.get('name') and g.get('website')}
+
+    for event in events:
+        if not event.get('group_website') and event.get('group'):
+            group_website = group_websites.get(event['group'])
+            if group_website:
+                event['group_website'] = group_website
+
+    # Parse dates and times once; every helper below accepts these records
+    events = [as_event(e, local_tz) for e in events]
+
+    # Filter out hidden and duplicate events for the default view
+    visible = [e for e in events if not e.get('hidden', False) and not e.get('duplicate_of')]
+
+    digest = hashlib.sha1(raw, usedforsecurity=False)
+    digest.update(today_str.encode())
+    digest.update(json.dumps(sorted(group_websites.items()), ensure_ascii=False).encode('utf-8'))
+
+    return EventSnapshot(visible, events, today, digest.hexdigest(), source_mtime)
+
+def get_events(include_hidden=False):
+    """
+    Get upcoming events from the consolidated _data/all_events.json file.
+
+    Events come from the shared snapshot (see get_event_snapshot), so the file
+    is parsed once per change rather than once per request.
+
+    Args:
+        include_hidden: If True, include events marked as hidden. Default False.
+
+    Returns:
+        A tuple of read-only Event records (see event_utils.Event) that
+        behave like event dictionaries. Use event.copy() to get a mutable dict.
+    """
+    snapshot = get_event_snapshot()
+    return snapshot.all_events if include_hidden else snapshot.events
+
+_event_indexes = SnapshotCache()
+
+def get_event_index(events=None):
+    """
+    Get the category/region/week/month index for a list of events.
+
+    The index for the current snapshot is built once and reused by every
+    route; any other list (e.g. a pre-filtered one) gets a fresh index.
+
+    Args:
+        events: Sequence of events to index. Defaults to get_events().
+
+    Returns:
+        An EventIndex
+    """
+    if events is None:
+        events = get_events()
+    # The cached index holds a reference to its source, so the id can't be
+    # reused by another list while the entry is alive.
+    return _event_indexes.get(id(events), lambda: EventIndex(events, local_tz))
+
+_day_views = SnapshotCache()
+
+def get_day_view(index=None):
+    """
+    Get the day/time-slot view model for the current events.
+
+    Built once per event index; pages select their events from it instead
+    of re-running prepare_events_by_day(). Select only events taken from the
+    same index.
+
+    Args:
+        index: EventIndex to build from. Defaults to get_event_index().
+
+    Returns:
+        A DayViewModel over index.events
+    """
+    if index is None:
+        index = get_event_index()
+    # EventIndex compares by identity, and the cache keeps it alive
+    return _day_views.get(index, lambda: DayViewModel(index.events, local_tz))
+
+_event_shards = SnapshotCache()
+
+def get_event_shards(index=None):
+    """
+    Get the serialized per-month and per-category JSON shards.
+
+    Encoded once per event index (and set of categories) and shared by the
+    /events/ routes and the freezer. The current month always has a shard.
+
+    Args:
+        index: EventIndex to build from. Defaults to get_event_index().
+
+    Returns:
+        An EventShards
+    """
+    if index is None:
+        index = get_event_index()
+    categories = get_categories()
+    today = get_event_snapshot().today
+    return _event_shards.get((index, categories),
+                             lambda: EventShards(index, categories, current_month=(today.year, today.month)))
+
+def get_content_time(events=None):
+    """
+    Get the timestamp for output built from some events.
+
+    Used for DTSTAMP, RSS lastBuildDate and sitemap lastmod. With
+    REPRODUCIBLE_BUILD (set by freeze.py) it's the newest change time among the
+    events (see Event.changed_at), or the start of the snapshot's day if none
+    of them records one, so rebuilding identical inputs gives identical
+    bytes. Otherwise it's the current time.
+
+    Args:
+        events: Events the output is built from. Defaults to get_events().
+
+    Returns:
+        Timezone-aware UTC datetime with whole seconds
+    """
+    if not app.config.get('REPRODUCIBLE_BUILD'):
+        return datetime.now(pytz.UTC).replace(microsecond=0)
+
+    if events is None:
+        events = get_events()
+    changed = [e.changed_at for e in (as_event(e, local_tz) for e in events) if e.changed_at]
+    if changed:
+        return max(changed).replace(microsecond=0)
+    midnight = local_tz.localize(datetime.combine(get_event_snapshot().today, time.min))
+    return midnight.astimezone(pytz.UTC)
+
+def get_response_validators(path):
+    """
+    Get the ETag and Last-Modified values for a data-driven response.
+
+    The ETag changes whenever the event snapshot, config.yaml, the category
+    files or the published events.json change, and is different for every
+    URL path. Last-Modified is the newest of those files' modification times,
+    and never earlier than the start of the snapshot's day (past events drop
+    out at midnight even though no file changed).
+
+    Args:
+        path: The request path (includes the route parameters)
+
+    Returns:
+        Tuple of (etag string, timezone-aware UTC datetime)
+    """
+    snapshot = get_event_snapshot()
+    inputs = (
+        file_fingerprint('config.yaml'),
+        tree_fingerprint('_categories'),
+        file_fingerprint(os.path.join('_data', 'events.json')),
+    )
+
+    digest = hashlib.sha1(snapshot.version.encode(), usedforsecurity=False)
+    digest.update(repr(inputs).encode())
+    digest.update(path.encode('utf-8'))
+
+    mtimes = [snapshot.source_mtime or 0]
+    for fingerprint in (inputs[0], inputs[2]):
+        if fingerprint:
+            mtimes.append(fingerprint[0] / 1e9)
+    for entry in inputs[1] or ():
+        mtimes.append(entry[1] / 1e9)
+    midnight = local_tz.localize(datetime.combine(snapshot.today, time.min))
+    mtimes.append(midnight.timestamp())
+
+    # HTTP dates have one-second resolution
+    last_modified = datetime.fromtimestamp(int(max(mtimes)), pytz.UTC)
+    return digest.hexdigest(), last_modified
+
+def conditional_get(view=None, exists=None):
+    """
+    Decorator adding ETag/Last-Modified headers and 304 handling to a route.
+
+    If-None-Match (or, without it, If-Modified-Since) is checked before the
+    view runs, so an unchanged feed is answered without generating it.
+
+    Args:
+        exists: Optional callable taking the route's arguments that returns
+            False when the resource doesn't exist. It runs before the
+            validators are compared, so a missing resource gets the view's
+            404 instead of a 304.
+    """
+    if view is None:
+        return lambda view: conditional_get(view, exists)
+
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        if exists is not None and not exists(*args, **kwargs):
+            return view(*args, **kwargs)
+
+        etag, last_modified = get_response_validators(request.path)
+
+        if request.if_none_match:
+            not_modified = request.if_none_match.contains_weak(etag)
+        else:
+            since = request.if_modified_since
+            not_modified = since is not None and last_modified <= since
+
+        if not_modified:
+            response = Response(status=304)
+        else:
+            response = make_response(view(*args, **kwargs))
+            if response.status_code != 200:
+                return response
+
+        response.set_etag(etag)
+        response.last_modified = last_modified
+        return response
+    return wrapper
+
+def _category_exists(slug, compact=False):
+    return slug in get_categories()
+
+def _region_exists(state):
+    return state.upper() in ['DC', 'VA', 'MD']
+
+def _group_exists(slug):
+    return get_group(slug) is not None
+
+def _week_exists(week_id):
+    return _week_start(week_id) is not None
+
+def _month_shard_exists(year, month, compact=False):
+    return get_event_shards().month(year, month) is not None
+
+_groups_cache = SnapshotCache()
 
 def get_approved_groups():
     """
     Get all groups from _groups/*.yaml files.
 
+    Parsed documents come from the shared content index and the list is
+    rebuilt only when a group file changes. The list is shared, so don't
+    modify it.
+
     Returns:
         A list of group dictionaries
     """
+    tree = get_tree('_groups')
+    return _groups_cache.get(tree, lambda: _build_group_list(tree))
+
+_groups_by_slug = SnapshotCache()
+
+def get_group(slug):
+    """
+    Get an approved group by its slug (the _groups/ file name).
+
+    Returns:
+        The group dictionary, or None if there is no such group
+    """
+    tree = get_tree('_groups')
+    groups = _groups_by_slug.get(tree, lambda: {group['id']: group for group in get_approved_groups()})
+    return groups.get(slug)
+
+def _build_group_list(tree):
     groups = []
-    groups_dir = '_groups'
-    if not os.path.exists(groups_dir):
-        return groups
-        
-    for filename in os.listdir(groups_dir):
-        if filename.endswith('.yaml'):
-            slug = filename[:-5]
-            try:
-                with open(os.path.join(groups_dir, filename), 'r') as f:
-                    group = yaml.safe_load(f)
-                    group['id'] = slug
-                    groups.append(group)
-            except Exception as e:
-                print(f"Error loading group {filename}: {e}")
-                
+    for slug, doc in tree.documents.items():
+        if not isinstance(doc, dict):
+            print(f"Error loading group {slug}.yaml: not a mapping")
+            continue
+        group = dict(doc)
+        group['id'] = slug
+        groups.append(group)
+
     groups.sort(key=lambda x: x.get('name', '').lower())
     return groups
 
@@ -125,27 +378,14 @@ def get_categories():
     """
     Get all categories from _categories/*.yaml files.
 
+    The files are parsed once and re-read only when one of them changes.
+    The returned dict is shared, so don't modify it.
+
     Returns:
         A dict mapping category slugs to category metadata
         Example: {'python': {'name': 'Python', 'description': '...', 'slug': 'python'}, ...}
     """
-    categories = {}
-    categories_dir = '_categories'
-    if not os.path.exists(categories_dir):
-        return categories
-        
-    for filename in os.listdir(categories_dir):
-        if filename.endswith('.yaml'):
-            slug = filename[:-5]
-            try:
-                with open(os.path.join(categories_dir, filename), 'r') as f:
-                    cat = yaml.safe_load(f)
-                    cat['slug'] = slug
-                    categories[slug] = cat
-            except Exception as e:
-                print(f"Error loading category {filename}: {e}")
-                
-    return categories
+    return site_config.get_categories()
 
 def get_upcoming_months():
     """
@@ -159,32 +399,18 @@ def get_upcoming_months():
         - count: Number of events in that month
         - url: URL to the month page
     """
-    events = get_events()
+    index = get_event_index()
     months = {}
-    
-    for event in events:
-        event_date_str = event.get('date')
-        if not event_date_str:
-            continue
-        
-        try:
-            event_date = datetime.strptime(event_date_str, '%Y-%m-%d').date()
-            month_key = (event_date.year, event_date.month)
-            
-            if month_key not in months:
-                month_name = calendar.month_name[event_date.month]
-                months[month_key] = {
-                    'year': event_date.year,
-                    'month': event_date.month,
-                    'name': f"{month_name} {event_date.year}",
-                    'count': 0,
-                    'url': f"/{event_date.year}/{event_date.month}/"
-                }
-            
-            months[month_key]['count'] += 1
-        except ValueError:
-            continue
-    
+
+    for (year, month), month_events in index.by_month.items():
+        months[(year, month)] = {
+            'year': year,
+            'month': month,
+            'name': f"{calendar.month_name[month]} {year}",
+            'count': len(month_events),
+            'url': f"/{year}/{month}/"
+        }
+
     # Return sorted by year and month
     return [months[k] for k in sorted(months.keys())]
 
@@ -200,12 +426,11 @@ def get_categories_with_event_counts():
         - url: URL to the category page
     """
     categories = get_categories()
-    events = get_events()
+    index = get_event_index()
     
     categories_with_counts = []
     for slug, category in categories.items():
-        filtered_events = [e for e in events if slug in e.get('categories', [])]
-        count = len(filtered_events)
+        count = len(index.in_category(slug))
         
         if count > 0:
             categories_with_counts.append({
@@ -225,162 +450,78 @@ def filter_events_to_next_two_weeks(events):
     Filter events to the next 14 days.
     
     Args:
-        events: List of event dictionaries
+        events: List of event dictionaries or Event records
     
     Returns:
-        List of events occurring within the next 14 days
+        List of Event records occurring within the next 14 days
     """
     today = datetime.now(local_tz).date()
     two_weeks_from_now = today + timedelta(days=14)
-    return [
-        e for e in events 
-        if e.get('date') and today <= datetime.strptime(e['date'], '%Y-%m-%d').date() <= two_weeks_from_now
-    ]
+    records = (as_event(e, local_tz) for e in events)
+    return [e for e in records if e.start and today <= e.start <= two_weeks_from_now]
 
 
 def prepare_events_by_day(events, add_week_links=False):
     """
     Organize events by day and time
 
+    Routes use get_day_view() instead, which does this work once for all
+    events; this builds a one-off view for an arbitrary list.
+
     Args:
-        events: List of event dictionaries
+        events: List of event dictionaries or Event records
         add_week_links: Whether to add week page URLs to each day (default False)
 
     Returns:
         List of days with events, each day is a dictionary with date, short_date, and time_slots
     """
-    # Create a dictionary to store events by day
-    events_by_day = {}
+    return DayViewModel(events, local_tz).select(add_week_links=add_week_links)
 
-    # Add events to their respective days
-    for event in events:
-        day_key = event.get('date')
-        if not day_key:
-            continue
+_day_fragments = FragmentCache()
 
-        # Parse the start date and end date if it exists
-        start_date = datetime.strptime(day_key, '%Y-%m-%d').date()
-        end_date = None
-        if 'end_date' in event:
-            try:
-                end_date = datetime.strptime(event['end_date'], '%Y-%m-%d').date()
-            except ValueError:
-                pass
-
-        # Generate list of dates for this event
-        event_dates = []
-        if end_date and end_date > start_date:
-            current_date = start_date
-            while current_date <= end_date:
-                event_dates.append(current_date)
-                current_date += timedelta(days=1)
-        else:
-            event_dates = [start_date]
-
-        # Add event to each day
-        for i, event_date in enumerate(event_dates):
-            day_key = event_date.strftime('%Y-%m-%d')
-            short_date = event_date.strftime('%a %-m/%-d')  # Format as "Mon 5/5"
-
-            if day_key not in events_by_day:
-                week_url = None
-                if add_week_links:
-                    week_id = get_week_identifier(event_date)
-                    week_url = f"/week/{week_id}/#{day_key}"
-
-                events_by_day[day_key] = {
-                    'date': day_key,
-                    'short_date': short_date,
-                    'week_url': week_url,
-                    'time_slots': {}
-                }
-
-            # Determine the time for this specific day
-            time_key = 'All Day'
-            formatted_time = 'All Day'
-            original_time = event.get('time', '')
-            
-            # Check if time is a dictionary (per-day times)
-            if isinstance(original_time, dict):
-                # Use the time for this specific date if available
-                original_time = original_time.get(day_key, '')
-            
-            # Only try to parse time if it exists and is a string
-            if original_time and isinstance(original_time, str):
-                try:
-                    # Handle time parsing - only do this if time is in HH:MM format
-                    if ':' in original_time:
-                        time_obj = datetime.strptime(original_time.strip(), '%H:%M').time()
-                        # For time_key, use the original HH:MM format for consistent sorting
-                        time_key = time_obj.strftime('%H:%M')
-                        # For display, use am/pm format
-                        formatted_time = time_obj.strftime('%-I:%M %p').lower()  # Format as "1:30 pm"
-                except ValueError:
-                    # If time parsing fails, keep All Day
-                    pass
-
-            # Create a copy of the event for this day
-            event_copy = event.copy()
-            # Store the machine-readable time (HH:MM format) for datetime attribute
-            event_copy['time'] = time_key if time_key != 'All Day' else ''
-            # Store the formatted time for display
-            event_copy['formatted_time'] = formatted_time
-
-            # Add display_title with (continuing) for days after the first
-            if i > 0:
-                event_copy['display_title'] = f"{event['title']} (continuing)"
-            else:
-                event_copy['display_title'] = event['title']
-
-            # Create time slot if it doesn't exist
-            if time_key not in events_by_day[day_key]['time_slots']:
-                events_by_day[day_key]['time_slots'][time_key] = []
-
-            events_by_day[day_key]['time_slots'][time_key].append(event_copy)
-
-    # Convert the dictionary to a sorted list of days
-    sorted_days = sorted(events_by_day.keys())
-    days_data = []
-
-    for day in sorted_days:
-        day_data = events_by_day[day]
-        # Sort events within each time slot
-        time_slots = []
-
-        # Custom sort function for time values
-        def time_sort_key(time_str):
-            if time_str == 'All Day':
-                return (-1, 0)  # Put All Day (events without time) at the beginning
-            try:
-                # Parse time in HH:MM format (24-hour)
-                hour, minute = map(int, time_str.split(':'))
-                return (hour, minute)
-            except:
-                return (0, 0)  # Default case
-
-        sorted_times = sorted(day_data['time_slots'].keys(), key=time_sort_key)
-
-        for time in sorted_times:
-            time_slots.append({
-                'time': time,
-                'events': sorted(day_data['time_slots'][time], key=lambda x: x.get('title', ''))
-            })
+def day_fragment_key(day, categories):
+    """
+    Get the fragment-cache key for one rendered day block.
 
-        day_data['time_slots'] = time_slots
-        day_data['has_events'] = bool(time_slots)  # True if there are any time slots with events
-        days_data.append(day_data)
+    The key covers everything partials/day_block.html reads: the day's
+    events, its week link and the names of the categories its events are
+    tagged with.
 
-    return days_data
+    Args:
+        day: Day dictionary from prepare_events_by_day()
+        categories: Category dict from the template context
 
-def prepare_newsletter_titles(days):
-    """Add newsletter-only title labels to prepared day data."""
-    for day in days:
-        for time_slot in day['time_slots']:
-            for event in time_slot['events']:
-                base_title = event.get('display_title', event.get('title', 'Untitled Event'))
-                event['newsletter_title'] = f"Virtual: {base_title}" if is_virtual_event(event) else base_title
+    Returns:
+        A hashable key
+    """
+    category_names = {}
+    for time_slot in day['time_slots']:
+        for event in time_slot['events']:
+            for slug in event.get('categories') or ():
+                if categories and slug in categories:
+                    category_names[slug] = categories[slug].get('name')
+
+    payload = json.dumps([day['time_slots'], category_names], sort_keys=True, default=str)
+    digest = hashlib.sha1(payload.encode('utf-8'), usedforsecurity=False).hexdigest()
+    return (day['date'], day.get('week_url'), digest)
+
+@app.template_global()
+def render_day(day, categories):
+    """
+    Render partials/day_block.html for one day, reusing identical blocks.
+
+    The same day usually appears on the homepage, its week and month pages
+    and several category and location pages; each distinct block is only
+    rendered once per process.
+    """
+    key = day_fragment_key(day, categories)
+    template = app.jinja_env.get_template('partials/day_block.html')
+    html = _day_fragments.get(key, lambda: template.render(day=day, categories=categories))
+    return Markup(html)
 
-    return days
+def get_fragment_cache_stats():
+    """Get hit/miss counters for the rendered day-block cache."""
+    return _day_fragments.stats()
 
 def get_stats():
     """
@@ -400,70 +541,6 @@ def get_stats():
         print(f"Error loading stats: {e}")
         return {}
 
-def filter_events_by_location(events, city=None, state=None):
-    """
-    Filter events by city and/or state.
-
-    Args:
-        events: List of event dictionaries
-        city: City name to filter by (optional)
-        state: State abbreviation to filter by (optional)
-
-    Returns:
-        Filtered list of events
-    """
-    filtered = []
-    for event in events:
-        event_city, event_state = extract_location_info(event.get('location', ''))
-
-        if city and state:
-            if event_city and event_state and event_city.lower() == city.lower() and event_state == state:
-                filtered.append(event)
-        elif state:
-            if event_state == state:
-                filtered.append(event)
-        elif city:
-            if event_city and event_city.lower() == city.lower():
-                filtered.append(event)
-
-    return filtered
-
-def is_virtual_event(event):
-    """
-    Determine if an event is virtual based on its location_type field.
-    
-    Args:
-        event: Event dictionary
-    
-    Returns:
-        True if event is virtual, False otherwise
-    """
-    return event.get('location_type') == 'virtual'
-
-def filter_virtual_events(events):
-    """
-    Filter events to return only virtual events.
-    
-    Args:
-        events: List of event dictionaries
-    
-    Returns:
-        List of virtual events
-    """
-    return [event for event in events if is_virtual_event(event)]
-
-def filter_in_person_events(events):
-    """
-    Filter events to return only in-person events (non-virtual).
-    
-    Args:
-        events: List of event dictionaries
-    
-    Returns:
-        List of in-person events
-    """
-    return [event for event in events if not is_virtual_event(event)]
-
 def get_iso_week_dates(year, week):
     """
     Get the start and end dates for an ISO week.
@@ -514,80 +591,6 @@ def parse_week_identifier(week_id):
     week = int(parts[1])
     return year, week
 
-def filter_events_by_week(events, week_start, week_end):
-    """
-    Filter events that occur within a specific week.
-
-    Args:
-        events: List of event dictionaries
-        week_start: Start date of the week (Monday)
-        week_end: End date of the week (Sunday)
-
-    Returns:
-        Filtered list of events
-    """
-    filtered = []
-    for event in events:
-        event_date_str = event.get('date')
-        if not event_date_str:
-            continue
-
-        try:
-            event_date = datetime.strptime(event_date_str, '%Y-%m-%d').date()
-
-            # Check if event has an end date
-            end_date = event_date
-            if 'end_date' in event:
-                try:
-                    end_date = datetime.strptime(event['end_date'], '%Y-%m-%d').date()
-                except ValueError:
-                    pass
-
-            # Include event if it overlaps with the week
-            if (event_date <= week_end and end_date >= week_start):
-                filtered.append(event)
-        except ValueError:
-            continue
-
-    return filtered
-
-def filter_events_by_month(events, month_start, month_end):
-    """
-    Filter events that occur within a specific month.
-
-    Args:
-        events: List of event dictionaries
-        month_start: First day of the month
-        month_end: Last day of the month
-
-    Returns:
-        Filtered list of events
-    """
-    filtered = []
-    for event in events:
-        event_date_str = event.get('date')
-        if not event_date_str:
-            continue
-
-        try:
-            event_date = datetime.strptime(event_date_str, '%Y-%m-%d').date()
-
-            # Check if event has an end date
-            end_date = event_date
-            if 'end_date' in event:
-                try:
-                    end_date = datetime.strptime(event['end_date'], '%Y-%m-%d').date()
-                except ValueError:
-                    pass
-
-            # Include event if it overlaps with the month
-            if (event_date <= month_end and end_date >= month_start):
-                filtered.append(event)
-        except ValueError:
-            continue
-
-    return filtered
-
 def get_upcoming_weeks(num_weeks=12):
     """
     Get a list of upcoming ISO week identifiers.
@@ -601,32 +604,8 @@ def get_upcoming_weeks(num_weeks=12):
         week_id = get_week_identifier(week_date)
         weeks.add(week_id)
 
-    # Add weeks for all events
-    events = get_events()
-    for event in events:
-        # Get start date
-        event_date_str = event.get('date')
-        if event_date_str:
-            try:
-                event_date = datetime.strptime(event_date_str, '%Y-%m-%d').date()
-                week_id = get_week_identifier(event_date)
-                weeks.add(week_id)
-                
-                # Get end date if it exists (for multi-day events)
-                end_date_str = event.get('end_date')
-                if end_date_str:
-                    try:
-                        end_date = datetime.strptime(end_date_str, '%Y-%m-%d').date()
-                        # Add all weeks between start and end date (inclusive)
-                        current = event_date
-                        while current <= end_date:
-                            week_id = get_week_identifier(current)
-                            weeks.add(week_id)
-                            current += timedelta(days=1)
-                    except (ValueError, TypeError):
-                        pass
-            except (ValueError, TypeError):
-                pass
+    # Add weeks for all events (multi-day events are indexed under every week they span)
+    weeks.update(get_event_index().by_week)
 
     return sorted(list(weeks))
 
@@ -638,13 +617,13 @@ def robots_txt():
 @app.route("/")
 def homepage():
     # Get upcoming events and filter out virtual events
-    all_events = get_events()
-    events = filter_in_person_events(all_events)
+    index = get_event_index()
+    events = index.in_person
     
     # Filter to next two weeks
     two_week_events = filter_events_to_next_two_weeks(events)
     
-    days = prepare_events_by_day(two_week_events, add_week_links=True)
+    days = get_day_view(index).select(two_week_events, add_week_links=True)
 
     # Get base URL from config or use a default
     base_url = config.get('base_url', 'https://dctech.events')
@@ -671,9 +650,9 @@ def homepage():
 def virtual_events_page():
     """Show virtual events"""
     # Get upcoming events and filter to only virtual events
-    all_events = get_events()
-    events = filter_virtual_events(all_events)
-    days = prepare_events_by_day(events, add_week_links=False)
+    index = get_event_index()
+    events = index.virtual
+    days = get_day_view(index).select(events)
 
     # Get base URL from config or use a default
     base_url = config.get('base_url', 'https://dctech.events')
@@ -695,10 +674,10 @@ def week_page(week_id):
     except:
         return "Invalid week identifier", 404
 
-    # Get all events and filter by week
-    events = get_events()
-    week_events = filter_events_by_week(events, week_start, week_end)
-    days = prepare_events_by_day(week_events)
+    # Get events overlapping the week
+    index = get_event_index()
+    week_events = index.in_week(get_week_identifier(week_start))
+    days = get_day_view(index).select(week_events)
 
     # Format week start for display
     week_start_formatted = week_start.strftime('%B %-d, %Y')
@@ -736,10 +715,10 @@ def month_page(year, month):
     except ValueError:
         return "Invalid date", 404
     
-    # Get all events and filter by month
-    events = get_events()
-    month_events = filter_events_by_month(events, first_day, last_day)
-    days = prepare_events_by_day(month_events)
+    # Get events overlapping the month
+    index = get_event_index()
+    month_events = index.in_month(year, month)
+    days = get_day_view(index).select(month_events)
     
     # Get month name
     month_name = calendar.month_name[month]
@@ -775,16 +754,15 @@ def month_page(year, month):
 @app.route("/locations/")
 def locations_index():
     """Show available regions with event counts"""
-    events = get_events()
+    index = get_event_index()
     
     # Count events by region only
     location_stats = {}
     
-    for event in events:
-        city, state = extract_location_info(event.get('location', ''))
+    for state, state_events in index.by_state.items():
         if state in ['DC', 'VA', 'MD']:
             region = get_region_name(state)
-            location_stats[region] = location_stats.get(region, 0) + 1
+            location_stats[region] = location_stats.get(region, 0) + len(state_events)
     
     return render_template('locations_index.html',
                           location_stats=location_stats,
@@ -802,14 +780,15 @@ def approved_groups_list():
 
 @app.route("/newsletter.html")
 def newsletter_html():
-    # Get upcoming events
-    events = get_events()
+    # Get upcoming events (the records the day view was built from)
+    index = get_event_index()
+    events = index.events
     
     # Filter to next two weeks (14 days)
     two_week_events = filter_events_to_next_two_weeks(events)
     
-    days = prepare_events_by_day(two_week_events)
-    prepare_newsletter_titles(days)
+    # Day entries already carry newsletter_title
+    days = get_day_view(index).select(two_week_events)
     
     # Get stats
     stats = get_stats().copy()
@@ -830,14 +809,15 @@ def newsletter_html():
 
 @app.route("/newsletter.txt")
 def newsletter_text():
-    # Get upcoming events
-    events = get_events()
+    # Get upcoming events (the records the day view was built from)
+    index = get_event_index()
+    events = index.events
     
     # Filter to next two weeks (14 days)
     two_week_events = filter_events_to_next_two_weeks(events)
     
-    days = prepare_events_by_day(two_week_events)
-    prepare_newsletter_titles(days)
+    # Day entries already carry newsletter_title
+    days = get_day_view(index).select(two_week_events)
     
     # Get stats
     stats = get_stats().copy()
@@ -864,9 +844,9 @@ def region_page(state):
     if state not in ['DC', 'VA', 'MD']:
         return "Region not found", 404
 
-    events = get_events()
-    filtered_events = filter_events_by_location(events, state=state)
-    days = prepare_events_by_day(filtered_events)
+    index = get_event_index()
+    filtered_events = index.in_state(state)
+    days = get_day_view(index).select(filtered_events)
     
     region_name = get_region_name(state)
     stats = {'upcoming_events': len(filtered_events)}
@@ -881,16 +861,15 @@ def region_page(state):
 def categories_index():
     """Show listing of all categories with event counts"""
     categories = get_categories()
-    events = get_events()
+    index = get_event_index()
     
     categories_with_counts = []
     for slug, category in sorted(categories.items(), key=lambda x: x[1]['name']):
-        filtered_events = [e for e in events if slug in e.get('categories', [])]
         categories_with_counts.append({
             'slug': slug,
             'name': category['name'],
             'description': category.get('description', ''),
-            'count': len(filtered_events)
+            'count': len(index.in_category(slug))
         })
     
     return render_template('categories_index.html', categories=categories_with_counts)
@@ -902,9 +881,9 @@ def category_page(slug):
     if slug not in categories:
         return "Category not found", 404
 
-    events = get_events()
-    filtered_events = [e for e in events if slug in e.get('categories', [])]
-    days = prepare_events_by_day(filtered_events)
+    index = get_event_index()
+    filtered_events = index.in_category(slug)
+    days = get_day_view(index).select(filtered_events)
 
     category = categories[slug]
     stats = {'upcoming_events': len(filtered_events)}
@@ -919,13 +898,12 @@ def category_page(slug):
 def feeds_page():
     """Show a page listing all available RSS and iCal feeds"""
     categories = get_categories()
-    events = get_events()
+    index = get_event_index()
     
     # Get categories with event counts
     categories_with_counts = []
     for slug, category in sorted(categories.items(), key=lambda x: x[1]['name']):
-        filtered_events = [e for e in events if slug in e.get('categories', [])]
-        count = len(filtered_events)
+        count = len(index.in_category(slug))
         if count > 0:
             categories_with_counts.append({
                 'slug': slug,
@@ -939,32 +917,48 @@ def feeds_page():
         {'state': 'md', 'name': 'Maryland'},
         {'state': 'va', 'name': 'Virginia'}
     ]
-    
+
+    # Groups with upcoming events
+    groups_with_counts = []
+    for group in get_approved_groups():
+        count = len(index.in_group(group.get('name')))
+        if count > 0:
+            groups_with_counts.append({'slug': group['id'], 'name': group['name'], 'count': count})
+
+    # Weeks with upcoming events
+    weeks = []
+    for week_id in sorted(index.by_week):
+        week_start, _ = get_iso_week_dates(*parse_week_identifier(week_id))
+        weeks.append({'id': week_id, 'start': week_start.strftime('%B %-d, %Y'),
+                      'count': len(index.in_week(week_id))})
+
     return render_template('feeds.html',
                          categories=categories_with_counts,
-                         locations=locations)
+                         locations=locations,
+                         groups=groups_with_counts,
+                         weeks=weeks)
 
 @app.route("/sitemap.xml")
+@conditional_get
 def sitemap():
     """Generate an XML sitemap of the site's main pages"""
     base_url = config.get('base_url', 'https://dctech.events')
 
-    urls = [
-        {'loc': f"{base_url}/", 'lastmod': datetime.now().strftime('%Y-%m-%d')},
-        {'loc': f"{base_url}/virtual/", 'lastmod': datetime.now().strftime('%Y-%m-%d')},
-        {'loc': f"{base_url}/categories/", 'lastmod': datetime.now().strftime('%Y-%m-%d')},
-        {'loc': f"{base_url}/groups/", 'lastmod': datetime.now().strftime('%Y-%m-%d')},
-        {'loc': f"{base_url}/locations/", 'lastmod': datetime.now().strftime('%Y-%m-%d')},
-        {'loc': f"{base_url}/locations/dc/", 'lastmod': datetime.now().strftime('%Y-%m-%d')},
-        {'loc': f"{base_url}/locations/va/", 'lastmod': datetime.now().strftime('%Y-%m-%d')},
-        {'loc': f"{base_url}/locations/md/", 'lastmod': datetime.now().strftime('%Y-%m-%d')},
-    ]
+    index = get_event_index()
+
+    def lastmod(events):
+        return get_content_time(events).astimezone(local_tz).strftime('%Y-%m-%d')
+
+    site_lastmod = lastmod(index.events)
+    urls = [{'loc': f"{base_url}{path}", 'lastmod': site_lastmod}
+            for path in ('/', '/virtual/', '/categories/', '/groups/', '/locations/',
+                         '/locations/dc/', '/locations/va/', '/locations/md/')]
 
     categories = get_categories()
     for slug in categories.keys():
         urls.append({
             'loc': f"{base_url}/categories/{slug}/",
-            'lastmod': datetime.now().strftime('%Y-%m-%d'),
+            'lastmod': lastmod(index.in_category(slug)),
             'changefreq': 'daily'
         })
 
@@ -972,7 +966,7 @@ def sitemap():
     for week_id in upcoming_weeks:
         urls.append({
             'loc': f"{base_url}/week/{week_id}/",
-            'lastmod': datetime.now().strftime('%Y-%m-%d'),
+            'lastmod': lastmod(index.in_week(week_id)),
             'changefreq': 'daily'
         })
 
@@ -992,6 +986,7 @@ def sitemap():
     return Response('\n'.join(xml), mimetype='application/xml')
 
 @app.route("/events.json")
+@conditional_get
 def events_json():
     """Serve events data as JSON for client-side use"""
     events_json_file = os.path.join('_data', 'events.json')
@@ -999,10 +994,44 @@ def events_json():
         with open(events_json_file, 'r', encoding='utf-8') as f:
             return Response(f.read(), mimetype='application/json')
     # Fallback: return current events if JSON doesn't exist yet
-    events = get_events()
-    return Response(json.dumps(events, indent=2), mimetype='application/json')
+    return Response(get_event_shards().all_events(), mimetype='application/json')
+
+@app.route("/events.ndjson")
+@conditional_get
+def events_ndjson():
+    """Stream the upcoming events as newline-delimited JSON, one event per line in date order"""
+    return Response(iter_ndjson(get_events()), mimetype='application/x-ndjson')
+
+@app.route("/events/index.json")
+@conditional_get
+def event_shards_index():
+    """Serve the manifest of per-month and per-category event shards"""
+    return Response(get_event_shards().index, mimetype='application/json')
+
+@app.route("/events/<int:year>-<int(fixed_digits=2):month>.json")
+@app.route("/events/<int:year>-<int(fixed_digits=2):month>.min.json", endpoint='month_events_json_compact',
+           defaults={'compact': True})
+@conditional_get(exists=_month_shard_exists)
+def month_events_json(year, month, compact=False):
+    """Serve the events overlapping one month as JSON"""
+    body = get_event_shards().month(year, month, compact=compact)
+    if body is None:
+        return "No events in this month", 404
+    return Response(body, mimetype='application/json')
+
+@app.route("/events/categories/<slug>.json")
+@app.route("/events/categories/<slug>.min.json", endpoint='category_events_json_compact',
+           defaults={'compact': True})
+@conditional_get(exists=_category_exists)
+def category_events_json(slug, compact=False):
+    """Serve the events in one category as JSON"""
+    body = get_event_shards().category(slug, compact=compact)
+    if body is None:
+        return "Category not found", 404
+    return Response(body, mimetype='application/json')
 
 @app.route("/categories.json")
+@conditional_get
 def categories_json():
     """Serve categories data as JSON"""
     categories = get_categories()
@@ -1018,6 +1047,7 @@ def categories_json():
     return Response(json.dumps(formatted, indent=2), mimetype='application/json')
 
 @app.route("/events.ics")
+@conditional_get
 def ical_feed():
     """Generate an iCal feed of upcoming events"""
     events = get_events()
@@ -1025,114 +1055,45 @@ def ical_feed():
     tagline = config.get('tagline', 'Technology conferences and meetups in and around Washington, DC')
     return generate_ical_feed(events, site_name, tagline)
 
+_vevent_blocks = FragmentCache(max_entries=8192)
+
 def generate_ical_feed(filtered_events, calendar_name, calendar_description):
     """
     Helper function to generate an iCal feed for a filtered set of events
+
+    The feed is streamed from VEVENT blocks cached by event content (see
+    ics_writer.py), so an event shared by several feeds is serialized once.
     """
     groups = get_approved_groups()
     group_websites = {group.get('name'): group.get('website') for group in groups if group.get('website')}
-    
-    cal = Calendar()
     site_name = config.get('site_name', 'DC Tech Events')
-    cal.add('prodid', f'-//{site_name}//dctech.events//')
-    cal.add('version', '2.0')
-    cal.add('x-wr-calname', calendar_name)
-    cal.add('x-wr-caldesc', calendar_description)
-    
-    for event in filtered_events:
-        event_date_str = event.get('date')
-        if not event_date_str:
-            continue
-        
-        try:
-            event_date = datetime.strptime(event_date_str, '%Y-%m-%d').date()
-        except (ValueError, TypeError):
-            continue
-        
-        event_time_str = event.get('time', '')
-        is_all_day = not (event_time_str and isinstance(event_time_str, str) and ':' in event_time_str)
-        
-        if is_all_day:
-            event_datetime = event_date
-            end_date_str = event.get('end_date')
-            if end_date_str:
-                try:
-                    end_date = datetime.strptime(end_date_str, '%Y-%m-%d').date()
-                    end_datetime = end_date + timedelta(days=1)
-                except (ValueError, TypeError):
-                    end_datetime = event_date + timedelta(days=1)
-            else:
-                end_datetime = event_date + timedelta(days=1)
-        else:
-            try:
-                event_time = datetime.strptime(event_time_str.strip(), '%H:%M').time()
-            except ValueError:
-                event_datetime = event_date
-                end_datetime = event_date + timedelta(days=1)
-                is_all_day = True
-            
-            if not is_all_day:
-                event_datetime_local = datetime.combine(event_date, event_time)
-                event_datetime_local = local_tz.localize(event_datetime_local)
-                event_datetime = event_datetime_local.astimezone(pytz.UTC)
-                
-                end_date_str = event.get('end_date')
-                if end_date_str:
-                    try:
-                        end_date = datetime.strptime(end_date_str, '%Y-%m-%d').date()
-                        end_time = datetime.strptime('23:59', '%H:%M').time()
-                        end_datetime_local = datetime.combine(end_date, end_time)
-                        end_datetime_local = local_tz.localize(end_datetime_local)
-                        end_datetime = end_datetime_local.astimezone(pytz.UTC)
-                    except (ValueError, TypeError):
-                        end_datetime = event_datetime + timedelta(hours=1)
-                else:
-                    end_datetime = event_datetime + timedelta(hours=1)
-        
-        ical_event = ICalEvent()
-        ical_event.add('summary', event.get('title', 'Untitled Event'))
-        ical_event.add('dtstart', event_datetime)
-        ical_event.add('dtend', end_datetime)
-        
-        if event.get('location'):
-            ical_event.add('location', event['location'])
-        
-        description_parts = []
-        if event.get('url'):
-            description_parts.append(f"Event URL: {event['url']}")
-        if event.get('group'):
-            description_parts.append(f"Organized by: {event['group']}")
-        if event.get('cost'):
-            description_parts.append(f"Cost: {event['cost']}")
-        if description_parts:
-            ical_event.add('description', '\n'.join(description_parts))
-        
-        if event.get('url'):
-            ical_event.add('url', event['url'])
-        
-        if event.get('group'):
-            group_name = event['group']
-            group_website = group_websites.get(group_name)
-            if group_website:
-                ical_event.add('organizer', group_website, parameters={'CN': group_name})
-        
-        uid_hash = calculate_event_hash(event_date_str, event_time_str, event.get('title', 'event'), event.get('url'))
-        uid = f"{uid_hash}@dctech.events"
-        ical_event.add('uid', uid)
-        ical_event.add('dtstamp', datetime.now(pytz.UTC))
-        cal.add_component(ical_event)
-    
-    return Response(cal.to_ical(), mimetype='text/calendar')
+    events = [as_event(event, local_tz) for event in filtered_events]
+
+    feed_time = get_content_time(events)
+    if app.config.get('REPRODUCIBLE_BUILD'):
+        def dtstamp(event):
+            return event.changed_at.replace(microsecond=0) if event.changed_at else feed_time
+    else:
+        def dtstamp(event):
+            return feed_time
+
+    stream = write_calendar(events, f'-//{site_name}//dctech.events//', calendar_name, calendar_description,
+                            dtstamp, group_websites, _vevent_blocks)
+    return Response(stream, mimetype='text/calendar')
+
+def get_vevent_cache_stats():
+    """Get hit/miss counters for the cached VEVENT blocks."""
+    return _vevent_blocks.stats()
 
 @app.route("/categories/<slug>/feed.ics")
+@conditional_get(exists=_category_exists)
 def category_ical_feed(slug):
     """Generate an iCal feed for a specific category"""
     categories = get_categories()
     if slug not in categories:
         return "Category not found", 404
     
-    events = get_events()
-    filtered_events = [e for e in events if slug in e.get('categories', [])]
+    filtered_events = get_event_index().in_category(slug)
     
     category = categories[slug]
     site_name = config.get('site_name', 'DC Tech Events')
@@ -1142,14 +1103,14 @@ def category_ical_feed(slug):
     return generate_ical_feed(filtered_events, calendar_name, calendar_description)
 
 @app.route("/locations/<state>/feed.ics")
+@conditional_get(exists=_region_exists)
 def location_ical_feed(state):
     """Generate an iCal feed for a specific location"""
     state = state.upper()
     if state not in ['DC', 'VA', 'MD']:
         return "Region not found", 404
     
-    events = get_events()
-    filtered_events = filter_events_by_location(events, state=state)
+    filtered_events = get_event_index().in_state(state)
     
     region_name = get_region_name(state)
     site_name = config.get('site_name', 'DC Tech Events')
@@ -1158,94 +1119,36 @@ def location_ical_feed(state):
     
     return generate_ical_feed(filtered_events, calendar_name, calendar_description)
 
+_rss_items = FragmentCache(max_entries=8192)
+
 def generate_rss_feed_from_events(events, feed_title, feed_description, feed_link):
     """
     Generate RSS 2.0 feed from a list of events.
+
+    The feed is streamed from <item> blocks cached by event content (see
+    rss_writer.py), so an event shared by several feeds is rendered once.
     """
-    rss = ET.Element('rss', version='2.0')
-    rss.set('xmlns:atom', 'http://www.w3.org/2005/Atom')
-    
-    channel = ET.SubElement(rss, 'channel')
-    ET.SubElement(channel, 'title').text = feed_title
-    ET.SubElement(channel, 'link').text = feed_link
-    ET.SubElement(channel, 'description').text = feed_description
-    ET.SubElement(channel, 'language').text = 'en-us'
-    
-    now_timestamp = datetime.now(pytz.UTC).timestamp()
-    now_rfc822 = formatdate(timeval=now_timestamp, usegmt=True)
-    ET.SubElement(channel, 'lastBuildDate').text = now_rfc822
-    
-    for event in events[:50]:
-        item = ET.SubElement(channel, 'item')
-        
-        title = event.get('title', 'Untitled Event')
-        event_date = event.get('date', '')
-        event_time = event.get('time', '')
-        url = event.get('url', '')
-        
-        if event_date:
-            try:
-                date_obj = datetime.strptime(event_date, '%Y-%m-%d').date()
-                date_str = date_obj.strftime('%B %-d, %Y')
-                full_title = f"{title} ({date_str})"
-            except (ValueError, AttributeError):
-                full_title = title
-        else:
-            full_title = title
-        
-        ET.SubElement(item, 'title').text = full_title
-        link_url = url if url else config.get('base_url', 'https://dctech.events')
-        ET.SubElement(item, 'link').text = link_url
-        
-        desc_parts = []
-        if event_date:
-            try:
-                date_obj = datetime.strptime(event_date, '%Y-%m-%d').date()
-                date_str = date_obj.strftime('%B %-d, %Y')
-                if event_time:
-                    desc_parts.append(f"Event Date: {date_str} at {event_time}")
-                else:
-                    desc_parts.append(f"Event Date: {date_str}")
-            except (ValueError, AttributeError):
-                pass
-        
-        if url:
-            desc_parts.append(f'<a href="{url}">Event Details</a>')
-        
-        description = '<br/>'.join(desc_parts) if desc_parts else title
-        ET.SubElement(item, 'description').text = description
-        
-        guid_text = f"{event_date}-{event_time}-{title}-{url}"
-        guid_hash = hashlib.md5(guid_text.encode('utf-8'), usedforsecurity=False).hexdigest()
-        guid = ET.SubElement(item, 'guid')
-        guid.set('isPermaLink', 'false')
-        guid.text = guid_hash
-        
-        if event_date:
-            try:
-                date_obj = datetime.strptime(event_date, '%Y-%m-%d')
-                local_dt = local_tz.localize(date_obj)
-                pub_timestamp = local_dt.astimezone(pytz.UTC).timestamp()
-                pub_date_rfc822 = formatdate(timeval=pub_timestamp, usegmt=True)
-                ET.SubElement(item, 'pubDate').text = pub_date_rfc822
-            except (ValueError, AttributeError):
-                pass
-    
-    tree = ET.ElementTree(rss)
-    ET.indent(tree, space='  ')
-    output = io.BytesIO()
-    tree.write(output, encoding='utf-8', xml_declaration=True)
-    return Response(output.getvalue(), mimetype='application/rss+xml')
+    events = [as_event(event, local_tz) for event in events[:50]]
+    base_url = config.get('base_url', 'https://dctech.events')
+    items = (_rss_items.get(upcoming_item_key(event, base_url),
+                            lambda: upcoming_item(event, base_url, local_tz))
+             for event in events)
+    stream = write_feed(items, feed_title, feed_link, feed_description, get_content_time(events))
+    return Response(stream, mimetype='application/rss+xml')
+
+def get_rss_item_cache_stats():
+    """Get hit/miss counters for the cached RSS items."""
+    return _rss_items.stats()
 
 @app.route("/categories/<slug>/feed.xml")
+@conditional_get(exists=_category_exists)
 def category_rss_feed(slug):
     """Generate an RSS feed for a specific category"""
     categories = get_categories()
     if slug not in categories:
         return "Category not found", 404
     
-    events = get_events()
-    filtered_events = [e for e in events if slug in e.get('categories', [])]
+    filtered_events = get_event_index().in_category(slug)
     
     category = categories[slug]
     site_name = config.get('site_name', 'DC Tech Events')
@@ -1257,14 +1160,14 @@ def category_rss_feed(slug):
     return generate_rss_feed_from_events(filtered_events, feed_title, feed_description, feed_link)
 
 @app.route("/locations/<state>/feed.xml")
+@conditional_get(exists=_region_exists)
 def location_rss_feed(state):
     """Generate an RSS feed for a specific location"""
     state = state.upper()
     if state not in ['DC', 'VA', 'MD']:
         return "Region not found", 404
     
-    events = get_events()
-    filtered_events = filter_events_by_location(events, state=state)
+    filtered_events = get_event_index().in_state(state)
     
     region_name = get_region_name(state)
     site_name = config.get('site_name', 'DC Tech Events')
@@ -1275,6 +1178,87 @@ def location_rss_feed(state):
     
     return generate_rss_feed_from_events(filtered_events, feed_title, feed_description, feed_link)
 
+@app.route("/groups/<slug>/feed.ics")
+@conditional_get(exists=_group_exists)
+def group_ical_feed(slug):
+    """Generate an iCal feed for a single group"""
+    group = get_group(slug)
+    if group is None:
+        return "Group not found", 404
+
+    filtered_events = get_event_index().in_group(group.get('name'))
+
+    site_name = config.get('site_name', 'DC Tech Events')
+    calendar_name = f"{group.get('name', slug)} - {site_name}"
+    calendar_description = f"Upcoming events from {group.get('name', slug)}"
+
+    return generate_ical_feed(filtered_events, calendar_name, calendar_description)
+
+@app.route("/groups/<slug>/feed.xml")
+@conditional_get(exists=_group_exists)
+def group_rss_feed(slug):
+    """Generate an RSS feed for a single group"""
+    group = get_group(slug)
+    if group is None:
+        return "Group not found", 404
+
+    filtered_events = get_event_index().in_group(group.get('name'))
+
+    site_name = config.get('site_name', 'DC Tech Events')
+    base_url = config.get('base_url', 'https://dctech.events')
+    feed_title = f"{group.get('name', slug)} - {site_name}"
+    feed_description = f"Upcoming events from {group.get('name', slug)}"
+    feed_link = group.get('website') or f"{base_url}/groups/"
+
+    return generate_rss_feed_from_events(filtered_events, feed_title, feed_description, feed_link)
+
+def _week_start(week_id):
+    """Get the first day of an ISO week, or None if week_id isn't a valid week."""
+    try:
+        week_start, _ = get_iso_week_dates(*parse_week_identifier(week_id))
+    except (ValueError, IndexError, OverflowError):
+        return None
+    return week_start
+
+def _week_feed_events(week_id):
+    """Get a week's start date and events, or None if week_id isn't a valid week."""
+    week_start = _week_start(week_id)
+    if week_start is None:
+        return None
+    return week_start, get_event_index().in_week(get_week_identifier(week_start))
+
+@app.route("/week/<week_id>/feed.ics")
+@conditional_get(exists=_week_exists)
+def week_ical_feed(week_id):
+    """Generate an iCal feed for the events in one ISO week"""
+    week = _week_feed_events(week_id)
+    if week is None:
+        return "Invalid week identifier", 404
+    week_start, filtered_events = week
+
+    site_name = config.get('site_name', 'DC Tech Events')
+    calendar_name = f"Week of {week_start.strftime('%B %-d, %Y')} - {site_name}"
+    calendar_description = f"Technology events in and around Washington, DC, week of {week_start.strftime('%B %-d, %Y')}"
+
+    return generate_ical_feed(filtered_events, calendar_name, calendar_description)
+
+@app.route("/week/<week_id>/feed.xml")
+@conditional_get(exists=_week_exists)
+def week_rss_feed(week_id):
+    """Generate an RSS feed for the events in one ISO week"""
+    week = _week_feed_events(week_id)
+    if week is None:
+        return "Invalid week identifier", 404
+    week_start, filtered_events = week
+
+    site_name = config.get('site_name', 'DC Tech Events')
+    base_url = config.get('base_url', 'https://dctech.events')
+    feed_title = f"Week of {week_start.strftime('%B %-d, %Y')} - {site_name}"
+    feed_description = f"Technology events in and around Washington, DC, week of {week_start.strftime('%B %-d, %Y')}"
+    feed_link = f"{base_url}/week/{week_id}/"
+
+    return generate_rss_feed_from_events(filtered_events, feed_title, feed_description, feed_link)
+
 @app.route('/404.html')
 def not_found_page():
     """Serve the 404 error page"""
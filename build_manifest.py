@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Per-URL input digests for incremental freezes.
+
+Each frozen URL is recorded with a digest of everything its output depends
+on: the events it shows, the templates and rendering code, config.yaml,
+the categories, groups, sponsors and stats, and the current date. The next freeze
+compares digests and skips URLs whose inputs are unchanged, leaving their
+files (and mtimes) alone so the S3 sync only uploads real changes.
+
+Digests are built from file contents, not mtimes, so a fresh checkout of
+the same commit with the same data still matches.
+"""
+import hashlib
+import json
+import os
+import sys
+
+from content_index import get_tree
+
+MANIFEST_FILE = os.path.join('_cache', 'build_manifest.json')
+MANIFEST_FORMAT = 1
+
+TEMPLATES_DIR = 'templates'
+# Directory of the site's own modules
+PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+CONFIG_FILES = ('config.yaml', os.path.join('_data', 'sponsors.json'), os.path.join('_data', 'events.json'),
+                os.path.join('_data', 'stats.yaml'))
+
+
+def _hash_file(digest, path, name=None):
+    digest.update((name or path).encode('utf-8'))
+    try:
+        with open(path, 'rb') as f:
+            digest.update(hashlib.sha256(f.read()).digest())
+    except OSError:
+        digest.update(b'-')
+
+
+def render_modules():
+    """
+    Get the site's own modules loaded in this process.
+
+    Every page is rendered by code imported from app.py, so hashing the
+    local modules that are loaded covers new rendering modules without
+    having to list them.
+
+    Returns:
+        Sorted list of module paths, relative to the project directory
+    """
+    paths = set()
+    for module in list(sys.modules.values()):
+        path = getattr(module, '__file__', None)
+        if not path or not path.endswith('.py'):
+            continue
+        relative = os.path.relpath(os.path.abspath(path), PROJECT_DIR)
+        if not relative.startswith((os.pardir, 'test_')) and os.sep not in relative:
+            paths.add(relative)
+    return sorted(paths)
+
+
+def _hash_documents(digest, directory):
+    documents = get_tree(directory).documents
+    digest.update(json.dumps(documents, sort_keys=True, default=str).encode('utf-8'))
+
+
+def shared_inputs_digest(snapshot):
+    """
+    Get a digest of the inputs every page depends on.
+
+    Args:
+        snapshot: The EventSnapshot being frozen (its date matters to every
+            page, since past events drop out at midnight)
+
+    Returns:
+        Hex digest string
+    """
+    digest = hashlib.sha256()
+    digest.update(str(snapshot.today).encode())
+
+    template_paths = []
+    for root, _, files in os.walk(TEMPLATES_DIR):
+        template_paths.extend(os.path.join(root, name) for name in files)
+    for path in sorted(template_paths):
+        _hash_file(digest, path)
+
+    for name in render_modules():
+        _hash_file(digest, os.path.join(PROJECT_DIR, name), name)
+    for path in CONFIG_FILES:
+        _hash_file(digest, path)
+
+    _hash_documents(digest, '_categories')
+    _hash_documents(digest, '_groups')
+    return digest.hexdigest()
+
+
+def events_digest(events):
+    """
+    Get a digest of a list of events.
+
+    Args:
+        events: Event dictionaries or Event records
+
+    Returns:
+        Hex digest string
+    """
+    payload = [dict(event) for event in events]
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+
+class BuildManifest:
+    """
+    URL -> input digest map from the previous freeze.
+
+    Attributes:
+        path: Where the manifest is stored
+        pages: Dict of URL -> digest recorded by the last build
+        built_for: ISO date the last build rendered the events for, or None
+    """
+
+    def __init__(self, path=MANIFEST_FILE):
+        self.path = path
+        self.pages = {}
+        self.built_for = None
+
+    @classmethod
+    def load(cls, path=MANIFEST_FILE):
+        """
+        Load the manifest, or start an empty one if it's missing or outdated.
+
+        Args:
+            path: Manifest file path
+
+        Returns:
+            A BuildManifest
+        """
+        manifest = cls(path)
+        try:
+            with open(path, 'r') as f:
+                stored = json.load(f)
+            if stored.get('format') == MANIFEST_FORMAT:
+                manifest.pages = dict(stored.get('pages', {}))
+                manifest.built_for = stored.get('built_for')
+        except (OSError, ValueError):
+            pass
+        return manifest
+
+    def is_current(self, url, digest):
+        """Check whether url was last built from the same inputs."""
+        return digest is not None and self.pages.get(url) == digest
+
+    def record(self, url, digest):
+        """Remember the inputs url was just built from (None forgets it)."""
+        if digest is None:
+            self.pages.pop(url, None)
+        else:
+            self.pages[url] = digest
+
+    def prune(self, urls):
+        """Forget every URL that isn't in urls."""
+        keep = set(urls)
+        self.pages = {url: digest for url, digest in self.pages.items() if url in keep}
+
+    def save(self):
+        """Write the manifest atomically."""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump({'format': MANIFEST_FORMAT, 'built_for': self.built_for, 'pages': self.pages},
+                      f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Timing and memory report for the refresh, pipeline and freeze commands.
+
+Run any of them with --profile:
+
+    python refresh_calendars.py --profile
+    python generate_month_data.py --profile
+    python freeze.py --profile
+
+Each stage records wall time, CPU time, the tracemalloc peak (Python
+allocations) and the process's max RSS. The freeze also records every URL's
+render time, split into template rendering and data preparation, and its
+output size. Reports go to _cache/profile/<command>.json with a cProfile dump
+in <command>.pstats (open with `python -m pstats`). Profiling slows the build
+down; in a parallel freeze only the parent process is cProfiled.
+"""
+import cProfile
+import json
+import os
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+PROFILE_DIR = os.path.join('_cache', 'profile')
+
+
+def _max_rss_bytes():
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return rss if sys.platform == 'darwin' else rss * 1024
+
+
+def take_profile_flag(argv=None):
+    """
+    Remove --profile from the command line.
+
+    The refresh and pipeline wrappers hand the rest of argv to calgen,
+    which doesn't know the flag.
+
+    Returns:
+        True if --profile was present
+    """
+    argv = sys.argv if argv is None else argv
+    if '--profile' in argv:
+        argv.remove('--profile')
+        return True
+    return False
+
+
+class BuildProfiler:
+    """
+    Collects per-stage and per-route timings for one command.
+
+    A disabled profiler's stage() does nothing, so callers can use it
+    unconditionally.
+
+    Attributes:
+        name: Command name, used for the report file names
+        enabled: Whether anything is recorded
+        stages: List of stage records
+        routes: List of route records (freeze only)
+    """
+
+    def __init__(self, name, enabled=True, directory=PROFILE_DIR):
+        self.name = name
+        self.enabled = enabled
+        self.directory = directory
+        self.stages = []
+        self.routes = []
+        self._profile = cProfile.Profile() if enabled else None
+
+    def start(self):
+        """Start tracemalloc and cProfile."""
+        if not self.enabled:
+            return
+        tracemalloc.start()
+        self._profile.enable()
+
+    @contextmanager
+    def stage(self, name):
+        """Context manager that records one stage."""
+        if not self.enabled:
+            yield
+            return
+
+        tracemalloc.reset_peak()
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            yield
+        finally:
+            _, peak = tracemalloc.get_traced_memory()
+            self.stages.append({
+                'stage': name,
+                'wall_seconds': time.perf_counter() - wall_start,
+                'cpu_seconds': time.process_time() - cpu_start,
+                'peak_traced_bytes': peak,
+                'max_rss_bytes': _max_rss_bytes(),
+            })
+
+    def record_route(self, url, seconds, template_seconds, output_bytes, skipped=False):
+        """
+        Record one frozen URL.
+
+        Args:
+            url: URL path
+            seconds: Time from request to written file
+            template_seconds: Part of that spent rendering templates
+            output_bytes: Size of the written file
+            skipped: True if the URL was skipped as unchanged
+        """
+        if not self.enabled:
+            return
+        self.routes.append({
+            'url': url,
+            'seconds': seconds,
+            'template_seconds': template_seconds,
+            'data_seconds': max(0.0, seconds - template_seconds),
+            'bytes': output_bytes,
+            'skipped': skipped,
+        })
+
+    def finish(self, top=15):
+        """
+        Stop profiling, write the JSON report and pstats dump, and print a summary.
+
+        Args:
+            top: Number of slowest URLs to print
+
+        Returns:
+            Path of the JSON report, or None if profiling is disabled
+        """
+        if not self.enabled:
+            return None
+
+        self._profile.disable()
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+        os.makedirs(self.directory, exist_ok=True)
+        report_path = os.path.join(self.directory, f"{self.name}.json")
+        pstats_path = os.path.join(self.directory, f"{self.name}.pstats")
+        self._profile.dump_stats(pstats_path)
+
+        routes = sorted(self.routes, key=lambda r: r['seconds'], reverse=True)
+        report = {
+            'command': self.name,
+            'stages': self.stages,
+            'routes': routes,
+            'totals': {
+                'routes': len(routes),
+                'route_seconds': sum(r['seconds'] for r in routes),
+                'template_seconds': sum(r['template_seconds'] for r in routes),
+                'output_bytes': sum(r['bytes'] for r in routes),
+            },
+            'pstats': pstats_path,
+        }
+        with open(report_path, 'w') as f:
+            json.dump(report, f, indent=2)
+
+        print(f"\nProfile: {self.name}")
+        print(f"{'stage':<24} {'wall s':>9} {'cpu s':>9} {'peak MB':>9} {'rss MB':>9}")
+        for stage in self.stages:
+            rss = stage['max_rss_bytes']
+            print(f"{stage['stage']:<24} {stage['wall_seconds']:>9.3f} {stage['cpu_seconds']:>9.3f} "
+                  f"{stage['peak_traced_bytes'] / 1e6:>9.1f} {(rss or 0) / 1e6:>9.1f}")
+
+        rendered = [r for r in routes if not r['skipped']]
+        if rendered:
+            print(f"\nSlowest {min(top, len(rendered))} of {len(rendered)} frozen URLs")
+            print(f"{'url':<48} {'total ms':>9} {'tmpl ms':>9} {'data ms':>9} {'KB':>8}")
+            for route in rendered[:top]:
+                print(f"{route['url'][:48]:<48} {route['seconds'] * 1000:>9.1f} "
+                      f"{route['template_seconds'] * 1000:>9.1f} {route['data_seconds'] * 1000:>9.1f} "
+                      f"{route['bytes'] / 1024:>8.1f}")
+
+        print(f"\nReport: {report_path}\ncProfile: {pstats_path}")
+        return report_path
@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+Shared, persisted index of the YAML content trees.
+
+_groups/, _categories/, _single_events/, _recurring_events/ and _overlay/
+are read by the Flask app, the migrations and the build. This module parses
+each file once with the C YAML loader (when available), keeps the parsed
+documents in memory, and can store them in _cache/content_index.pickle keyed
+by content hash. On the next run an unchanged file is recognized by its
+stat() alone; a touched-but-identical file by its hash. Only new content is
+parsed.
+
+Reading never writes the file; build and CLI entry points (freeze.py, this
+module's CLI) call save_index() when they finish.
+
+Usage:
+    python content_index.py   # refresh the index and print counters
+"""
+import hashlib
+import os
+import pickle  # nosec B403 - only loads our own cache file
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import yaml
+
+from data_cache import tree_fingerprint
+
+CONTENT_TREES = ('_groups', '_categories', '_single_events', '_recurring_events', '_overlay')
+INDEX_FILE = os.path.join('_cache', 'content_index.pickle')
+INDEX_FORMAT = 1
+
+YamlLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+_lock = threading.RLock()
+_files = None    # abs path -> ((mtime_ns, size, inode), sha256)
+_docs = None     # sha256 -> parsed document (None if it failed to parse)
+_trees = {}      # abs directory -> ContentTree
+_dirty = False
+_counters = {'stat_hits': 0, 'hash_hits': 0, 'parsed': 0}
+
+
+class ContentTree:
+    """
+    Read-only view of one parsed content directory.
+
+    Attributes:
+        directory: Absolute path of the directory
+        fingerprint: tree_fingerprint() the view was built from
+        documents: Dict of file stem -> parsed document, in filename order.
+            Files that failed to parse are left out.
+
+    The documents are shared by every consumer; copy one before changing it.
+    """
+
+    __slots__ = ('directory', 'fingerprint', 'documents')
+
+    def __init__(self, directory, fingerprint, documents):
+        self.directory = directory
+        self.fingerprint = fingerprint
+        self.documents = documents
+
+    def __repr__(self):
+        return f"<ContentTree {self.directory} files={len(self.documents)}>"
+
+
+def _load_index():
+    """Read the persisted index the first time it's needed."""
+    global _files, _docs
+    if _files is not None:
+        return
+    _files, _docs = {}, {}
+    try:
+        with open(INDEX_FILE, 'rb') as f:
+            stored = pickle.load(f)  # nosec B301 - written by save_index()
+        if stored.get('format') == INDEX_FORMAT and stored.get('loader') == YamlLoader.__name__:
+            _files = stored['files']
+            _docs = stored['docs']
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, KeyError, TypeError):
+        pass
+
+
+def save_index():
+    """
+    Write the index to _cache/content_index.pickle if anything changed.
+
+    Returns:
+        True if the file was written, False if there was nothing to save
+    """
+    global _dirty
+    with _lock:
+        if not _dirty:
+            return False
+        # Only keep documents that some file still points at
+        live = {sha for _, sha in _files.values()}
+        payload = {
+            'format': INDEX_FORMAT,
+            'loader': YamlLoader.__name__,
+            'files': _files,
+            'docs': {sha: doc for sha, doc in _docs.items() if sha in live},
+        }
+        directory = os.path.dirname(INDEX_FILE) or '.'
+        tmp_path = None
+        try:
+            os.makedirs(directory, exist_ok=True)
+            # A temp file per process, so parallel builds don't share one
+            fd, tmp_path = tempfile.mkstemp(prefix='.content_index.', suffix='.tmp', dir=directory)
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, INDEX_FILE)
+        except OSError as e:
+            print(f"Error saving content index: {e}")
+            if tmp_path and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return False
+        _dirty = False
+        return True
+
+
+def _read_and_hash(path):
+    try:
+        with open(path, 'rb') as f:
+            data = f.read()
+    except OSError as e:
+        print(f"Error reading {path}: {e}")
+        data = b''
+    return data, hashlib.sha256(data).hexdigest()
+
+
+def _parse(path, data):
+    try:
+        return yaml.load(data, Loader=YamlLoader)  # nosec B506 - safe loader
+    except yaml.YAMLError as e:
+        print(f"Error loading {os.path.basename(path)}: {e}")
+        return None
+
+
+def _refresh(directory, fingerprint):
+    """Bring the index up to date for one directory and build its view."""
+    global _dirty
+    _load_index()
+
+    documents = {}
+    pending = []
+    for name, mtime_ns, size, inode in fingerprint or ():
+        path = os.path.join(directory, name)
+        stat = (mtime_ns, size, inode)
+        known = _files.get(path)
+        if known and known[0] == stat and known[1] in _docs:
+            _counters['stat_hits'] += 1
+        else:
+            pending.append((name, path, stat))
+
+    if pending:
+        workers = min(8, len(pending))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(lambda item: _read_and_hash(item[1]), pending))
+
+        to_parse = []
+        for (name, path, stat), (data, sha) in zip(pending, results):
+            _files[path] = (stat, sha)
+            if sha in _docs:
+                _counters['hash_hits'] += 1
+            else:
+                to_parse.append((path, data, sha))
+        _dirty = True
+
+        if to_parse:
+            with ThreadPoolExecutor(max_workers=min(8, len(to_parse))) as pool:
+                parsed = list(pool.map(lambda item: _parse(item[0], item[1]), to_parse))
+            for (path, _, sha), doc in zip(to_parse, parsed):
+                _docs[sha] = doc
+                _counters['parsed'] += 1
+
+    # Forget files that were deleted from this directory
+    present = {os.path.join(directory, entry[0]) for entry in fingerprint or ()}
+    prefix = directory + os.sep
+    for path in [p for p in _files if p.startswith(prefix) and p not in present]:
+        del _files[path]
+        _dirty = True
+
+    for name, *_ in fingerprint or ():
+        doc = _docs[_files[os.path.join(directory, name)][1]]
+        if doc is not None:
+            documents[name[:-5]] = doc
+
+    return ContentTree(directory, fingerprint, documents)
+
+
+def get_tree(directory):
+    """
+    Get the parsed documents of a content directory.
+
+    Only stat() is called when nothing changed since the last call; the
+    same ContentTree object is returned until a file is added, removed or
+    modified. Changes stay in memory until save_index() is called.
+
+    Args:
+        directory: Directory of *.yaml files (e.g. '_groups')
+
+    Returns:
+        A ContentTree
+    """
+    directory = os.path.abspath(directory)
+    fingerprint = tree_fingerprint(directory)
+    with _lock:
+        tree = _trees.get(directory)
+        if tree is not None and tree.fingerprint == fingerprint:
+            return tree
+        tree = _refresh(directory, fingerprint)
+        _trees[directory] = tree
+        return tree
+
+
+def load_documents(directory):
+    """
+    Get (stem, document) pairs for a content directory, safe to modify.
+
+    Each document is a shallow copy, so adding or replacing top-level keys
+    doesn't affect other consumers.
+
+    Args:
+        directory: Directory of *.yaml files
+
+    Returns:
+        List of (file stem, document dict) sorted by filename; documents that
+        aren't mappings are skipped
+    """
+    tree = get_tree(directory)
+    return [(stem, dict(doc)) for stem, doc in tree.documents.items() if isinstance(doc, dict)]
+
+
+def clear():
+    """Forget the in-memory index; the next get_tree() reloads it from disk."""
+    global _files, _docs, _dirty
+    with _lock:
+        _files = None
+        _docs = None
+        _trees.clear()
+        _dirty = False
+
+
+def stats():
+    """Get counters: files matched by stat, matched by hash, and parsed."""
+    with _lock:
+        return dict(_counters)
+
+
+if __name__ == '__main__':
+    for tree_dir in CONTENT_TREES:
+        tree = get_tree(tree_dir)
+        print(f"{tree_dir}: {len(tree.documents)} documents")
+    save_index()
+    counters = stats()
+    print(f"{counters['stat_hits']} unchanged, {counters['hash_hits']} matched by hash, "
+          f"{counters['parsed']} parsed")
@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+Process-wide caches for data files that are expensive to load.
+
+A freeze renders hundreds of URLs in one process, and every route used to
+re-read _data/all_events.json and the YAML trees from scratch. The helpers
+here keep a single parsed copy in memory and only rebuild it when the
+fingerprint of the underlying files changes.
+"""
+import os
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+
+# Fingerprints computed inside pinned_fingerprints(), by (kind, path)
+_pinned = None
+
+
+@contextmanager
+def pinned_fingerprints():
+    """
+    Context manager that computes each file and tree fingerprint only once.
+
+    Every cached loader re-checks its fingerprint on each call, which for a
+    tree like _groups/ means a stat() per file several times per request.
+    A batch job that doesn't change its inputs while it runs (the freeze)
+    can pin them: inside the block the first fingerprint of each path is
+    reused. Don't use it in the long-running dev server.
+    """
+    global _pinned
+    outer = _pinned
+    if outer is None:
+        _pinned = {}
+    try:
+        yield
+    finally:
+        _pinned = outer
+
+
+def _pinned_or(kind, path, compute):
+    if _pinned is None:
+        return compute()
+    key = (kind, path)
+    if key not in _pinned:
+        _pinned[key] = compute()
+    return _pinned[key]
+
+
+def file_fingerprint(path):
+    """
+    Get a cheap change-detection fingerprint for a file.
+
+    Args:
+        path: Path to the file
+
+    Returns:
+        Tuple of (mtime_ns, size, inode), or None if the file doesn't exist
+    """
+    return _pinned_or('file', path, lambda: _stat_fingerprint(path))
+
+
+def _stat_fingerprint(path):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def tree_fingerprint(directory, suffix='.yaml'):
+    """
+    Get a change-detection fingerprint for every matching file in a directory.
+
+    Adding, removing, replacing or editing any file changes the result.
+    Only stat() is called; file contents are never read.
+
+    Args:
+        directory: Directory to scan (not recursive)
+        suffix: Only consider files ending with this suffix
+
+    Returns:
+        Sorted tuple of (filename, mtime_ns, size, inode), or None if the
+        directory doesn't exist
+    """
+    return _pinned_or(('tree', suffix), directory, lambda: _scan_fingerprint(directory, suffix))
+
+
+def _scan_fingerprint(directory, suffix):
+    try:
+        entries = os.scandir(directory)
+    except OSError:
+        return None
+
+    fingerprint = []
+    with entries:
+        for entry in entries:
+            if not entry.name.endswith(suffix):
+                continue
+            try:
+                st = entry.stat()
+            except OSError:
+                continue
+            fingerprint.append((entry.name, st.st_mtime_ns, st.st_size, st.st_ino))
+    fingerprint.sort()
+    return tuple(fingerprint)
+
+
+class EventSnapshot:
+    """
+    Immutable view of the upcoming events loaded from all_events.json.
+
+    Attributes:
+        events: Tuple of visible events (hidden and duplicates removed)
+        all_events: Tuple of all upcoming events, including hidden ones
+        today: The local date the past-event cutoff was computed for
+        version: Hex digest identifying the snapshot's content
+        source_mtime: Modification time (epoch seconds) of all_events.json,
+            or None if the file doesn't exist
+
+    The event dictionaries are shared by every caller; copy one before
+    modifying it (prepare_events_by_day already does).
+    """
+
+    __slots__ = ('events', 'all_events', 'today', 'version', 'source_mtime')
+
+    def __init__(self, events, all_events, today, version, source_mtime=None):
+        object.__setattr__(self, 'events', tuple(events))
+        object.__setattr__(self, 'all_events', tuple(all_events))
+        object.__setattr__(self, 'today', today)
+        object.__setattr__(self, 'version', version)
+        object.__setattr__(self, 'source_mtime', source_mtime)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __repr__(self):
+        return f"<EventSnapshot {self.version[:12]} events={len(self.events)} today={self.today}>"
+
+
+class SnapshotCache:
+    """
+    Holds the most recently built value for a fingerprint key.
+
+    get() returns the cached value while the key is unchanged and calls the
+    builder otherwise. Hit and miss counters show how much work was saved.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._key = None
+        self._value = None
+        self._loaded = False
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, build):
+        """
+        Get the cached value for key, building it if the key changed.
+
+        Args:
+            key: Hashable fingerprint of the inputs
+            build: Zero-argument callable that produces the value
+
+        Returns:
+            The cached or freshly built value
+        """
+        with self._lock:
+            if self._loaded and self._key == key:
+                self.hits += 1
+                return self._value
+
+            self.misses += 1
+            value = build()
+            self._key = key
+            self._value = value
+            self._loaded = True
+            return value
+
+    def clear(self):
+        """Drop the cached value so the next get() rebuilds it."""
+        with self._lock:
+            self._key = None
+            self._value = None
+            self._loaded = False
+
+    def stats(self):
+        """
+        Get cache counters.
+
+        Returns:
+            Dictionary with hits, misses and hit_rate (0.0 - 1.0)
+        """
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': (self.hits / total) if total else 0.0,
+        }
+
+
+class FragmentCache:
+    """
+    Bounded cache of rendered template fragments, least recently used first out.
+
+    Unlike SnapshotCache it holds many entries at once: one per distinct
+    key, so a fragment shared by several pages is rendered once.
+    """
+
+    def __init__(self, max_entries=4096):
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, render):
+        """
+        Get the fragment for key, rendering and storing it on a miss.
+
+        Args:
+            key: Hashable description of everything the fragment depends on
+            render: Zero-argument callable that produces the fragment
+
+        Returns:
+            The cached or freshly rendered fragment
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+
+        # Render outside the lock; two threads may render the same key, which
+        # only costs time
+        value = render()
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return value
+
+    def clear(self):
+        """Drop every cached fragment."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        """
+        Get cache counters.
+
+        Returns:
+            Dictionary with hits, misses, hit_rate (0.0 - 1.0) and entries
+        """
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': (self.hits / total) if total else 0.0,
+                'entries': len(self._entries),
+            }
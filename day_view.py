@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Events grouped by day and time slot, built once per event snapshot.
+
+Every page that lists events (homepage, week, month, category, location,
+virtual, newsletter) shows the same day/time-slot structure for a different
+subset of events. DayViewModel copies and formats each event once per day it
+covers, sorts every day's slots once, and then answers each page by picking
+that page's events out of the precomputed days.
+"""
+from event_index import week_identifier
+from event_utils import as_event
+
+
+def _time_sort_key(time_key):
+    if time_key == 'All Day':
+        return (-1, 0)  # All-day events come first
+    hour, minute = map(int, time_key.split(':'))
+    return (hour, minute)
+
+
+class DayViewModel:
+    """
+    Precomputed day/time-slot structure for a list of events.
+
+    Attributes:
+        events: The Event records the view was built from, in source order
+
+    The per-day event dictionaries are shared by every page; treat them as
+    read-only.
+    """
+
+    __slots__ = ('events', '_days')
+
+    def __init__(self, events, tz):
+        self.events = [as_event(e, tz) for e in events]
+
+        slots_by_day = {}
+        for event in self.events:
+            if event.start is None:
+                continue
+
+            # event.times maps each day of the event to its start time (None = all day)
+            for i, (event_date, event_time) in enumerate(event.times.items()):
+                if event_time is None:
+                    time_key = 'All Day'
+                    formatted_time = 'All Day'
+                else:
+                    # HH:MM sorts correctly; display uses am/pm, e.g. "1:30 pm"
+                    time_key = event_time.strftime('%H:%M')
+                    formatted_time = event_time.strftime('%-I:%M %p').lower()
+
+                entry = event.copy()
+                # Machine-readable time (HH:MM) for the datetime attribute
+                entry['time'] = time_key if time_key != 'All Day' else ''
+                entry['formatted_time'] = formatted_time
+                # Days after the first are marked (continuing)
+                entry['display_title'] = f"{event['title']} (continuing)" if i > 0 else event['title']
+                entry['newsletter_title'] = (f"Virtual: {entry['display_title']}" if event.is_virtual
+                                             else entry['display_title'])
+
+                day_slots = slots_by_day.setdefault(event_date, {})
+                day_slots.setdefault(time_key, []).append((id(event), entry))
+
+        self._days = {}
+        for event_date, day_slots in slots_by_day.items():
+            day_key = event_date.strftime('%Y-%m-%d')
+            ordered = [
+                (time_key, sorted(day_slots[time_key], key=lambda item: item[1].get('title', '')))
+                for time_key in sorted(day_slots, key=_time_sort_key)
+            ]
+            self._days[event_date] = (
+                day_key,
+                event_date.strftime('%a %-m/%-d'),  # e.g. "Mon 5/5"
+                f"/week/{week_identifier(event_date)}/#{day_key}",
+                ordered,
+            )
+
+    def select(self, events=None, add_week_links=False):
+        """
+        Get the day structure for some of the view's events.
+
+        Args:
+            events: Event records taken from this view's events (e.g. an
+                EventIndex bucket over the same records), or None for all
+            add_week_links: Whether to add week page URLs to each day
+
+        Returns:
+            List of day dictionaries (date, short_date, week_url, time_slots,
+            has_events) in date order, covering every day of each event
+        """
+        if events is None:
+            wanted = None
+            dates = sorted(self._days)
+        else:
+            wanted = {id(event) for event in events}
+            dates = sorted({day for event in events for day in event.times})
+
+        days = []
+        for event_date in dates:
+            day_key, short_date, week_url, slots = self._days[event_date]
+            time_slots = []
+            for time_key, items in slots:
+                chosen = [entry for event_id, entry in items if wanted is None or event_id in wanted]
+                if chosen:
+                    time_slots.append({'time': time_key, 'events': chosen})
+            days.append({
+                'date': day_key,
+                'short_date': short_date,
+                'week_url': week_url if add_week_links else None,
+                'time_slots': time_slots,
+                'has_events': bool(time_slots),
+            })
+        return days
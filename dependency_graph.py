@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Which frozen URLs each event appears on.
+
+A DependencyGraph maps every event guid to the set of URLs that render it:
+its week and month pages and week feeds (every one a multi-day event spans),
+each category page and feed, its group's feeds, its region page and feed, the virtual page, the homepage and
+newsletter while it's in the two-week window, its month and category JSON
+shards, the site-wide feeds and the sitemap (whose lastmod comes from the
+events' change times).
+
+Comparing two versions of all_events.json gives the changed guids; the
+union of their old and new URLs is the minimal set of paths to re-render and
+invalidate in CloudFront. Pages that only show counts (the homepage month
+list, category/location/feed indexes) are included only when an event is
+added, removed or moves between pages.
+
+The old events are graphed as of the day they were built for (recorded in
+the build manifest), so events that have since dropped out of the window
+count as removed.
+
+Usage:
+    python dependency_graph.py OLD_EVENTS_JSON NEW_EVENTS_JSON
+    python dependency_graph.py --old-date 2026-01-25 OLD_EVENTS_JSON NEW_EVENTS_JSON
+"""
+import argparse
+import json
+import sys
+from datetime import date, datetime, timedelta
+
+import pytz
+
+from build_manifest import BuildManifest
+from content_index import get_tree
+from event_index import EventIndex
+from event_shards import category_shard_path, month_shard_path
+from event_utils import calculate_event_hash
+from site_config import get_categories, get_config
+
+REGION_STATES = ('DC', 'VA', 'MD')
+# Every visible event appears in these
+SITE_WIDE_URLS = ('/events.ics', '/events.json', '/events.ndjson', '/events/index.json', '/sitemap.xml')
+# Pages built from event counts or from the set of weeks/months with events
+COUNT_URLS = ('/', '/newsletter.html', '/newsletter.txt', '/categories/', '/feeds/', '/locations/')
+
+
+def event_key(event):
+    """Get an event's guid, or the UID hash used for events without one."""
+    return event.get('guid') or calculate_event_hash(
+        event.get('date'), event.get('time'), event.get('title'), event.get('url'))
+
+
+def visible_events(events, today):
+    """
+    Get the events the site shows: upcoming, not hidden, not duplicates.
+
+    Args:
+        events: Event dictionaries as stored in all_events.json
+        today: Local date; earlier events are dropped
+
+    Returns:
+        List of event dictionaries
+    """
+    today_str = today.strftime('%Y-%m-%d')
+    return [e for e in events
+            if e.get('date', '') >= today_str and not e.get('hidden', False) and not e.get('duplicate_of')]
+
+
+class DependencyGraph:
+    """
+    Event guid -> URLs it appears on, for one version of the events.
+
+    Attributes:
+        urls: Dict of guid -> set of URL paths
+        digests: Dict of guid -> JSON of the event, to detect edits
+    """
+
+    def __init__(self, events, today, tz, categories, group_slugs=None):
+        """
+        Args:
+            events: Event dictionaries as stored in all_events.json
+            today: Local date; earlier events are dropped
+            tz: pytz timezone of the site
+            categories: Dict of category slug -> metadata
+            group_slugs: Dict of group name -> slug, for the group feeds
+        """
+        self.urls = {}
+        self.digests = {}
+        group_slugs = group_slugs or {}
+
+        events = visible_events(events, today)
+        for event in events:
+            key = event_key(event)
+            self.urls[key] = set(SITE_WIDE_URLS)
+            self.digests[key] = json.dumps(event, sort_keys=True, default=str)
+
+        index = EventIndex(events, tz)
+        window_end = today + timedelta(days=14)
+
+        def add(event_list, *paths):
+            for event in event_list:
+                self.urls[event_key(event)].update(paths)
+
+        for week_id, week_events in index.by_week.items():
+            add(week_events, f"/week/{week_id}/", f"/week/{week_id}/feed.ics", f"/week/{week_id}/feed.xml")
+        for name, group_events in index.by_group.items():
+            if name in group_slugs:
+                base = f"/groups/{group_slugs[name]}/"
+                add(group_events, f"{base}feed.ics", f"{base}feed.xml")
+        for (year, month), month_events in index.by_month.items():
+            add(month_events, f"/{year}/{month}/",
+                month_shard_path(year, month), month_shard_path(year, month, compact=True))
+        for slug, category_events in index.by_category.items():
+            if slug in categories:
+                base = f"/categories/{slug}/"
+                add(category_events, base, f"{base}feed.ics", f"{base}feed.xml",
+                    category_shard_path(slug), category_shard_path(slug, compact=True))
+        for state in REGION_STATES:
+            base = f"/locations/{state.lower()}/"
+            add(index.in_state(state), base, f"{base}feed.ics", f"{base}feed.xml")
+        add(index.virtual, '/virtual/')
+
+        in_window = [e for e in (index.virtual + index.in_person)
+                     if e.start and today <= e.start <= window_end]
+        add(in_window, '/newsletter.html', '/newsletter.txt')
+        add([e for e in in_window if not e.is_virtual], '/')
+
+    @classmethod
+    def from_config(cls, events, today=None):
+        """
+        Build a graph using the site's timezone, categories and groups.
+
+        Args:
+            events: Event dictionaries as stored in all_events.json
+            today: Local date to build for (default: today in the site timezone)
+        """
+        tz = pytz.timezone(get_config().get('timezone', 'US/Eastern'))
+        if today is None:
+            today = datetime.now(tz).date()
+        group_slugs = {doc['name']: slug for slug, doc in get_tree('_groups').documents.items()
+                       if isinstance(doc, dict) and doc.get('name')}
+        return cls(events, today, tz, get_categories(), group_slugs)
+
+    def urls_for(self, key):
+        """Get the URLs an event appears on (empty if it isn't shown)."""
+        return self.urls.get(key, set())
+
+
+def changed_event_keys(old_graph, new_graph):
+    """
+    Get the guids that were added, removed or edited between two versions,
+    or that moved between pages without an edit (e.g. into the homepage's
+    two-week window because the date changed).
+
+    Returns:
+        Set of guids
+    """
+    keys = set(old_graph.digests) | set(new_graph.digests)
+    return {key for key in keys
+            if old_graph.digests.get(key) != new_graph.digests.get(key)
+            or old_graph.urls_for(key) != new_graph.urls_for(key)}
+
+
+def affected_urls(old_graph, new_graph):
+    """
+    Get the URLs whose output depends on events that changed.
+
+    Args:
+        old_graph: DependencyGraph of the previous events
+        new_graph: DependencyGraph of the current events
+
+    Returns:
+        Sorted list of URL paths
+    """
+    urls = set()
+    for key in changed_event_keys(old_graph, new_graph):
+        before = old_graph.urls_for(key)
+        after = new_graph.urls_for(key)
+        urls |= before | after
+        if before != after:
+            # Added, removed or moved: counts and week/month lists change too
+            urls.update(COUNT_URLS)
+    return sorted(urls)
+
+
+def load_events(path):
+    """Load an all_events.json file, treating a missing file as no events."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return []
+
+
+def previous_build_date(manifest=None):
+    """
+    Get the day the previous build was made for, from the build manifest.
+
+    Args:
+        manifest: BuildManifest (default: the one in _cache/)
+
+    Returns:
+        date, or None if no build recorded one
+    """
+    manifest = manifest if manifest is not None else BuildManifest.load()
+    return date.fromisoformat(manifest.built_for) if manifest.built_for else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description='List the URLs affected by changes between two all_events.json files')
+    parser.add_argument('old_events', help='Previous all_events.json')
+    parser.add_argument('new_events', help='Current all_events.json')
+    parser.add_argument('--old-date', type=date.fromisoformat,
+                        help='Day the old events were built for (default: from the build manifest, else today)')
+    args = parser.parse_args()
+
+    old_graph = DependencyGraph.from_config(load_events(args.old_events), args.old_date or previous_build_date())
+    new_graph = DependencyGraph.from_config(load_events(args.new_events))
+    for url in affected_urls(old_graph, new_graph):
+        print(url)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
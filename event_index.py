@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Secondary indexes over a list of upcoming events.
+
+Routes used to scan (and re-parse) every event to find the ones in a
+category, region, week or month. EventIndex buckets the events once so each
+page only touches the events it shows.
+"""
+from event_utils import as_event
+
+
+def week_identifier(target_date):
+    """Get the ISO week identifier (YYYY-Www) for a date."""
+    iso_year, iso_week, _ = target_date.isocalendar()
+    return f"{iso_year}-W{iso_week:02d}"
+
+
+class EventIndex:
+    """
+    Events bucketed by category, group, region state, ISO week, month and venue type.
+
+    Buckets hold Event records (see event_utils.Event). Multi-day events
+    appear in every week and month they overlap. Within each bucket events
+    keep the order they had in the source list.
+
+    Attributes:
+        source: The event sequence the index was built from
+        events: Event records for source, in the same order
+        by_category: Dict of category slug -> list of events
+        by_group: Dict of group name -> list of events
+        by_state: Dict of state abbreviation (e.g. 'VA') -> list of events
+        by_week: Dict of ISO week id (e.g. '2024-W45') -> list of events
+        by_month: Dict of (year, month) -> list of events
+        virtual: List of virtual events
+        in_person: List of events that aren't virtual
+    """
+
+    __slots__ = ('source', 'events', 'by_category', 'by_group', 'by_state', 'by_week', 'by_month',
+                 'virtual', 'in_person')
+
+    def __init__(self, events, tz):
+        self.source = events
+        self.events = [as_event(event, tz) for event in events]
+        self.by_category = {}
+        self.by_group = {}
+        self.by_state = {}
+        self.by_week = {}
+        self.by_month = {}
+        self.virtual = []
+        self.in_person = []
+
+        for event in self.events:
+            self._add(event)
+
+    def _add(self, event):
+        for slug in event.get('categories') or ():
+            self.by_category.setdefault(slug, []).append(event)
+
+        if event.get('group'):
+            self.by_group.setdefault(event['group'], []).append(event)
+
+        if event.state:
+            self.by_state.setdefault(event.state, []).append(event)
+
+        if event.is_virtual:
+            self.virtual.append(event)
+        else:
+            self.in_person.append(event)
+
+        # event.times has one entry per day of the event, in order
+        weeks = []
+        months = []
+        for day in event.times:
+            week_id = week_identifier(day)
+            if not weeks or weeks[-1] != week_id:
+                weeks.append(week_id)
+            month_key = (day.year, day.month)
+            if not months or months[-1] != month_key:
+                months.append(month_key)
+
+        for week_id in weeks:
+            self.by_week.setdefault(week_id, []).append(event)
+        for month_key in months:
+            self.by_month.setdefault(month_key, []).append(event)
+
+    def in_category(self, slug):
+        """Get events tagged with a category slug."""
+        return self.by_category.get(slug, [])
+
+    def in_group(self, name):
+        """Get events organized by a group, by the group's name."""
+        return self.by_group.get(name, [])
+
+    def in_state(self, state):
+        """Get events whose location parses to the given state abbreviation."""
+        return self.by_state.get(state, [])
+
+    def in_week(self, week_id):
+        """Get events that overlap an ISO week (YYYY-Www)."""
+        return self.by_week.get(week_id, [])
+
+    def in_month(self, year, month):
+        """Get events that overlap a calendar month."""
+        return self.by_month.get((year, month), [])
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Upcoming events split into per-month and per-category JSON files.
+
+/events.json holds every upcoming event, so a client that shows one week
+still downloads all of them. The shards let clients fetch only what they
+need:
+
+    /events/index.json               manifest: shard paths, counts, sha256
+    /events/2026-03.json             events overlapping March 2026
+    /events/categories/<slug>.json   events in one category
+
+Every shard also has a compact .min.json variant: no indentation and short
+keys (see COMPACT_KEYS, which index.json repeats so clients can expand
+them). A shard's sha256 in the manifest is the hash of its bytes as served,
+so clients can keep cached shards whose hash didn't change.
+"""
+import hashlib
+import json
+
+# Internal flags that never reach the published files
+PRIVATE_FIELDS = ('hidden', 'duplicate_of')
+
+# Long field name -> compact key; fields not listed keep their name
+COMPACT_KEYS = {
+    'title': 't',
+    'date': 'd',
+    'end_date': 'e',
+    'time': 'h',
+    'url': 'u',
+    'location': 'l',
+    'location_type': 'lt',
+    'categories': 'c',
+    'group': 'g',
+    'group_website': 'gw',
+    'guid': 'id',
+    'city': 'ci',
+    'state': 'st',
+    'region': 'r',
+}
+
+
+def public_fields(event):
+    """Get the publishable fields of an event as a plain dictionary."""
+    return {key: value for key, value in event.items() if key not in PRIVATE_FIELDS}
+
+
+def compact_fields(event):
+    """Get an event's publishable fields under their compact keys."""
+    return {COMPACT_KEYS.get(key, key): value for key, value in public_fields(event).items()}
+
+
+def encode_full(events):
+    """Serialize events the way /events.json does (indented, long keys)."""
+    return json.dumps([public_fields(e) for e in events], indent=2, default=str).encode('utf-8')
+
+
+def encode_compact(events):
+    """Serialize events without whitespace and with compact keys."""
+    return json.dumps([compact_fields(e) for e in events], separators=(',', ':'),
+                      ensure_ascii=False, default=str).encode('utf-8')
+
+
+def month_shard_path(year, month, compact=False):
+    """Get the URL path of a month shard."""
+    return f"/events/{year}-{month:02d}{'.min' if compact else ''}.json"
+
+
+def category_shard_path(slug, compact=False):
+    """Get the URL path of a category shard."""
+    return f"/events/categories/{slug}{'.min' if compact else ''}.json"
+
+
+class EventShards:
+    """
+    Serialized shards and index manifest for one EventIndex.
+
+    Bodies are encoded once when the object is built; routes serve the
+    cached bytes.
+
+    Attributes:
+        events: The indexed Event records
+        months: Dict of (year, month) -> (full bytes, compact bytes)
+        categories: Dict of category slug -> (full bytes, compact bytes)
+        index: Bytes of the index.json manifest
+    """
+
+    __slots__ = ('events', 'months', 'categories', 'index', '_all')
+
+    def __init__(self, index, categories, current_month=None):
+        """
+        Args:
+            index: EventIndex of the visible upcoming events
+            categories: Dict of category slug -> category metadata; only
+                these categories get shards
+            current_month: Optional (year, month) that gets a shard even
+                when no events overlap it
+        """
+        self.events = index.events
+        self.months = {}
+        self.categories = {}
+        self._all = None
+        manifest = {
+            'count': len(index.events),
+            'compact_keys': COMPACT_KEYS,
+            'months': [],
+            'categories': [],
+        }
+
+        months = set(index.by_month)
+        if current_month is not None:
+            months.add(tuple(current_month))
+        for year, month in sorted(months):
+            events = index.in_month(year, month)
+            full, compact = self.months[(year, month)] = (encode_full(events), encode_compact(events))
+            manifest['months'].append(dict(
+                month=f"{year}-{month:02d}",
+                **self._entry(len(events), month_shard_path(year, month), full,
+                              month_shard_path(year, month, compact=True), compact)))
+
+        for slug in sorted(categories):
+            events = index.in_category(slug)
+            full, compact = self.categories[slug] = (encode_full(events), encode_compact(events))
+            manifest['categories'].append(dict(
+                slug=slug,
+                name=categories[slug].get('name', slug),
+                **self._entry(len(events), category_shard_path(slug), full,
+                              category_shard_path(slug, compact=True), compact)))
+
+        self.index = json.dumps(manifest, indent=2).encode('utf-8')
+
+    @staticmethod
+    def _entry(count, path, full, compact_path, compact):
+        return {
+            'count': count,
+            'path': path,
+            'sha256': hashlib.sha256(full).hexdigest(),
+            'bytes': len(full),
+            'compact_path': compact_path,
+            'compact_sha256': hashlib.sha256(compact).hexdigest(),
+            'compact_bytes': len(compact),
+        }
+
+    def all_events(self):
+        """Get every event in the /events.json format, encoded on first use."""
+        if self._all is None:
+            self._all = encode_full(self.events)
+        return self._all
+
+    def month(self, year, month, compact=False):
+        """Get a month shard's bytes, or None if no events overlap the month."""
+        bodies = self.months.get((year, month))
+        return bodies and bodies[1 if compact else 0]
+
+    def category(self, slug, compact=False):
+        """Get a category shard's bytes, or None if the category doesn't exist."""
+        bodies = self.categories.get(slug)
+        return bodies and bodies[1 if compact else 0]
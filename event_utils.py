@@ -1,4 +1,10 @@
 import hashlib
+from collections.abc import Mapping
+from datetime import date, datetime, time, timedelta
+
+import pytz
+
+from location_utils import REGION_SLUGS, extract_location_info
 
 
 def calculate_event_hash(date, time, title, url=None):
@@ -7,3 +13,179 @@ def calculate_event_hash(date, time, title, url=None):
         uid_parts.append(url)
     uid_base = '-'.join(str(p) for p in uid_parts)
     return hashlib.md5(uid_base.encode('utf-8'), usedforsecurity=False).hexdigest()
+
+
+def parse_event_date(value):
+    """Parse a YYYY-MM-DD string, returning None if it isn't one."""
+    if isinstance(value, date):
+        return value
+    try:
+        return datetime.strptime(value, '%Y-%m-%d').date()
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_event_time(value):
+    """Parse an HH:MM string, returning None for all-day or invalid values."""
+    if not value or not isinstance(value, str) or ':' not in value:
+        return None
+    try:
+        return datetime.strptime(value.strip(), '%H:%M').time()
+    except ValueError:
+        return None
+
+
+def parse_change_time(value):
+    """
+    Parse an ISO 8601 change timestamp (e.g. createdAt) to an aware UTC datetime.
+
+    Naive values are taken as UTC. Returns None if the value isn't a timestamp.
+    """
+    if isinstance(value, datetime):
+        parsed = value
+    elif isinstance(value, str) and value:
+        try:
+            parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+        except ValueError:
+            return None
+    else:
+        return None
+    if parsed.tzinfo is None:
+        return pytz.UTC.localize(parsed)
+    return parsed.astimezone(pytz.UTC)
+
+
+# Fields holding when an event was last edited or first stored, newest first
+CHANGE_TIME_FIELDS = ('last_modified', 'lastModified', 'updated_at', 'updatedAt', 'createdAt', 'created_at')
+
+_UNSET = object()
+
+
+class Event(Mapping):
+    """
+    Read-only event record with its dates and times parsed once.
+
+    Behaves like the event dictionary it wraps (event['title'],
+    event.get('categories'), 'url' in event), so templates and existing
+    helpers keep working. copy() returns a plain, mutable dict.
+
+    Attributes:
+        data: The original event dictionary
+        start: First day of the event (date), or None if 'date' is invalid
+        end: Last day of the event (date); equals start for single-day events
+        start_time: Start time (time) when 'time' is a single HH:MM string
+        times: Dict of date -> time (or None for all day) for each day
+        start_utc: UTC start instant for timed events, else None
+        end_utc: UTC end instant for timed events, else None
+        is_virtual: True if location_type is 'virtual'
+
+    city, state and region come from the pipeline-stamped fields when
+    present, otherwise the location is parsed on first access. changed_at
+    (last-modified or created time) is also parsed on first access.
+    """
+
+    __slots__ = ('data', 'start', 'end', 'start_time', 'times',
+                 'start_utc', 'end_utc', 'is_virtual', '_location', '_changed_at')
+
+    def __init__(self, data, tz):
+        self.data = data
+        self.is_virtual = data.get('location_type') == 'virtual'
+        self._location = _UNSET
+        self._changed_at = _UNSET
+
+        start = parse_event_date(data.get('date'))
+        end_date = parse_event_date(data.get('end_date')) if data.get('end_date') else None
+        self.start = start
+        self.end = end_date if (start and end_date and end_date > start) else start
+
+        raw_time = data.get('time', '')
+        self.start_time = parse_event_time(raw_time) if isinstance(raw_time, str) else None
+
+        self.times = {}
+        self.start_utc = None
+        self.end_utc = None
+        if start is None:
+            return
+
+        current = start
+        while current <= self.end:
+            if isinstance(raw_time, dict):
+                self.times[current] = parse_event_time(raw_time.get(current.strftime('%Y-%m-%d'), ''))
+            else:
+                self.times[current] = self.start_time
+            current += timedelta(days=1)
+
+        if self.start_time is not None:
+            self.start_utc = tz.localize(datetime.combine(start, self.start_time)).astimezone(pytz.UTC)
+            if end_date:
+                self.end_utc = tz.localize(datetime.combine(end_date, time(23, 59))).astimezone(pytz.UTC)
+            else:
+                self.end_utc = self.start_utc + timedelta(hours=1)
+
+    def __getitem__(self, key):
+        return self.data[key]
+
+    def __iter__(self):
+        return iter(self.data)
+
+    def __len__(self):
+        return len(self.data)
+
+    def __repr__(self):
+        return f"<Event {self.data.get('date')} {self.data.get('title')!r}>"
+
+    def copy(self):
+        """Get a mutable copy of the event dictionary."""
+        return self.data.copy()
+
+    @property
+    def changed_at(self):
+        """UTC datetime the event was last changed, or None if the data doesn't say."""
+        if self._changed_at is _UNSET:
+            self._changed_at = None
+            for field in CHANGE_TIME_FIELDS:
+                changed = parse_change_time(self.data.get(field))
+                if changed is not None:
+                    self._changed_at = changed
+                    break
+        return self._changed_at
+
+    @property
+    def location_info(self):
+        """Tuple of (city, state) for the event's location."""
+        if self._location is _UNSET:
+            # The pipeline stamps city/state (possibly None) onto every event
+            if 'state' in self.data:
+                self._location = (self.data.get('city'), self.data['state'])
+            else:
+                self._location = extract_location_info(self.data.get('location', ''))
+        return self._location
+
+    @property
+    def city(self):
+        return self.location_info[0]
+
+    @property
+    def state(self):
+        return self.location_info[1]
+
+    @property
+    def region(self):
+        """Region slug ('dc', 'md' or 'va'), or None outside the DC area."""
+        return self.data.get('region') or REGION_SLUGS.get(self.state)
+
+
+def as_event(event, tz):
+    """
+    Get an Event record for an event dictionary.
+
+    Args:
+        event: Event dictionary or an existing Event
+        tz: pytz timezone the event's local times are in
+
+    Returns:
+        The Event (unchanged if one was passed in)
+    """
+    if isinstance(event, Event):
+        return event
+    return Event(event, tz)
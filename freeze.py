@@ -1,6 +1,471 @@
 #!/usr/bin/env python3
-"""Thin wrapper — delegates to calgen.freeze for backward compatibility."""
-from calgen.freeze import main
+"""
+Freeze the site to static files in build/.
+
+By default this delegates to calgen's build, as `make freeze` does. The
+in-tree incremental freezer below is opt-in with --incremental: it freezes
+the Flask app in app.py but does not yet cover everything calgen builds
+(e.g. /just-added/ and the category-month pages), so it isn't used for
+production builds.
+
+The incremental freezer uses Frozen-Flask. Every URL is recorded in _cache/build_manifest.json with
+a digest of its inputs (see build_manifest.py); on the next run URLs whose
+inputs are unchanged are skipped, so their files and mtimes stay untouched.
+Frozen-Flask also leaves a rebuilt file alone when its bytes didn't change.
+
+With --jobs N (default: the CPU count) the URL list is split across N
+forked worker processes. They inherit the already-loaded event snapshot and
+index, write their files independently, and report back so a single
+manifest is written at the end.
+
+With --changed-since OLD_EVENTS_JSON only the URLs that the changed events
+appear on are rendered (see dependency_graph.py), and those paths are
+written to _cache/invalidation_paths.txt for the CloudFront invalidation.
+Use it when only the events changed; template or config changes need a
+normal build.
+
+Usage:
+    python freeze.py                          # calgen build
+    python freeze.py --incremental            # incremental build, one worker per CPU
+    python freeze.py --incremental --jobs 1   # render in this process only
+    python freeze.py --incremental --force    # re-render every URL
+    python freeze.py --incremental --changed-since previous/all_events.json
+    python freeze.py --incremental --compress # also write .gz/.br variants (see precompress.py)
+    python freeze.py --incremental --profile  # timing report (see build_profile.py)
+"""
+import argparse
+import hashlib
+import multiprocessing
+import os
+import time
+import warnings
+from pathlib import Path
+
+from flask import before_render_template, template_rendered
+from flask_frozen import Freezer, MissingURLGeneratorWarning, walk_directory
+
+import app as site
+from build_manifest import BuildManifest, events_digest, shared_inputs_digest
+from build_profile import BuildProfiler
+from content_index import save_index
+from data_cache import pinned_fingerprints
+from dependency_graph import DependencyGraph, affected_urls, load_events, previous_build_date
+from precompress import precompress_build
+from site_config import get_registry_stats
+
+REGIONS = ('dc', 'va', 'md')
+EVENTS_FILE = os.path.join('_data', 'all_events.json')
+INVALIDATION_FILE = os.path.join('_cache', 'invalidation_paths.txt')
+# Served straight from static/; Frozen-Flask rewrites them only when changed
+COPIED_ENDPOINTS = ('static', 'robots_txt')
+# Pages that don't show any events
+EVENT_FREE_ENDPOINTS = ('approved_groups_list', 'categories_json', 'not_found_page')
+
+freezer = Freezer(site.app)
+
+BUILD_CONFIG = {
+    # Timestamps from the event data, so unchanged inputs give unchanged files
+    'REPRODUCIBLE_BUILD': True,
+    # RSS feeds are served as application/rss+xml but saved as .xml
+    'FREEZER_IGNORE_MIMETYPE_WARNINGS': True,
+    # Compressed variants written by precompress.py aren't frozen URLs
+    'FREEZER_DESTINATION_IGNORE': ['*.gz', '*.br'],
+}
+
+# Time spent in render_template() for the URL being frozen
+_template_clock = {'started': 0.0, 'seconds': 0.0}
+
+
+@before_render_template.connect_via(site.app)
+def _template_started(sender, **extra):
+    _template_clock['started'] = time.perf_counter()
+
+
+@template_rendered.connect_via(site.app)
+def _template_finished(sender, **extra):
+    _template_clock['seconds'] += time.perf_counter() - _template_clock['started']
+
+
+@freezer.register_generator
+def week_urls():
+    for week_id in site.get_upcoming_weeks():
+        for endpoint in ('week_page', 'week_ical_feed', 'week_rss_feed'):
+            yield endpoint, {'week_id': week_id}
+
+
+@freezer.register_generator
+def group_feed_urls():
+    for group in site.get_approved_groups():
+        for endpoint in ('group_ical_feed', 'group_rss_feed'):
+            yield endpoint, {'slug': group['id']}
+
+
+@freezer.register_generator
+def month_urls():
+    # The current month's page is built even when it has no events
+    today = site.get_event_snapshot().today
+    months = {(today.year, today.month)}
+    months.update((month['year'], month['month']) for month in site.get_upcoming_months())
+    for year, month in sorted(months):
+        yield 'month_page', {'year': year, 'month': month}
+
+
+@freezer.register_generator
+def category_urls():
+    for slug in site.get_categories():
+        for endpoint in ('category_page', 'category_ical_feed', 'category_rss_feed'):
+            yield endpoint, {'slug': slug}
+
+
+@freezer.register_generator
+def event_shard_urls():
+    yield 'event_shards_index', {}
+    shards = site.get_event_shards()
+    for year, month in shards.months:
+        for endpoint in ('month_events_json', 'month_events_json_compact'):
+            yield endpoint, {'year': year, 'month': month}
+    for slug in shards.categories:
+        for endpoint in ('category_events_json', 'category_events_json_compact'):
+            yield endpoint, {'slug': slug}
+
+
+@freezer.register_generator
+def location_urls():
+    for state in REGIONS:
+        for endpoint in ('region_page', 'location_ical_feed', 'location_rss_feed'):
+            yield endpoint, {'state': state}
+
+
+def page_events(endpoint, args, index):
+    """
+    Get the events a page is rendered from.
+
+    Args:
+        endpoint: Flask endpoint name
+        args: URL arguments
+        index: EventIndex of the visible events
+
+    Returns:
+        List of events, or None if the page depends on every event
+    """
+    if endpoint in ('week_page', 'week_ical_feed', 'week_rss_feed'):
+        return index.in_week(args['week_id'])
+    if endpoint in ('group_ical_feed', 'group_rss_feed'):
+        group = site.get_group(args['slug'])
+        return index.in_group(group.get('name')) if group else []
+    if endpoint in ('month_page', 'month_events_json', 'month_events_json_compact'):
+        return index.in_month(args['year'], args['month'])
+    if endpoint in ('category_page', 'category_ical_feed', 'category_rss_feed',
+                    'category_events_json', 'category_events_json_compact'):
+        return index.in_category(args['slug'])
+    if endpoint in ('region_page', 'location_ical_feed', 'location_rss_feed'):
+        return index.in_state(args['state'].upper())
+    if endpoint == 'virtual_events_page':
+        return index.virtual
+    if endpoint in EVENT_FREE_ENDPOINTS:
+        return []
+    return None
+
+
+class IncrementalFreeze:
+    """
+    Runs the freezer, skipping URLs whose inputs match the manifest.
+
+    Attributes:
+        manifest: BuildManifest from the previous run
+        force: If True, every URL is rendered
+        only: Optional set of URLs to render; other pages keep their
+            existing files and manifest entries
+        rendered: URLs rendered in this run
+        copied: Static files copied (or confirmed unchanged) in this run
+        skipped: URLs left untouched because their inputs didn't change
+        cache_stats: Dict of cache name -> hit/miss counters for this run,
+            summed over workers (see cache_stats())
+        timings: Dict of URL -> (seconds, template seconds) for this run
+    """
+
+    def __init__(self, manifest, force=False, only=None):
+        self.manifest = manifest
+        self.force = force
+        self.only = set(only) if only is not None else None
+        self.rendered = []
+        self.copied = []
+        self.skipped = []
+        self.cache_stats = None
+        self.timings = {}
+        self._pending = {}
+        self._started = {}
+        self._snapshot = site.get_event_snapshot()
+        self._index = site.get_event_index()
+        self._shared = shared_inputs_digest(self._snapshot)
+        self._urls = site.app.url_map.bind('localhost')
+
+    def page_digest(self, url):
+        """
+        Get the input digest for a URL.
+
+        Returns:
+            Hex digest, or None for files copied from static/ (always
+            copied; Frozen-Flask only rewrites them when they changed)
+        """
+        endpoint, args = self._urls.match(url)
+        if endpoint in COPIED_ENDPOINTS:
+            return None
+
+        events = page_events(endpoint, args, self._index)
+        digest = hashlib.sha256(self._shared.encode())
+        digest.update(url.encode('utf-8'))
+        if events is None:
+            digest.update(self._snapshot.version.encode())
+        else:
+            digest.update(events_digest(events).encode())
+        return digest.hexdigest()
+
+    def _skip(self, url, path):
+        self._started[url] = time.perf_counter()
+        _template_clock['seconds'] = 0.0
+        digest = self.page_digest(url)
+        if self.only is not None and digest is not None and url not in self.only and os.path.isfile(path):
+            # Not affected: keep the file and whatever it was last built from
+            self._pending[url] = (self.manifest.pages.get(url), True)
+            return True
+
+        skip = not self.force and self.manifest.is_current(url, digest)
+        # Frozen-Flask only honors a skip when the output file already exists
+        self._pending[url] = (digest, skip and os.path.isfile(path))
+        return skip
+
+    def run(self, jobs=1):
+        """
+        Freeze every URL and update the manifest.
+
+        Args:
+            jobs: Number of worker processes. Parallel builds need the 'fork'
+                start method; elsewhere the build runs in this process.
+
+        Returns:
+            List of the URLs that were frozen
+        """
+        before = cache_stats()
+        # Inputs don't change during a build; don't re-stat them per URL
+        with pinned_fingerprints():
+            if jobs > 1 and 'fork' in multiprocessing.get_all_start_methods():
+                pages, self.cache_stats = self._run_parallel(jobs)
+            else:
+                pages = self._run_serial()
+                self.cache_stats = _stats_since(before, cache_stats())
+
+        seen = []
+        for url, digest, skipped, timing in pages:
+            seen.append(url)
+            self.timings[url] = timing
+            if skipped:
+                self.skipped.append(url)
+            elif digest is None:
+                self.copied.append(url)
+            else:
+                self.rendered.append(url)
+            self.manifest.record(url, digest)
+        self.manifest.prune(seen)
+        self.manifest.built_for = self._snapshot.today.isoformat()
+        self.manifest.save()
+        return seen
+
+    def _run_serial(self):
+        site.app.config['FREEZER_SKIP_EXISTING'] = self._skip
+        pages = []
+        for page in freezer.freeze_yield():
+            pages.append(self._finished(page.url))
+        return pages
+
+    def _run_parallel(self, jobs):
+        global _active_build
+        urls = list(dict.fromkeys(freezer.all_urls()))
+        freezer.root.mkdir(parents=True, exist_ok=True)
+
+        # Workers are forked, so they share this process's snapshot and index
+        _active_build = self
+        try:
+            context = multiprocessing.get_context('fork')
+            with context.Pool(jobs) as pool:
+                results = pool.map(_freeze_partition, [urls[i::jobs] for i in range(jobs)])
+        finally:
+            _active_build = None
+
+        pages = []
+        totals = {}
+        for partition_pages, partition_stats in results:
+            pages.extend(partition_pages)
+            for name, counters in partition_stats.items():
+                hits, misses = totals.get(name, (0, 0))
+                totals[name] = (hits + counters['hits'], misses + counters['misses'])
+
+        if site.app.config['FREEZER_REMOVE_EXTRA_FILES']:
+            _remove_extra_files({freezer.root / freezer.urlpath_to_filepath(page[0]) for page in pages})
+        return pages, {name: _counters(hits, misses) for name, (hits, misses) in totals.items()}
+
+    def _finished(self, url):
+        """Get the (url, digest, skipped, timing) record for a frozen URL."""
+        digest, skipped = self._pending.pop(url)
+        timing = (time.perf_counter() - self._started.pop(url), _template_clock['seconds'])
+        return url, digest, skipped, timing
+
+
+def cache_stats():
+    """
+    Get the counters of the in-process caches pages are rendered from.
+
+    Returns:
+        Dict of cache name -> dict with hits, misses and hit_rate
+    """
+    stats = {
+        'Day fragments': site.get_fragment_cache_stats(),
+        'Event snapshots': site.get_event_snapshot_stats(),
+        'VEVENT blocks': site.get_vevent_cache_stats(),
+        'RSS items': site.get_rss_item_cache_stats(),
+    }
+    for name, counters in get_registry_stats().items():
+        stats[name.capitalize()] = counters
+    return stats
+
+
+def _counters(hits, misses):
+    total = hits + misses
+    return {'hits': hits, 'misses': misses, 'hit_rate': (hits / total) if total else 0.0}
+
+
+def _stats_since(before, after):
+    """Get the hits and misses each cache gained between two cache_stats() calls."""
+    return {name: _counters(counters['hits'] - before[name]['hits'], counters['misses'] - before[name]['misses'])
+            for name, counters in after.items()}
+
+
+# The build being run by _run_parallel(), inherited by forked workers
+_active_build = None
+
+
+def _freeze_partition(urls):
+    """Freeze a share of the URLs in a worker process."""
+    build = _active_build
+    # Counters inherited from the parent aren't this worker's
+    before = cache_stats()
+    partition = Freezer(site.app, with_static_files=False, with_no_argument_rules=False, log_url_for=False)
+    partition.register_generator(lambda: urls)
+    # The parent removes stale files once every worker is done
+    site.app.config['FREEZER_REMOVE_EXTRA_FILES'] = False
+    site.app.config['FREEZER_SKIP_EXISTING'] = build._skip
+
+    pages = []
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', MissingURLGeneratorWarning)
+        for page in partition.freeze_yield():
+            pages.append(build._finished(page.url))
+    return pages, _stats_since(before, cache_stats())
+
+
+def _remove_extra_files(built_paths):
+    """Delete files left in build/ by URLs that no longer exist."""
+    root = freezer.root
+    ignore = site.app.config['FREEZER_DESTINATION_IGNORE']
+    for name in walk_directory(root, ignore=ignore):
+        path = Path(root / name)
+        if path not in built_paths:
+            path.unlink()
+            try:
+                path.parent.rmdir()
+            except OSError:
+                pass
+
+
+def configure_app():
+    """
+    Apply BUILD_CONFIG to the app for a freeze.
+
+    Importing this module leaves the shared app alone; main() calls this.
+
+    Returns:
+        Dict of the previous values, to restore with app.config.update()
+    """
+    previous = {key: site.app.config.get(key) for key in BUILD_CONFIG}
+    site.app.config.update(BUILD_CONFIG)
+    return previous
+
+
+def write_paths(path, urls):
+    """Write one URL path per line, e.g. for aws cloudfront create-invalidation."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w') as f:
+        f.writelines(f"{url}\n" for url in urls)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Freeze the site to static files in build/')
+    parser.add_argument('--incremental', action='store_true',
+                        help="Use the in-tree incremental freezer instead of calgen's build")
+    parser.add_argument('--force', action='store_true', help='Re-render every URL, ignoring the build manifest')
+    parser.add_argument('--changed-since', metavar='OLD_EVENTS_JSON',
+                        help='Only render URLs whose events changed since this all_events.json')
+    parser.add_argument('--compress', action='store_true',
+                        help='Write .gz/.br variants and _cache/artifact_manifest.json')
+    parser.add_argument('--jobs', type=int,
+                        help='Number of worker processes (default: CPU count)')
+    parser.add_argument('--profile', action='store_true',
+                        help='Write a timing report to _cache/profile/freeze.json')
+    args = parser.parse_args()
+
+    if not args.incremental:
+        if args.force or args.changed_since or args.compress or args.jobs or args.profile:
+            parser.error('--force, --changed-since, --compress, --jobs and --profile need --incremental')
+        from calgen.freeze import main as calgen_freeze
+        return calgen_freeze()
+
+    configure_app()
+    profiler = BuildProfiler('freeze', enabled=args.profile)
+    profiler.start()
+
+    with profiler.stage('load'):
+        only = None
+        manifest = BuildManifest.load()
+        if args.changed_since:
+            # Graph the old events as of the last build, so ones that have
+            # since dropped out of the window count as removed
+            old_graph = DependencyGraph.from_config(load_events(args.changed_since), previous_build_date(manifest))
+            new_graph = DependencyGraph.from_config(load_events(EVENTS_FILE), site.get_event_snapshot().today)
+            only = affected_urls(old_graph, new_graph)
+            write_paths(INVALIDATION_FILE, only)
+            print(f"{len(only)} URLs affected by changed events (listed in {INVALIDATION_FILE})")
+
+        build = IncrementalFreeze(manifest, force=args.force, only=only)
+
+    with profiler.stage('freeze'):
+        build.run(jobs=max(1, args.jobs or os.cpu_count() or 1))
+    save_index()
+
+    caches = dict(build.cache_stats)
+    fragments = caches.pop('Day fragments')
+    total = len(build.rendered) + len(build.copied) + len(build.skipped)
+    print(f"Froze {total} URLs: {len(build.rendered)} rendered, {len(build.skipped)} unchanged, "
+          f"{len(build.copied)} static files")
+    print(f"Day fragments: {fragments['hits']} reused, {fragments['misses']} rendered "
+          f"({fragments['hit_rate']:.0%} hit rate)")
+    for name, counters in caches.items():
+        print(f"{name}: {counters['hits']} hits, {counters['misses']} misses "
+              f"({counters['hit_rate']:.0%} hit rate)")
+
+    if args.compress:
+        with profiler.stage('compress'):
+            counts = precompress_build(str(freezer.root))
+        print(f"Precompressed: {counts['compressed']} variants written, {counts['reused']} reused, "
+              f"{counts['changed']} changed paths")
+
+    if profiler.enabled:
+        skipped = set(build.skipped)
+        for url, (seconds, template_seconds) in build.timings.items():
+            path = freezer.root / freezer.urlpath_to_filepath(url)
+            size = path.stat().st_size if path.is_file() else 0
+            profiler.record_route(url, seconds, template_seconds, size, skipped=url in skipped)
+        profiler.finish()
+
 
 if __name__ == '__main__':
     main()
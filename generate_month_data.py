@@ -1,13 +1,50 @@
 #!/usr/bin/env python3
 """Thin wrapper — delegates to calgen.pipeline for backward compatibility."""
+import os
+
 from calgen.pipeline import *  # noqa: F401,F403
 from calgen.event_utils import calculate_event_hash  # noqa: F401
-from calgen.pipeline import main
+from calgen.pipeline import main as pipeline_main
+from build_profile import BuildProfiler, take_profile_flag
+from location_utils import location_cache_stats, save_location_cache, stamp_events_file
 
 # Backward-compatibility aliases
 load_event_overrides = load_overlays  # noqa: F405
 EVENT_OVERRIDES_DIR = OVERLAY_DIR  # noqa: F405
 
+
+def main():
+    """
+    Run the calgen pipeline, then stamp city/state/region onto each event.
+
+    The pipeline runs in this process, so the locations its region plugin
+    (regions.py) parsed are saved to _cache/locations.json with the rest.
+
+    With --profile, writes a timing report to _cache/profile/pipeline.json.
+    """
+    profiler = BuildProfiler('pipeline', enabled=take_profile_flag())
+    profiler.start()
+
+    with profiler.stage('pipeline'):
+        result = pipeline_main()
+    if result:
+        # The region plugin's parses are still worth keeping
+        save_location_cache()
+        profiler.finish()
+        return result
+
+    events_file = os.path.join('_data', 'all_events.json')
+    with profiler.stage('stamp-locations'):
+        if os.path.exists(events_file):
+            count = stamp_events_file(events_file)
+            stats = location_cache_stats()
+            print(f"Stamped locations on {count} events "
+                  f"({stats['hits']} cached, {stats['misses']} parsed)")
+        save_location_cache()
+    profiler.finish()
+    return 0
+
+
 if __name__ == "__main__":
     import sys
     sys.exit(main())
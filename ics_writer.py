@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Streaming iCalendar (RFC 5545) writer for the .ics feeds.
+
+Building an icalendar.Calendar and calling to_ical() for every feed
+serialized each event again in events.ics, its category feeds and its
+location feed. This writer renders each VEVENT once, caches the bytes under
+a hash of the event's content, and streams feeds as a sequence of cached
+blocks.
+
+Only what the feeds need is implemented: TEXT escaping, UTC date-times,
+all-day dates, one parameterized property (ORGANIZER;CN=...) and line
+folding at 75 octets without splitting UTF-8 characters.
+"""
+import hashlib
+from datetime import timedelta
+
+from event_utils import calculate_event_hash
+
+CRLF = '\r\n'
+# RFC 5545 3.1: lines SHOULD NOT be longer than 75 octets, excluding CRLF
+MAX_LINE_OCTETS = 75
+
+
+def escape_text(value):
+    """
+    Escape a TEXT property value (RFC 5545 3.3.11).
+
+    Backslashes, semicolons and commas are backslash-escaped, and line
+    breaks become a literal \\n.
+    """
+    return (str(value).replace('\\', '\\\\')
+            .replace(';', '\\;')
+            .replace(',', '\\,')
+            .replace('\r\n', '\\n')
+            .replace('\n', '\\n')
+            .replace('\r', '\\n'))
+
+
+def escape_extension(value):
+    """
+    Prepare an X-WR-* property value.
+
+    The icalendar library reads extension properties verbatim and the
+    feeds have always written them unescaped, so only line breaks are
+    escaped.
+    """
+    return str(value).replace('\r\n', '\\n').replace('\n', '\\n').replace('\r', '\\n')
+
+
+def quote_param(value):
+    """Quote a parameter value; DQUOTE and line breaks aren't allowed inside one."""
+    value = str(value).replace('"', "'").replace('\r', ' ').replace('\n', ' ')
+    return f'"{value}"'
+
+
+def fold_line(line):
+    """
+    Fold a content line to at most 75 octets per physical line.
+
+    Continuation lines start with a single space. A multi-byte UTF-8
+    character is never split across lines.
+
+    Args:
+        line: Unfolded content line without a line break
+
+    Returns:
+        The folded line, ending in CRLF
+    """
+    if len(line) * 4 <= MAX_LINE_OCTETS or len(line.encode('utf-8')) <= MAX_LINE_OCTETS:
+        return line + CRLF
+
+    parts = []
+    current = []
+    size = 0
+    limit = MAX_LINE_OCTETS
+    for char in line:
+        char_size = len(char.encode('utf-8'))
+        if size + char_size > limit:
+            parts.append(''.join(current))
+            current = []
+            size = 0
+            limit = MAX_LINE_OCTETS - 1  # room for the leading space
+        current.append(char)
+        size += char_size
+    parts.append(''.join(current))
+    return (CRLF + ' ').join(parts) + CRLF
+
+
+def format_utc(value):
+    """Format an aware UTC datetime as a DATE-TIME value (e.g. 20250130T180000Z)."""
+    return value.strftime('%Y%m%dT%H%M%SZ')
+
+
+def event_uid(event):
+    """Get the stable UID of an event's VEVENT."""
+    uid_hash = calculate_event_hash(event.get('date'), event.get('time', ''),
+                                    event.get('title', 'event'), event.get('url'))
+    return f"{uid_hash}@dctech.events"
+
+
+def vevent_key(event, group_website=None):
+    """
+    Get the content hash a VEVENT block is cached under.
+
+    Covers every field the block is rendered from, so an edited event gets
+    a new key and the stale block ages out of the cache.
+
+    Args:
+        event: Event record (see event_utils.Event)
+        group_website: Organizer URL for the event's group, if any
+    """
+    fields = (event.get('title'), event.get('date'), event.get('end_date'), event.get('time'),
+              event.get('location'), event.get('url'), event.get('group'), event.get('cost'),
+              group_website)
+    return hashlib.sha1(repr(fields).encode('utf-8'), usedforsecurity=False).hexdigest()
+
+
+def render_vevent(event, group_website=None):
+    """
+    Render an event's VEVENT, split around its DTSTAMP line.
+
+    DTSTAMP can depend on the feed (see write_calendar), so it's written
+    per feed between the two cached halves.
+
+    Args:
+        event: Event record with a valid start date
+        group_website: Organizer URL for the event's group, if any
+
+    Returns:
+        Tuple of (bytes before DTSTAMP, bytes after DTSTAMP)
+    """
+    if event.start_utc is None:
+        # All-day events use dates, with an exclusive end date
+        start = f"DTSTART;VALUE=DATE:{event.start.strftime('%Y%m%d')}"
+        end = f"DTEND;VALUE=DATE:{(event.end + timedelta(days=1)).strftime('%Y%m%d')}"
+    else:
+        start = f"DTSTART:{format_utc(event.start_utc)}"
+        end = f"DTEND:{format_utc(event.end_utc)}"
+
+    head = ['BEGIN:VEVENT', f"SUMMARY:{escape_text(event.get('title', 'Untitled Event'))}", start, end]
+    tail = [f"UID:{event_uid(event)}"]
+
+    description_parts = []
+    if event.get('url'):
+        description_parts.append(f"Event URL: {event['url']}")
+    if event.get('group'):
+        description_parts.append(f"Organized by: {event['group']}")
+    if event.get('cost'):
+        description_parts.append(f"Cost: {event['cost']}")
+    if description_parts:
+        description = '\n'.join(description_parts)
+        tail.append(f"DESCRIPTION:{escape_text(description)}")
+    if event.get('location'):
+        tail.append(f"LOCATION:{escape_text(event['location'])}")
+    if event.get('group') and group_website:
+        tail.append(f"ORGANIZER;CN={quote_param(event['group'])}:{group_website}")
+    if event.get('url'):
+        tail.append(f"URL:{event['url']}")
+    tail.append('END:VEVENT')
+
+    return (''.join(fold_line(line) for line in head).encode('utf-8'),
+            ''.join(fold_line(line) for line in tail).encode('utf-8'))
+
+
+def calendar_header(prodid, name, description):
+    """Get the VCALENDAR opening lines for a feed."""
+    lines = ['BEGIN:VCALENDAR', 'VERSION:2.0', f"PRODID:{prodid}",
+             f"X-WR-CALDESC:{escape_extension(description)}", f"X-WR-CALNAME:{escape_extension(name)}"]
+    return ''.join(fold_line(line) for line in lines).encode('utf-8')
+
+
+def write_calendar(events, prodid, name, description, dtstamp, group_websites, cache):
+    """
+    Stream a VCALENDAR with one VEVENT per event.
+
+    Args:
+        events: Event records; events without a valid date are skipped
+        prodid: PRODID value
+        name: Calendar name (X-WR-CALNAME)
+        description: Calendar description (X-WR-CALDESC)
+        dtstamp: Function of an event returning its DTSTAMP (aware UTC datetime)
+        group_websites: Dict of group name -> website, used as ORGANIZER
+        cache: FragmentCache of rendered VEVENT blocks, shared by all feeds
+
+    Yields:
+        Chunks of the encoded calendar
+    """
+    stamps = {}
+    yield calendar_header(prodid, name, description)
+    for event in events:
+        if event.start is None:
+            continue
+        website = group_websites.get(event.get('group'))
+        head, tail = cache.get(vevent_key(event, website), lambda: render_vevent(event, website))
+        when = dtstamp(event)
+        if when not in stamps:
+            stamps[when] = f"DTSTAMP:{format_utc(when)}{CRLF}".encode('ascii')
+        yield head + stamps[when] + tail
+    yield f"END:VCALENDAR{CRLF}".encode('ascii')
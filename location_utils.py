@@ -1,12 +1,98 @@
 #!/usr/bin/env python3
+import json
+import os
+import sys
+import threading
+from importlib import metadata
+
 import usaddress
 
+# Parsed addresses persist here between builds (normalized address -> [city, state])
+LOCATION_CACHE_FILE = os.path.join('_cache', 'locations.json')
+
+# State abbreviation -> region slug used in URLs (/locations/<slug>/)
+REGION_SLUGS = {'DC': 'dc', 'MD': 'md', 'VA': 'va'}
+
+_cache_lock = threading.Lock()
+_location_cache = None
+_location_cache_dirty = False
+_cache_hits = 0
+_cache_misses = 0
+
+
+def _package_version(name):
+    try:
+        return metadata.version(name)
+    except metadata.PackageNotFoundError:
+        return 'unknown'
+
+
+def _parser_version():
+    # calgen's parser is cached here too (see cache_parser)
+    return f"usaddress {_package_version('usaddress')}, calgen {_package_version('calgen')}"
+
+
+def normalize_address(address):
+    """Collapse runs of whitespace so trivially different venue strings share a cache entry."""
+    return ' '.join(address.split())
+
+
+def _get_location_cache():
+    """Load the on-disk location cache the first time it's needed."""
+    global _location_cache
+    if _location_cache is None:
+        _location_cache = {}
+        try:
+            with open(LOCATION_CACHE_FILE, 'r', encoding='utf-8') as f:
+                stored = json.load(f)
+            # Entries from a different parser version may no longer be right
+            if stored.get('parser') == _parser_version():
+                _location_cache = {k: tuple(v) for k, v in stored.get('locations', {}).items()}
+        except (OSError, ValueError, AttributeError):
+            pass
+    return _location_cache
+
+
+def save_location_cache():
+    """
+    Write the location cache to _cache/locations.json if it has new entries.
+
+    Returns:
+        True if the file was written, False if there was nothing to save
+    """
+    global _location_cache_dirty
+    with _cache_lock:
+        if not _location_cache_dirty:
+            return False
+        os.makedirs(os.path.dirname(LOCATION_CACHE_FILE), exist_ok=True)
+        payload = {
+            'parser': _parser_version(),
+            'locations': {k: list(v) for k, v in sorted(_location_cache.items())},
+        }
+        tmp_path = f"{LOCATION_CACHE_FILE}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(payload, f, ensure_ascii=False, indent=0)
+        os.replace(tmp_path, LOCATION_CACHE_FILE)
+        _location_cache_dirty = False
+        return True
+
+
+def location_cache_stats():
+    """Get hit/miss counters and size for the location cache."""
+    with _cache_lock:
+        return {
+            'hits': _cache_hits,
+            'misses': _cache_misses,
+            'entries': len(_location_cache or {}),
+        }
+
+
 def extract_location_info(address):
     """
     Extract city and state from an address string.
     
-    Uses usaddress library to parse addresses and extract PlaceName and StateName.
-    Handles multi-word cities by collecting consecutive PlaceNames immediately before StateName.
+    Results are cached by normalized address (and persisted by
+    save_location_cache), so each distinct venue string is only parsed once.
     
     Args:
         address: Address string in various formats (street address, city/state, etc.)
@@ -17,6 +103,62 @@ def extract_location_info(address):
     if not address or not isinstance(address, str):
         return None, None
 
+    key = normalize_address(address)
+    return _cached_parse(key, lambda: _parse_location_info(key))
+
+
+def cache_parser(parse, name):
+    """
+    Wrap another extract_location_info-style parser with the persisted cache.
+
+    Its parses are stored under the exact address prefixed with name, not
+    the normalized one, so the wrapper always returns what parse would.
+
+    Args:
+        parse: Function of an address string returning (city, state)
+        name: Prefix keeping this parser's entries apart from the others
+
+    Returns:
+        Function with the same signature as parse
+    """
+    def extract(address):
+        if not address or not isinstance(address, str):
+            return parse(address)
+        return _cached_parse(f"{name}:{address}", lambda: parse(address))
+    return extract
+
+
+def _cached_parse(key, parse):
+    """Get a cached (city, state) for key, calling parse() and storing the result on a miss."""
+    global _location_cache_dirty, _cache_hits, _cache_misses
+    with _cache_lock:
+        cache = _get_location_cache()
+        if key in cache:
+            _cache_hits += 1
+            return cache[key]
+
+    result = tuple(parse())
+
+    with _cache_lock:
+        _cache_misses += 1
+        cache[key] = result
+        _location_cache_dirty = True
+    return result
+
+
+def _parse_location_info(address):
+    """
+    Parse city and state out of an address with usaddress.
+    
+    Uses usaddress library to parse addresses and extract PlaceName and StateName.
+    Handles multi-word cities by collecting consecutive PlaceNames immediately before StateName.
+    
+    Args:
+        address: Address string in various formats (street address, city/state, etc.)
+        
+    Returns:
+        Tuple of (city, state) or (None, None) if extraction fails
+    """
     try:
         parsed = usaddress.parse(address)
         state = None
@@ -87,4 +229,57 @@ def get_region_name(state):
         'VA': 'Virginia',
         'MD': 'Maryland'
     }
-    return regions.get(state, state)
\ No newline at end of file
+    return regions.get(state, state)
+
+
+def stamp_event_locations(events):
+    """
+    Add city, state and region fields to each event from its location.
+
+    The fields are always set (None when the location can't be parsed) so
+    readers can tell a stamped event apart from one that needs parsing.
+
+    Args:
+        events: List of event dictionaries, modified in place
+
+    Returns:
+        The same list
+    """
+    for event in events:
+        city, state = extract_location_info(event.get('location', ''))
+        event['city'] = city
+        event['state'] = state
+        if not event.get('region'):
+            event['region'] = REGION_SLUGS.get(state)
+    return events
+
+
+def stamp_events_file(path=os.path.join('_data', 'all_events.json')):
+    """
+    Stamp city/state/region onto every event in a JSON event file.
+
+    Args:
+        path: Path to the JSON list of events (default _data/all_events.json)
+
+    Returns:
+        Number of events stamped
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        events = json.load(f)
+
+    stamp_event_locations(events)
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(events, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+    save_location_cache()
+    return len(events)
+
+
+if __name__ == '__main__':
+    target = sys.argv[1] if len(sys.argv) > 1 else os.path.join('_data', 'all_events.json')
+    count = stamp_events_file(target)
+    stats = location_cache_stats()
+    print(f"Stamped locations on {count} events "
+          f"({stats['hits']} cached, {stats['misses']} parsed, {stats['entries']} known addresses)")
@@ -8,26 +8,19 @@ Usage:
 
 import os
 import sys
-import glob
-import yaml
 import argparse
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 import dynamo_data
+from content_index import load_documents
 
 
 def load_yaml_categories(categories_dir='_categories'):
-    """Load all category YAML files."""
+    """Load all category YAML files (via the shared content index)."""
     categories = []
-    for file_path in sorted(glob.glob(os.path.join(categories_dir, '*.yaml'))):
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                category = yaml.safe_load(f)
-                slug = os.path.splitext(os.path.basename(file_path))[0]
-                category['slug'] = slug
-                categories.append((slug, category))
-        except Exception as e:
-            print(f"  Error loading {file_path}: {e}")
+    for slug, category in load_documents(categories_dir):
+        category['slug'] = slug
+        categories.append((slug, category))
     return categories
 
 
@@ -8,27 +8,20 @@ Usage:
 
 import os
 import sys
-import glob
-import yaml
 import argparse
 
 # Add parent directory to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 import dynamo_data
+from content_index import load_documents
 
 
 def load_yaml_groups(groups_dir='_groups'):
-    """Load all group YAML files."""
+    """Load all group YAML files (via the shared content index)."""
     groups = []
-    for file_path in sorted(glob.glob(os.path.join(groups_dir, '*.yaml'))):
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                group = yaml.safe_load(f)
-                slug = os.path.splitext(os.path.basename(file_path))[0]
-                group['id'] = slug
-                groups.append((slug, group))
-        except Exception as e:
-            print(f"  Error loading {file_path}: {e}")
+    for slug, group in load_documents(groups_dir):
+        group['id'] = slug
+        groups.append((slug, group))
     return groups
 
 
@@ -8,26 +8,19 @@ Usage:
 
 import os
 import sys
-import glob
-import yaml
 import argparse
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 import dynamo_data
+from content_index import load_documents
 
 
 def load_yaml_overrides(overrides_dir='_event_overrides'):
-    """Load all override YAML files."""
+    """Load all override YAML files (via the shared content index)."""
     overrides = []
-    for file_path in sorted(glob.glob(os.path.join(overrides_dir, '*.yaml'))):
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                override = yaml.safe_load(f)
-                guid = os.path.splitext(os.path.basename(file_path))[0]
-                if override:
-                    overrides.append((guid, override))
-        except Exception as e:
-            print(f"  Error loading {file_path}: {e}")
+    for guid, override in load_documents(overrides_dir):
+        if override:
+            overrides.append((guid, override))
     return overrides
 
 
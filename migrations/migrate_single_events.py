@@ -8,14 +8,13 @@ Usage:
 
 import os
 import sys
-import glob
-import yaml
 import hashlib
 import argparse
 from datetime import date
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 import dynamo_data
+from content_index import load_documents
 
 
 def calculate_event_hash(event_date, event_time, title, url=None):
@@ -28,31 +27,28 @@ def calculate_event_hash(event_date, event_time, title, url=None):
 
 
 def load_yaml_single_events(events_dir='_single_events'):
-    """Load all single event YAML files."""
+    """Load all single event YAML files (via the shared content index)."""
     events = []
-    for file_path in sorted(glob.glob(os.path.join(events_dir, '*.yaml'))):
+    for event_id, event in load_documents(events_dir):
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                event = yaml.safe_load(f)
-                event_id = os.path.splitext(os.path.basename(file_path))[0]
-                event['id'] = event_id
-
-                # Normalize date to string
-                if isinstance(event.get('date'), date):
-                    event['date'] = event['date'].strftime('%Y-%m-%d')
-                if isinstance(event.get('end_date'), date):
-                    event['end_date'] = event['end_date'].strftime('%Y-%m-%d')
-
-                # Calculate GUID
-                guid = calculate_event_hash(
-                    event.get('date', ''),
-                    event.get('time', ''),
-                    event.get('title', ''),
-                    event.get('url'),
-                )
-                events.append((guid, event))
+            event['id'] = event_id
+
+            # Normalize date to string
+            if isinstance(event.get('date'), date):
+                event['date'] = event['date'].strftime('%Y-%m-%d')
+            if isinstance(event.get('end_date'), date):
+                event['end_date'] = event['end_date'].strftime('%Y-%m-%d')
+
+            # Calculate GUID
+            guid = calculate_event_hash(
+                event.get('date', ''),
+                event.get('time', ''),
+                event.get('title', ''),
+                event.get('url'),
+            )
+            events.append((guid, event))
         except Exception as e:
-            print(f"  Error loading {file_path}: {e}")
+            print(f"  Error loading {event_id}.yaml: {e}")
     return events
 
 
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Newline-delimited JSON export of the events.
+
+One compact JSON object per line, sorted by date (then time and title), so
+consumers can process the corpus a line at a time with constant memory. The
+output for a given input is byte-for-byte stable, which makes byte offsets
+meaningful: an interrupted download or export can resume from the number of
+bytes it already has.
+
+The site serves the upcoming events as /events.ndjson. The CLI exports the
+whole of all_events.json (past events included), optionally limited to a
+date window and a set of fields:
+
+    python ndjson_export.py > events.ndjson
+    python ndjson_export.py --since 2026-01-01 --until 2026-03-31
+    python ndjson_export.py --fields date,title,url,group
+    python ndjson_export.py --output events.ndjson --resume
+"""
+import argparse
+import json
+import os
+import sys
+
+from event_shards import PRIVATE_FIELDS, public_fields
+
+EVENTS_FILE = os.path.join('_data', 'all_events.json')
+
+
+def _sort_key(event):
+    event_time = event.get('time')
+    return (str(event.get('date') or ''), event_time if isinstance(event_time, str) else '',
+            str(event.get('title') or ''))
+
+
+def in_window(event, since=None, until=None):
+    """
+    Check whether an event overlaps a date window.
+
+    Args:
+        event: Event dictionary
+        since: First day of the window (YYYY-MM-DD), or None
+        until: Last day of the window (YYYY-MM-DD), or None
+
+    Returns:
+        True if any day of the event falls in the window
+    """
+    start = str(event.get('date') or '')
+    end = str(event.get('end_date') or start)
+    if since and max(start, end) < since:
+        return False
+    if until and start > until:
+        return False
+    return True
+
+
+def iter_ndjson(events, since=None, until=None, fields=None, offset=0):
+    """
+    Encode events as NDJSON lines in date order.
+
+    Args:
+        events: Event dictionaries (or Event records)
+        since: Only events on or after this day (YYYY-MM-DD)
+        until: Only events on or before this day (YYYY-MM-DD)
+        fields: Only these fields, in this order (missing ones are left out);
+            default is every public field
+        offset: Skip this many bytes of output; must fall on a line boundary
+
+    Yields:
+        Encoded lines, each ending in a newline
+
+    Raises:
+        ValueError: If offset falls inside a line
+    """
+    position = 0
+    for event in sorted(events, key=_sort_key):
+        if not in_window(event, since, until):
+            continue
+        if fields:
+            record = {field: event[field] for field in fields if field in event and field not in PRIVATE_FIELDS}
+        else:
+            record = public_fields(event)
+        line = json.dumps(record, separators=(',', ':'), ensure_ascii=False, default=str).encode('utf-8') + b'\n'
+
+        if position >= offset:
+            yield line
+        elif position + len(line) > offset:
+            raise ValueError(f"Offset {offset} is inside a line (which starts at byte {position})")
+        position += len(line)
+
+    if offset > position:
+        raise ValueError(f"Offset {offset} is past the end of the export ({position} bytes)")
+
+
+def load_events(path=EVENTS_FILE, include_hidden=False):
+    """
+    Load the events to export from all_events.json.
+
+    Args:
+        path: Path to all_events.json
+        include_hidden: Keep hidden and duplicate events
+
+    Returns:
+        List of event dictionaries
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        events = json.load(f)
+    if include_hidden:
+        return events
+    return [e for e in events if not e.get('hidden', False) and not e.get('duplicate_of')]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Export events as newline-delimited JSON, sorted by date')
+    parser.add_argument('--input', default=EVENTS_FILE, help=f"Events file (default: {EVENTS_FILE})")
+    parser.add_argument('--output', help='Write to this file instead of stdout')
+    parser.add_argument('--since', help='Only events on or after this date (YYYY-MM-DD)')
+    parser.add_argument('--until', help='Only events on or before this date (YYYY-MM-DD)')
+    parser.add_argument('--fields', help='Comma-separated fields to keep, e.g. date,title,url')
+    parser.add_argument('--include-hidden', action='store_true', help='Include hidden and duplicate events')
+    resume = parser.add_mutually_exclusive_group()
+    resume.add_argument('--offset', type=int, default=0, help='Start the output at this byte offset')
+    resume.add_argument('--resume', action='store_true',
+                        help='Append to --output, continuing from its current size')
+    args = parser.parse_args(argv)
+
+    fields = [f.strip() for f in args.fields.split(',') if f.strip()] if args.fields else None
+    offset = args.offset
+    mode = 'wb'
+    if args.resume:
+        if not args.output:
+            parser.error('--resume needs --output')
+        if os.path.exists(args.output):
+            offset = os.path.getsize(args.output)
+            mode = 'ab'
+
+    events = load_events(args.input, include_hidden=args.include_hidden)
+    lines = iter_ndjson(events, since=args.since, until=args.until, fields=fields, offset=offset)
+
+    try:
+        if args.output:
+            with open(args.output, mode) as out:
+                out.writelines(lines)
+        else:
+            sys.stdout.buffer.writelines(lines)
+            sys.stdout.buffer.flush()
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
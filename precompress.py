@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Precompressed .gz/.br variants of the frozen build, plus a content manifest.
+
+Each text artifact in build/ (HTML, .ics, .xml, .json, ...) gets a .gz and,
+when the Brotli package is installed, a .br file next to it. A variant is
+only recompressed when its source's hash changed since the last run.
+
+_cache/artifact_manifest.json lists every file in build/ with its sha256,
+size, Content-Type and compressed variants (with their Content-Encoding),
+plus the paths that changed in this run, so the S3 sync can upload only
+changed objects with the right headers.
+
+Only variants recorded in the manifest are ever deleted; other .gz/.br
+files in build/ (e.g. a shipped archive) are ordinary artifacts.
+
+Usage:
+    python precompress.py [BUILD_DIR]
+"""
+import gzip
+import hashlib
+import json
+import mimetypes
+import os
+import sys
+
+try:
+    import brotli
+except ImportError:  # optional; only .gz variants are written without it
+    brotli = None
+
+ARTIFACT_MANIFEST_FILE = os.path.join('_cache', 'artifact_manifest.json')
+TEXT_SUFFIXES = ('.html', '.ics', '.xml', '.json', '.ndjson', '.txt', '.css', '.js', '.svg')
+VARIANT_SUFFIXES = ('.gz', '.br')
+# Below this, compression saves less than the extra request headers cost
+MIN_COMPRESS_SIZE = 256
+
+CONTENT_TYPES = {
+    '.ics': 'text/calendar',
+    '.xml': 'application/xml',
+    '.json': 'application/json',
+    '.ndjson': 'application/x-ndjson',
+}
+
+
+def content_type(path):
+    """Get the Content-Type to upload a build file with."""
+    suffix = os.path.splitext(path)[1]
+    if suffix in CONTENT_TYPES:
+        return CONTENT_TYPES[suffix]
+    return mimetypes.guess_type(path)[0] or 'application/octet-stream'
+
+
+def _compress(encoding, data):
+    if encoding == 'gzip':
+        # mtime=0 keeps the output identical for identical input
+        return gzip.compress(data, compresslevel=9, mtime=0)
+    return brotli.compress(data, quality=11)
+
+
+def _encodings():
+    encodings = [('gzip', '.gz')]
+    if brotli is not None:
+        encodings.append(('br', '.br'))
+    return encodings
+
+
+def _write_if_changed(path, data):
+    try:
+        with open(path, 'rb') as f:
+            if f.read() == data:
+                return False
+    except OSError:
+        pass
+    with open(path, 'wb') as f:
+        f.write(data)
+    return True
+
+
+def _is_variant_of_text(name, names):
+    """Check whether a file is the .gz/.br name of a text artifact, which the run writes over."""
+    source, suffix = os.path.splitext(name)
+    return suffix in VARIANT_SUFFIXES and source in names and source.endswith(TEXT_SUFFIXES)
+
+
+def load_artifact_manifest(path=ARTIFACT_MANIFEST_FILE):
+    """Load the previous artifact manifest's files, or {} if there isn't one."""
+    try:
+        with open(path, 'r') as f:
+            return json.load(f).get('files', {})
+    except (OSError, ValueError):
+        return {}
+
+
+def precompress_build(root, manifest_path=ARTIFACT_MANIFEST_FILE):
+    """
+    Write compressed variants for a build directory and its artifact manifest.
+
+    Args:
+        root: Build directory (e.g. 'build')
+        manifest_path: Where to write the artifact manifest
+
+    Returns:
+        Dictionary with counts: files, compressed (variants written),
+        reused (variants left as they were) and changed (paths whose
+        uploaded bytes changed)
+    """
+    previous = load_artifact_manifest(manifest_path)
+    encodings = _encodings()
+    files = {}
+    changed = []
+    counts = {'files': 0, 'compressed': 0, 'reused': 0}
+
+    # Variants this tool wrote before, and ones it's about to (over)write,
+    # aren't artifacts of their own
+    written = {name + suffix for name, entry in previous.items() for suffix in entry.get('variants', {})}
+    found = set()
+    for directory, _, filenames in os.walk(root):
+        for name in filenames:
+            found.add(os.path.relpath(os.path.join(directory, name), root).replace(os.sep, '/'))
+    sources = [name for name in found if name not in written and not _is_variant_of_text(name, found)]
+
+    for name in sorted(sources):
+        path = os.path.join(root, name)
+        with open(path, 'rb') as f:
+            data = f.read()
+        sha = hashlib.sha256(data).hexdigest()
+        before = previous.get(name, {})
+        entry = {'sha256': sha, 'size': len(data), 'content_type': content_type(name), 'variants': {}}
+        counts['files'] += 1
+        if before.get('sha256') != sha:
+            changed.append(name)
+
+        compressible = name.endswith(TEXT_SUFFIXES) and len(data) >= MIN_COMPRESS_SIZE
+        for encoding, suffix in encodings if compressible else ():
+            variant_path = path + suffix
+            known = before.get('variants', {}).get(suffix)
+            if before.get('sha256') == sha and known and os.path.isfile(variant_path):
+                entry['variants'][suffix] = known
+                counts['reused'] += 1
+                continue
+
+            compressed = _compress(encoding, data)
+            if _write_if_changed(variant_path, compressed):
+                changed.append(name + suffix)
+            entry['variants'][suffix] = {
+                'content_encoding': encoding,
+                'sha256': hashlib.sha256(compressed).hexdigest(),
+                'size': len(compressed),
+            }
+            counts['compressed'] += 1
+
+        # Drop variants whose source is no longer compressed (or whose
+        # encoder isn't available any more)
+        for suffix in before.get('variants', {}):
+            if suffix not in entry['variants'] and os.path.isfile(path + suffix):
+                os.remove(path + suffix)
+        files[name] = entry
+
+    # Variants whose source file was removed
+    for name, entry in previous.items():
+        if name not in files:
+            for suffix in entry.get('variants', {}):
+                if os.path.isfile(os.path.join(root, name + suffix)):
+                    os.remove(os.path.join(root, name + suffix))
+
+    os.makedirs(os.path.dirname(manifest_path) or '.', exist_ok=True)
+    tmp_path = f"{manifest_path}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump({'files': files, 'changed': changed}, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, manifest_path)
+
+    counts['changed'] = len(changed)
+    return counts
+
+
+def main():
+    root = sys.argv[1] if len(sys.argv) > 1 else 'build'
+    counts = precompress_build(root)
+    print(f"{counts['files']} files: {counts['compressed']} variants compressed, "
+          f"{counts['reused']} reused, {counts['changed']} changed paths")
+    if brotli is None:
+        print("Brotli is not installed; only .gz variants were written")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
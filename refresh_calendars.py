@@ -1,8 +1,18 @@
 #!/usr/bin/env python3
-"""Thin wrapper — delegates to calgen.calendars for backward compatibility."""
+"""Thin wrapper — delegates to calgen.calendars for backward compatibility.
+
+With --profile, writes a timing report to _cache/profile/refresh.json.
+"""
 from calgen.calendars import *  # noqa: F401,F403
 from calgen.calendars import main
 
+from build_profile import BuildProfiler, take_profile_flag
+
 if __name__ == "__main__":
     import sys
-    sys.exit(main())
+    profiler = BuildProfiler('refresh', enabled=take_profile_flag())
+    profiler.start()
+    with profiler.stage('refresh'):
+        result = main()
+    profiler.finish()
+    sys.exit(result)
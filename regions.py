@@ -1,5 +1,10 @@
-from calgen.location_utils import extract_location_info
+from calgen.location_utils import extract_location_info as calgen_extract_location_info
 from calgen.regions import EventRejected
+from location_utils import cache_parser
+
+# calgen's parser behind the persisted cache; generate_month_data.py saves the
+# parses to _cache/locations.json after the pipeline, so they're reused across builds
+extract_location_info = cache_parser(calgen_extract_location_info, 'calgen')
 
 _REGIONS = [
     {'slug': 'dc', 'name': 'Washington DC'},
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Streaming RSS 2.0 writer for the site feeds and the recently-added feed.
+
+The feeds used to build an ElementTree per feed, indent it and serialize it,
+re-parsing dates and re-hashing guids for every item even though the same
+events appear in the category, location and site-wide feeds. This writer
+renders each <item> once, caches its bytes under the fields it's built from,
+and streams a feed as its channel header, the cached items and the closing
+tags. The output matches what ElementTree produced, indentation included.
+
+Two item flavours exist:
+
+- upcoming_item: an upcoming event (category and location feeds); pubDate
+  is the event's day, guid a hash of its date, time, title and URL
+- added_item: a recently-added event (generate_rss_feed.py); pubDate is
+  when it was added (createdAt), guid its eventId
+"""
+import hashlib
+from datetime import datetime, time
+from email.utils import formatdate
+from xml.sax.saxutils import escape
+
+ATOM_NAMESPACE = 'http://www.w3.org/2005/Atom'
+ITEM_INDENT = '    '
+
+
+def _element(tag, text, indent, attributes=None):
+    attrs = ''.join(f' {name}={_attribute(value)}' for name, value in (attributes or {}).items())
+    if text:
+        return f"{indent}<{tag}{attrs}>{escape(str(text))}</{tag}>\n"
+    return f"{indent}<{tag}{attrs} />\n"
+
+
+def _attribute(value):
+    # Same escaping and quoting as ElementTree
+    return '"' + escape(str(value), {'"': '&quot;', '\n': '&#10;'}) + '"'
+
+
+def rfc822(value):
+    """Format an aware datetime as an RFC 822 date in GMT."""
+    return formatdate(timeval=value.timestamp(), usegmt=True)
+
+
+def _item(title, link, description, guid, pub_date):
+    inner = ITEM_INDENT + '  '
+    parts = [f"{ITEM_INDENT}<item>\n",
+             _element('title', title, inner),
+             _element('link', link, inner),
+             _element('description', description, inner),
+             _element('guid', guid, inner, {'isPermaLink': 'false'})]
+    if pub_date:
+        parts.append(_element('pubDate', pub_date, inner))
+    parts.append(f"{ITEM_INDENT}</item>\n")
+    return ''.join(parts).encode('utf-8')
+
+
+def upcoming_item_key(event, base_url):
+    """Get the cache key of an upcoming event's item: every field it's built from."""
+    return ('upcoming', event.get('date', ''), repr(event.get('time', '')), event.get('title', 'Untitled Event'),
+            event.get('url', ''), base_url)
+
+
+def upcoming_item(event, base_url, tz):
+    """
+    Render the <item> for an upcoming event.
+
+    Args:
+        event: Event record (see event_utils.Event)
+        base_url: Link used when the event has no URL
+        tz: pytz timezone the event's date is local to
+
+    Returns:
+        Encoded item, indented for its place in the channel
+    """
+    title = event.get('title', 'Untitled Event')
+    event_date = event.get('date', '')
+    event_time = event.get('time', '')
+    url = event.get('url', '')
+    date_str = event.start.strftime('%B %-d, %Y') if event.start else None
+
+    desc_parts = []
+    if date_str:
+        desc_parts.append(f"Event Date: {date_str} at {event_time}" if event_time else f"Event Date: {date_str}")
+    if url:
+        desc_parts.append(f'<a href="{url}">Event Details</a>')
+
+    guid_text = f"{event_date}-{event_time}-{title}-{url}"
+    guid = hashlib.md5(guid_text.encode('utf-8'), usedforsecurity=False).hexdigest()
+
+    pub_date = None
+    if event.start:
+        pub_date = rfc822(tz.localize(datetime.combine(event.start, time.min)))
+
+    return _item(f"{title} ({date_str})" if date_str else title, url or base_url,
+                 '<br/>'.join(desc_parts) if desc_parts else title, guid, pub_date)
+
+
+def added_item_key(event, base_url):
+    """Get the cache key of a recently-added event's item."""
+    return ('added', event.get('title', 'Untitled Event'), event.get('date', ''), event.get('url', ''),
+            event.get('createdAt', ''), event.get('eventId', event.get('guid', '')), base_url)
+
+
+def added_item(event, base_url, added_at=None):
+    """
+    Render the <item> for a recently-added event.
+
+    Args:
+        event: Event dictionary from the database
+        base_url: Link used when the event has no URL
+        added_at: Aware datetime the event was added (its parsed createdAt),
+            or None to leave out pubDate
+
+    Returns:
+        Encoded item, indented for its place in the channel
+    """
+    title = event.get('title', 'Untitled Event')
+    url = event.get('url', '')
+    try:
+        date_str = datetime.strptime(event.get('date', ''), '%Y-%m-%d').strftime('%B %-d, %Y')
+    except (TypeError, ValueError):
+        date_str = None
+
+    desc_parts = []
+    if date_str:
+        desc_parts.append(f"Event Date: {date_str}")
+    if url:
+        desc_parts.append(f'<a href="{url}">Event Details</a>')
+
+    return _item(f"{title} ({date_str})" if date_str else title, url or base_url,
+                 '<br/>'.join(desc_parts) if desc_parts else title,
+                 event.get('eventId', event.get('guid', '')), rfc822(added_at) if added_at else None)
+
+
+def write_feed(items, title, link, description, last_build, self_link=None):
+    """
+    Stream an RSS 2.0 document.
+
+    Args:
+        items: Iterable of encoded items (from upcoming_item or added_item)
+        title: Channel title
+        link: Channel link
+        description: Channel description
+        last_build: Aware datetime for lastBuildDate
+        self_link: Feed URL for an atom:link rel="self", if any
+
+    Yields:
+        Chunks of the encoded document
+    """
+    indent = '    '
+    header = ["<?xml version='1.0' encoding='utf-8'?>\n",
+              f'<rss version="2.0" xmlns:atom="{ATOM_NAMESPACE}">\n',
+              '  <channel>\n',
+              _element('title', title, indent),
+              _element('link', link, indent),
+              _element('description', description, indent),
+              _element('language', 'en-us', indent)]
+    if self_link:
+        header.append(_element('atom:link', None, indent,
+                               {'href': self_link, 'rel': 'self', 'type': 'application/rss+xml'}))
+    header.append(_element('lastBuildDate', rfc822(last_build), indent))
+    yield ''.join(header).encode('utf-8')
+    yield from items
+    yield b'  </channel>\n</rss>'
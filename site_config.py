@@ -1,16 +1,97 @@
+"""
+Site settings, categories and sponsors, loaded once per process.
+
+Each loader keeps its parsed result until the watched file (or directory of
+YAML files) changes on disk, so callers can use them on every request.
+"""
+import json
 import os
 import yaml
 
+from content_index import get_tree
+from data_cache import SnapshotCache, file_fingerprint
+
 _CONFIG_FILE = 'config.yaml'
-_config = None
+_CATEGORIES_DIR = '_categories'
+_SPONSORS_FILE = os.path.join('_data', 'sponsors.json')
 
+# get_config() updates this dict in place, so modules that keep a reference
+# (e.g. app.config) always see the current settings.
+_config = {}
+_config_cache = SnapshotCache()
+_categories_cache = SnapshotCache()
+_sponsors_cache = SnapshotCache()
 
-def get_config():
-    global _config
-    if _config is None:
-        if os.path.exists(_CONFIG_FILE):
-            with open(_CONFIG_FILE) as f:
-                _config = yaml.safe_load(f) or {}
-        else:
-            _config = {}
+
+def _load_config():
+    if os.path.exists(_CONFIG_FILE):
+        with open(_CONFIG_FILE) as f:
+            loaded = yaml.safe_load(f) or {}
+    else:
+        loaded = {}
+    _config.clear()
+    _config.update(loaded)
     return _config
+
+
+def get_config():
+    return _config_cache.get(file_fingerprint(_CONFIG_FILE), _load_config)
+
+
+def _build_categories(tree):
+    categories = {}
+    for slug, doc in tree.documents.items():
+        if not isinstance(doc, dict):
+            print(f"Error loading category {slug}.yaml: not a mapping")
+            continue
+        cat = dict(doc)
+        cat['slug'] = slug
+        categories[slug] = cat
+
+    return categories
+
+
+def get_categories():
+    """
+    Get all categories from _categories/*.yaml files.
+
+    The returned dict is shared by every caller; don't modify it.
+
+    Returns:
+        A dict mapping category slugs to category metadata
+    """
+    tree = get_tree(_CATEGORIES_DIR)
+    return _categories_cache.get(tree, lambda: _build_categories(tree))
+
+
+def _load_sponsors():
+    if not os.path.exists(_SPONSORS_FILE):
+        return []
+
+    try:
+        with open(_SPONSORS_FILE, 'r') as f:
+            return json.load(f)
+    except Exception as e:
+        print(f"Error loading sponsors: {e}")
+        return []
+
+
+def get_sponsors():
+    """
+    Get sponsors from _data/sponsors.json.
+
+    The returned list is shared by every caller; don't modify it.
+
+    Returns:
+        A list of sponsor dictionaries, or [] if the file is missing or invalid
+    """
+    return _sponsors_cache.get(file_fingerprint(_SPONSORS_FILE), _load_sponsors)
+
+
+def get_registry_stats():
+    """Get hit/miss counters for the config, category and sponsor caches."""
+    return {
+        'config': _config_cache.stats(),
+        'categories': _categories_cache.stats(),
+        'sponsors': _sponsors_cache.stats(),
+    }
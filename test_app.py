@@ -3,6 +3,31 @@ import unittest
 from datetime import datetime, date, timedelta
 import pytz
 
+_index_dir = None
+_index_file = None
+
+
+def setUpModule():
+    """Keep the content index the tests build out of the repo's _cache/"""
+    global _index_dir, _index_file
+    import os
+    import tempfile
+    import content_index
+
+    _index_dir = tempfile.TemporaryDirectory()
+    _index_file = content_index.INDEX_FILE
+    content_index.INDEX_FILE = os.path.join(_index_dir.name, 'content_index.pickle')
+    content_index.clear()
+
+
+def tearDownModule():
+    import content_index
+
+    content_index.INDEX_FILE = _index_file
+    content_index.clear()
+    _index_dir.cleanup()
+
+
 class TestApp(unittest.TestCase):
     def setUp(self):
         self.timezone_name = 'US/Eastern'
@@ -1386,6 +1411,95 @@ class TestLocationValidation(unittest.TestCase):
         self.assertIn("Washington DC", location)
 
 
+class TestLocationCache(unittest.TestCase):
+    """Test cases for the persisted location-parse cache"""
+
+    def setUp(self):
+        import os
+        import tempfile
+        import location_utils
+
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.cache_file = os.path.join(self.tmpdir.name, '_cache', 'locations.json')
+        self.orig = (location_utils.LOCATION_CACHE_FILE, location_utils._location_cache,
+                     location_utils._location_cache_dirty)
+        location_utils.LOCATION_CACHE_FILE = self.cache_file
+        location_utils._location_cache = None
+        location_utils._location_cache_dirty = False
+
+    def tearDown(self):
+        import location_utils
+
+        (location_utils.LOCATION_CACHE_FILE, location_utils._location_cache,
+         location_utils._location_cache_dirty) = self.orig
+        self.tmpdir.cleanup()
+
+    def test_parse_cached_and_persisted(self):
+        """Test that each normalized address is parsed once and saved to disk"""
+        import json
+        from unittest.mock import patch
+        import location_utils
+
+        with patch('location_utils.usaddress.parse', wraps=location_utils.usaddress.parse) as parse:
+            first = location_utils.extract_location_info('Arlington, VA 22201')
+            second = location_utils.extract_location_info('Arlington,  VA   22201')
+        self.assertEqual(first, ('Arlington', 'VA'))
+        self.assertEqual(second, first)
+        self.assertEqual(parse.call_count, 1)
+
+        self.assertTrue(location_utils.save_location_cache())
+        self.assertFalse(location_utils.save_location_cache())
+        with open(self.cache_file) as f:
+            stored = json.load(f)
+        self.assertEqual(stored['locations']['Arlington, VA 22201'], ['Arlington', 'VA'])
+
+        # A fresh process reads the stored parse instead of calling usaddress
+        location_utils._location_cache = None
+        with patch('location_utils.usaddress.parse') as parse:
+            self.assertEqual(location_utils.extract_location_info('Arlington, VA 22201'),
+                             ('Arlington', 'VA'))
+        parse.assert_not_called()
+
+    def test_cache_parser_keeps_exact_results(self):
+        """Test that a wrapped parser is called once per exact address and its parses are kept apart"""
+        from unittest.mock import Mock
+        import location_utils
+
+        parse = Mock(side_effect=lambda address: ('Arlington', 'VA') if address == 'Arlington, VA' else (None, None))
+        extract = location_utils.cache_parser(parse, 'other')
+
+        self.assertEqual(extract('Arlington, VA'), ('Arlington', 'VA'))
+        self.assertEqual(extract('Arlington, VA'), ('Arlington', 'VA'))
+        # Not normalized: the wrapped parser decides what whitespace means
+        self.assertEqual(extract('Arlington,  VA'), (None, None))
+        self.assertEqual(parse.call_count, 2)
+
+        self.assertTrue(location_utils.save_location_cache())
+        location_utils._location_cache = None
+        self.assertEqual(extract('Arlington, VA'), ('Arlington', 'VA'))
+        self.assertEqual(parse.call_count, 2)
+        self.assertNotIn('Arlington, VA', location_utils._get_location_cache())
+
+    def test_stamped_events_skip_parsing(self):
+        """Test that stamped city/state/region are used without calling usaddress"""
+        from unittest.mock import patch
+        from event_utils import Event
+        from location_utils import stamp_event_locations
+
+        events = stamp_event_locations([
+            {'date': '2026-01-15', 'title': 'A', 'location': 'Bethesda, MD 20814'},
+            {'date': '2026-01-15', 'title': 'B', 'location': 'Online'},
+        ])
+        self.assertEqual((events[0]['city'], events[0]['state'], events[0]['region']),
+                         ('Bethesda', 'MD', 'md'))
+        self.assertIsNone(events[1]['state'])
+
+        with patch('location_utils.usaddress.parse') as parse:
+            records = [Event(e, pytz.timezone('US/Eastern')) for e in events]
+            self.assertEqual([r.state for r in records], ['MD', None])
+        parse.assert_not_called()
+
+
 class TestIntegrationEndToEnd(unittest.TestCase):
     """Integration tests for end-to-end workflows (Phase 7.3)"""
     
@@ -1788,5 +1902,965 @@ class TestIntegrationEndToEnd(unittest.TestCase):
                 pass
 
 
+class TestEventSnapshot(unittest.TestCase):
+    """Test cases for the process-wide event snapshot behind get_events"""
+
+    def setUp(self):
+        import os
+        import tempfile
+        import app
+
+        self.local_tz = pytz.timezone('US/Eastern')
+        self.today = datetime.now(self.local_tz).date()
+        self.orig_cwd = os.getcwd()
+        self.tmpdir = tempfile.TemporaryDirectory()
+        os.chdir(self.tmpdir.name)
+        os.makedirs('_data')
+        os.makedirs('_groups')
+        app._event_snapshots.clear()
+
+    def tearDown(self):
+        import os
+        import app
+
+        os.chdir(self.orig_cwd)
+        self.tmpdir.cleanup()
+        app._event_snapshots.clear()
+
+    def write_events(self, events):
+        import json
+        import os
+
+        with open(os.path.join('_data', 'all_events.json'), 'w') as f:
+            json.dump(events, f)
+
+    def test_snapshot_reused_until_file_changes(self):
+        """Test that all_events.json is parsed once and reloaded only on change"""
+        import app
+
+        today_str = self.today.strftime('%Y-%m-%d')
+        self.write_events([{'date': today_str, 'title': 'First'}])
+
+        before = app.get_event_snapshot_stats()
+        events1 = app.get_events()
+        events2 = app.get_events()
+        after = app.get_event_snapshot_stats()
+
+        self.assertIs(events1, events2)
+        self.assertEqual(after['misses'] - before['misses'], 1)
+        self.assertEqual(after['hits'] - before['hits'], 1)
+        self.assertEqual([e['title'] for e in events1], ['First'])
+
+        # Rewriting the file (different size) invalidates the snapshot
+        self.write_events([{'date': today_str, 'title': 'Second event'}])
+        events3 = app.get_events()
+        self.assertEqual([e['title'] for e in events3], ['Second event'])
+        self.assertNotEqual(app.get_event_snapshot().version, '')
+
+    def test_snapshot_filters_hidden_and_past(self):
+        """Test that hidden, duplicate and past events are excluded by default"""
+        import app
+
+        today_str = self.today.strftime('%Y-%m-%d')
+        yesterday_str = (self.today - timedelta(days=1)).strftime('%Y-%m-%d')
+        self.write_events([
+            {'date': today_str, 'title': 'Visible'},
+            {'date': today_str, 'title': 'Hidden', 'hidden': True},
+            {'date': today_str, 'title': 'Dupe', 'duplicate_of': 'abc'},
+            {'date': yesterday_str, 'title': 'Past'},
+        ])
+
+        self.assertEqual([e['title'] for e in app.get_events()], ['Visible'])
+        self.assertEqual(
+            sorted(e['title'] for e in app.get_events(include_hidden=True)),
+            ['Dupe', 'Hidden', 'Visible'])
+
+    def test_snapshot_is_immutable(self):
+        """Test that the snapshot object can't be modified"""
+        import app
+
+        self.write_events([])
+        snapshot = app.get_event_snapshot()
+        with self.assertRaises(AttributeError):
+            snapshot.events = ()
+        self.assertIsInstance(snapshot.events, tuple)
+
+    def test_group_change_invalidates_snapshot(self):
+        """Test that adding a group refreshes the group_website lookup"""
+        import os
+        import yaml
+        import app
+
+        today_str = self.today.strftime('%Y-%m-%d')
+        self.write_events([{'date': today_str, 'title': 'Meetup', 'group': 'Test Group'}])
+        self.assertNotIn('group_website', app.get_events()[0])
+
+        with open(os.path.join('_groups', 'test-group.yaml'), 'w') as f:
+            yaml.dump({'name': 'Test Group', 'website': 'https://group.example.com'}, f)
+
+        self.assertEqual(app.get_events()[0]['group_website'], 'https://group.example.com')
+
+    def test_pinned_fingerprints_skip_rechecks(self):
+        """Test that pinned fingerprints keep the snapshot until the block ends"""
+        import app
+        from data_cache import pinned_fingerprints
+
+        today_str = self.today.strftime('%Y-%m-%d')
+        self.write_events([{'date': today_str, 'title': 'First'}])
+        with pinned_fingerprints():
+            first = app.get_events()
+            self.write_events([{'date': today_str, 'title': 'Second event'}])
+            self.assertIs(app.get_events(), first)
+        self.assertEqual([e['title'] for e in app.get_events()], ['Second event'])
+
+
+class TestConditionalGet(unittest.TestCase):
+    """Test cases for ETag/Last-Modified handling on feeds and data routes"""
+
+    def setUp(self):
+        import os
+        import tempfile
+        import app
+
+        self.today = datetime.now(pytz.timezone('US/Eastern')).date()
+        self.orig_cwd = os.getcwd()
+        self.tmpdir = tempfile.TemporaryDirectory()
+        os.chdir(self.tmpdir.name)
+        os.makedirs('_data')
+        self.write_events([{'date': self.today.strftime('%Y-%m-%d'), 'title': 'Meetup', 'time': '18:00'}])
+        app._event_snapshots.clear()
+        self.client = app.app.test_client()
+
+    def tearDown(self):
+        import os
+        import app
+
+        os.chdir(self.orig_cwd)
+        self.tmpdir.cleanup()
+        app._event_snapshots.clear()
+
+    def write_events(self, events):
+        import json
+        import os
+
+        with open(os.path.join('_data', 'all_events.json'), 'w') as f:
+            json.dump(events, f)
+
+    def test_validators_present(self):
+        """Test that feeds carry an ETag and Last-Modified"""
+        response = self.client.get('/events.ics')
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.headers.get('ETag'))
+        self.assertTrue(response.headers.get('Last-Modified'))
+
+    def test_if_none_match_skips_generation(self):
+        """Test that a matching ETag returns 304 without building the feed"""
+        from unittest.mock import patch
+
+        etag = self.client.get('/events.ics').headers['ETag']
+        with patch('app.generate_ical_feed') as generate:
+            response = self.client.get('/events.ics', headers={'If-None-Match': etag})
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.data, b'')
+        generate.assert_not_called()
+
+    def test_if_modified_since(self):
+        """Test that If-Modified-Since is honored when no ETag is sent"""
+        last_modified = self.client.get('/sitemap.xml').headers['Last-Modified']
+        response = self.client.get('/sitemap.xml', headers={'If-Modified-Since': last_modified})
+        self.assertEqual(response.status_code, 304)
+
+    def test_etag_depends_on_route_and_data(self):
+        """Test that the ETag differs per URL and changes with the events"""
+        etag = self.client.get('/events.ics').headers['ETag']
+        self.assertNotEqual(etag, self.client.get('/events.json').headers['ETag'])
+
+        self.write_events([{'date': self.today.strftime('%Y-%m-%d'), 'title': 'Another meetup'}])
+        response = self.client.get('/events.ics', headers={'If-None-Match': etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.headers['ETag'], etag)
+
+    def test_errors_not_cached(self):
+        """Test that 404 responses don't get validators"""
+        response = self.client.get('/categories/no-such-category/feed.xml')
+        self.assertEqual(response.status_code, 404)
+        self.assertIsNone(response.headers.get('ETag'))
+
+    def test_missing_resources_not_modified(self):
+        """Test that a future If-Modified-Since still gets a 404 for a feed that doesn't exist"""
+        headers = {'If-Modified-Since': 'Fri, 01 Jan 2100 00:00:00 GMT'}
+        for path in ['/categories/nope/feed.ics', '/week/garbage/feed.ics', '/locations/zz/feed.xml',
+                     '/groups/nope/feed.ics', '/events/1999-01.json']:
+            self.assertEqual(self.client.get(path, headers=headers).status_code, 404, path)
+        self.assertEqual(self.client.get('/events.ics', headers=headers).status_code, 304)
+
+
+class TestDayFragmentCache(unittest.TestCase):
+    """Test cases for the rendered events_by_day fragment cache"""
+
+    def setUp(self):
+        import app
+
+        self.local_tz = pytz.timezone('US/Eastern')
+        self.today = datetime.now(self.local_tz).date()
+        app._day_fragments.clear()
+        self.events = [
+            {'date': self.today.strftime('%Y-%m-%d'), 'time': '18:00', 'title': 'Meetup A',
+             'url': 'https://example.com/a', 'categories': ['ai']},
+            {'date': (self.today + timedelta(days=1)).strftime('%Y-%m-%d'), 'title': 'Meetup B',
+             'url': 'https://example.com/b'},
+        ]
+
+    def render(self, events, categories=None, add_week_links=False):
+        import app
+
+        days = app.prepare_events_by_day(events, add_week_links=add_week_links)
+        template = app.app.jinja_env.get_template('partials/events_by_day.html')
+        with app.app.test_request_context('/'):
+            return template.render(days=days, categories=categories or {})
+
+    def test_identical_days_rendered_once(self):
+        """Test that a day shared by two pages is only rendered the first time"""
+        import app
+
+        first = self.render(self.events)
+        before = app.get_fragment_cache_stats()
+        second = self.render(list(self.events))
+        after = app.get_fragment_cache_stats()
+
+        self.assertEqual(first, second)
+        self.assertEqual(after['misses'], before['misses'])
+        self.assertEqual(after['hits'] - before['hits'], 2)
+
+    def test_parity_outside_cached_fragment(self):
+        """Test that a day keeps its odd/even class when reused at another position"""
+        html = self.render(self.events[1:])
+        self.assertIn('day-container odd', html)
+        self.assertIn('Meetup B', html)
+
+        html = self.render(self.events)
+        self.assertIn('day-container even', html)
+        self.assertEqual(html.count('Meetup B'), 1)
+
+    def test_key_covers_week_links_and_categories(self):
+        """Test that week links and category names produce distinct fragments"""
+        import app
+
+        plain = self.render(self.events[:1])
+        linked = self.render(self.events[:1], add_week_links=True)
+        self.assertNotIn('/week/', plain)
+        self.assertIn('/week/', linked)
+
+        named = self.render(self.events[:1], categories={'ai': {'name': 'AI'}})
+        renamed = self.render(self.events[:1], categories={'ai': {'name': 'Machine Learning'}})
+        self.assertIn('>AI</a>', named)
+        self.assertIn('>Machine Learning</a>', renamed)
+        self.assertEqual(app.get_fragment_cache_stats()['entries'], 4)
+
+    def test_changed_event_rendered_again(self):
+        """Test that editing an event invalidates its day's fragment"""
+        self.render(self.events[:1])
+        edited = dict(self.events[0], title='Renamed Meetup')
+        self.assertIn('Renamed Meetup', self.render([edited]))
+
+
+class TestIncrementalFreeze(unittest.TestCase):
+    """Test cases for the manifest-driven incremental freeze"""
+
+    def setUp(self):
+        import os
+        import tempfile
+        import app
+        import freeze
+
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.build_dir = os.path.join(self.tmpdir.name, 'build')
+        self.manifest_file = os.path.join(self.tmpdir.name, 'build_manifest.json')
+        self.orig_destination = app.app.config.get('FREEZER_DESTINATION')
+        self.orig_config = freeze.configure_app()
+
+    def tearDown(self):
+        import app
+
+        app.app.config.update(self.orig_config)
+        app.app.config['FREEZER_DESTINATION'] = self.orig_destination
+        app.app.config['FREEZER_SKIP_EXISTING'] = False
+        self.tmpdir.cleanup()
+
+    def run_freeze(self, force=False, jobs=1, only=None):
+        import app
+        import freeze
+        from build_manifest import BuildManifest
+
+        app.app.config['FREEZER_DESTINATION'] = self.build_dir
+        build = freeze.IncrementalFreeze(BuildManifest.load(self.manifest_file), force=force, only=only)
+        build.run(jobs=jobs)
+        return build
+
+    def test_second_freeze_skips_unchanged_pages(self):
+        """Test that an unchanged tree is frozen without re-rendering pages"""
+        import os
+
+        from build_manifest import BuildManifest
+        import app
+
+        first = self.run_freeze()
+        self.assertIn('/', first.rendered)
+        self.assertEqual(first.skipped, [])
+        self.assertEqual(BuildManifest.load(self.manifest_file).built_for,
+                         app.get_event_snapshot().today.isoformat())
+
+        homepage = os.path.join(self.build_dir, 'index.html')
+        os.utime(homepage, (0, 0))
+
+        second = self.run_freeze()
+        self.assertEqual(second.rendered, [])
+        self.assertIn('/', second.skipped)
+        self.assertIn('/events.ics', second.skipped)
+        self.assertEqual(os.stat(homepage).st_mtime, 0)
+
+    def test_every_endpoint_gets_urls(self):
+        """Test that the URL generators cover the month endpoints even with no events"""
+        import warnings
+        from flask_frozen import MissingURLGeneratorWarning
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            build = self.run_freeze()
+        self.assertFalse([w for w in caught if issubclass(w.category, MissingURLGeneratorWarning)])
+        today = __import__('app').get_event_snapshot().today
+        self.assertIn(f"/{today.year}/{today.month}/", build.rendered)
+        self.assertIn(f"/events/{today.year}-{today.month:02d}.json", build.rendered)
+
+    def test_render_modules_cover_local_imports(self):
+        """Test that every local module the pages use is part of the shared digest"""
+        from unittest.mock import patch
+        import app
+        import build_manifest
+
+        modules = build_manifest.render_modules()
+        for name in ('app.py', 'day_view.py', 'event_shards.py', 'ics_writer.py', 'rss_writer.py',
+                     'ndjson_export.py', 'data_cache.py'):
+            self.assertIn(name, modules)
+        self.assertFalse([name for name in modules if name.startswith('test_')])
+
+        snapshot = app.get_event_snapshot()
+        before = build_manifest.shared_inputs_digest(snapshot)
+        hash_file = build_manifest._hash_file
+
+        def edited(digest, path, name=None):
+            if name == 'day_view.py':
+                digest.update(b'edited day_view.py')
+            else:
+                hash_file(digest, path, name)
+
+        with patch('build_manifest._hash_file', side_effect=edited):
+            self.assertNotEqual(build_manifest.shared_inputs_digest(snapshot), before)
+
+    def test_changed_inputs_and_force_rerender(self):
+        """Test that changed shared inputs or --force render every page again"""
+        from unittest.mock import patch
+
+        first = self.run_freeze()
+        with patch('freeze.shared_inputs_digest', return_value='changed templates'):
+            changed = self.run_freeze()
+        self.assertEqual(sorted(changed.rendered), sorted(first.rendered))
+
+        forced = self.run_freeze(force=True)
+        self.assertEqual(forced.skipped, [])
+
+    def test_rebuild_is_byte_identical(self):
+        """Test that two builds over identical inputs produce identical files, whatever the clock says"""
+        import filecmp
+        import os
+        from unittest.mock import patch
+
+        class LaterDatetime(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                return datetime.now(tz) + timedelta(seconds=3)
+
+        self.run_freeze(force=True)
+        first_dir = self.build_dir
+        self.build_dir = os.path.join(self.tmpdir.name, 'rebuild')
+        with patch('app.datetime', LaterDatetime):
+            self.run_freeze(force=True)
+
+        for directory, _, filenames in os.walk(first_dir):
+            for name in filenames:
+                path = os.path.join(directory, name)
+                other = os.path.join(self.build_dir, os.path.relpath(path, first_dir))
+                self.assertTrue(filecmp.cmp(path, other, shallow=False), path)
+
+    def test_parallel_freeze_merges_one_manifest(self):
+        """Test that worker processes produce the same files and manifest"""
+        import os
+        from build_manifest import BuildManifest
+
+        serial = self.run_freeze()
+        serial_manifest = BuildManifest.load(self.manifest_file).pages
+
+        stale = os.path.join(self.build_dir, 'old-page', 'index.html')
+        os.makedirs(os.path.dirname(stale))
+        with open(stale, 'w') as f:
+            f.write('gone')
+
+        parallel = self.run_freeze(force=True, jobs=2)
+        self.assertEqual(sorted(parallel.rendered), sorted(serial.rendered))
+        self.assertEqual(BuildManifest.load(self.manifest_file).pages, serial_manifest)
+        self.assertFalse(os.path.exists(stale))
+
+        again = self.run_freeze(jobs=2)
+        self.assertEqual(again.rendered, [])
+
+    def test_cache_stats_cover_the_run(self):
+        """Test that the build reports each cache's counters, summed over workers"""
+        serial = self.run_freeze(force=True)
+        parallel = self.run_freeze(force=True, jobs=2)
+
+        for build in (serial, parallel):
+            self.assertEqual(set(build.cache_stats),
+                             {'Day fragments', 'Event snapshots', 'VEVENT blocks', 'RSS items',
+                              'Config', 'Categories', 'Sponsors'})
+            self.assertGreater(build.cache_stats['Event snapshots']['hits'], 0)
+            self.assertGreater(build.cache_stats['Categories']['hits'], 0)
+        self.assertEqual(parallel.cache_stats['Day fragments']['hits'] + parallel.cache_stats['Day fragments']['misses'],
+                         serial.cache_stats['Day fragments']['hits'] + serial.cache_stats['Day fragments']['misses'])
+
+    def test_targeted_freeze_renders_only_affected_urls(self):
+        """Test that --changed-since style builds leave unaffected pages alone"""
+        from build_manifest import BuildManifest
+
+        self.run_freeze()
+        before = BuildManifest.load(self.manifest_file).pages
+
+        targeted = self.run_freeze(force=True, only=['/virtual/'])
+        self.assertEqual(targeted.rendered, ['/virtual/'])
+        self.assertIn('/', targeted.skipped)
+        self.assertEqual(BuildManifest.load(self.manifest_file).pages, before)
+
+    def test_page_events_follow_index_buckets(self):
+        """Test that bucketed pages only depend on the events they show"""
+        import freeze
+        from event_index import EventIndex
+
+        events = [
+            {'date': '2026-05-05', 'title': 'AI night', 'categories': ['ai'], 'location_type': 'virtual'},
+            {'date': '2026-06-01', 'title': 'Data talk', 'categories': ['data']},
+        ]
+        index = EventIndex(events, pytz.timezone('US/Eastern'))
+
+        titles = lambda evs: [e['title'] for e in evs]
+        self.assertEqual(titles(freeze.page_events('category_rss_feed', {'slug': 'ai'}, index)), ['AI night'])
+        self.assertEqual(titles(freeze.page_events('month_page', {'year': 2026, 'month': 6}, index)), ['Data talk'])
+        self.assertEqual(titles(freeze.page_events('virtual_events_page', {}, index)), ['AI night'])
+        self.assertEqual(freeze.page_events('approved_groups_list', {}, index), [])
+        self.assertIsNone(freeze.page_events('homepage', {}, index))
+
+
+class TestEventIndex(unittest.TestCase):
+    """Test cases for the secondary event indexes"""
+
+    def test_multi_day_event_in_every_bucket(self):
+        """Test that a multi-day event is indexed under each week and month it spans"""
+        from event_index import EventIndex
+
+        events = [
+            {'date': '2025-01-30', 'end_date': '2025-02-04', 'title': 'Long Conference',
+             'categories': ['ai', 'conferences'], 'location': 'Arlington, VA 22201'},
+            {'date': '2025-02-10', 'title': 'Online Talk', 'location_type': 'virtual',
+             'categories': ['ai']},
+            {'date': 'not-a-date', 'title': 'Broken', 'categories': ['ai']},
+        ]
+        index = EventIndex(events, pytz.timezone('US/Eastern'))
+
+        self.assertEqual([e['title'] for e in index.in_week('2025-W05')], ['Long Conference'])
+        self.assertEqual([e['title'] for e in index.in_week('2025-W06')], ['Long Conference'])
+        self.assertEqual([e['title'] for e in index.in_month(2025, 1)], ['Long Conference'])
+        self.assertEqual([e['title'] for e in index.in_month(2025, 2)],
+                         ['Long Conference', 'Online Talk'])
+        self.assertEqual(len(index.in_category('ai')), 3)
+        self.assertEqual([e['title'] for e in index.in_state('VA')], ['Long Conference'])
+        self.assertEqual([e['title'] for e in index.virtual], ['Online Talk'])
+        self.assertEqual(len(index.in_person), 2)
+        self.assertEqual(index.in_week('2030-W01'), [])
+
+    def test_index_reused_for_same_event_list(self):
+        """Test that get_event_index builds once per event sequence"""
+        from app import get_event_index
+
+        events = ({'date': '2025-01-30', 'title': 'A'},)
+        self.assertIs(get_event_index(events), get_event_index(events))
+        self.assertIsNot(get_event_index(events), get_event_index(list(events)))
+
+
+class TestDayViewModel(unittest.TestCase):
+    """Test cases for the per-snapshot day/time-slot view"""
+
+    def setUp(self):
+        from event_index import EventIndex
+
+        self.local_tz = pytz.timezone('US/Eastern')
+        self.events = [
+            {'date': '2025-03-03', 'end_date': '2025-03-04', 'time': '09:00', 'title': 'Summit',
+             'categories': ['ai']},
+            {'date': '2025-03-03', 'time': '09:00', 'title': 'Breakfast', 'location_type': 'virtual'},
+            {'date': '2025-03-04', 'title': 'Hackathon', 'categories': ['ai']},
+        ]
+        self.index = EventIndex(self.events, self.local_tz)
+
+    def test_subset_matches_prepare_events_by_day(self):
+        """Test that selecting a bucket gives the same days as preparing it directly"""
+        from app import prepare_events_by_day
+        from day_view import DayViewModel
+
+        view = DayViewModel(self.index.events, self.local_tz)
+        subset = self.index.in_category('ai')
+        self.assertEqual(view.select(subset, add_week_links=True),
+                         prepare_events_by_day([dict(e) for e in subset], add_week_links=True))
+        self.assertEqual(len(view.select()), 2)
+
+    def test_entries_shared_between_pages(self):
+        """Test that pages reuse the same formatted entries and titles"""
+        from day_view import DayViewModel
+
+        view = DayViewModel(self.index.events, self.local_tz)
+        everything = view.select()
+        ai_only = view.select(self.index.in_category('ai'))
+
+        summit = everything[0]['time_slots'][0]['events'][1]
+        self.assertEqual(summit['title'], 'Summit')
+        self.assertIs(ai_only[0]['time_slots'][0]['events'][0], summit)
+        self.assertEqual(everything[0]['time_slots'][0]['events'][0]['newsletter_title'],
+                         'Virtual: Breakfast')
+        self.assertEqual(everything[1]['time_slots'][1]['events'][0]['display_title'],
+                         'Summit (continuing)')
+
+
+class TestEventShards(unittest.TestCase):
+    """Test cases for the per-month and per-category JSON shards"""
+
+    def setUp(self):
+        from event_index import EventIndex
+
+        self.events = [
+            {'date': '2025-01-30', 'end_date': '2025-02-02', 'title': 'Long Conference',
+             'categories': ['ai'], 'hidden': False},
+            {'date': '2025-02-10', 'time': '18:00', 'title': 'Online Talk', 'categories': ['ai'],
+             'location_type': 'virtual'},
+        ]
+        self.index = EventIndex(self.events, pytz.timezone('US/Eastern'))
+        self.categories = {'ai': {'name': 'AI'}, 'cloud': {'name': 'Cloud'}}
+
+    def test_manifest_hashes_match_shards(self):
+        """Test that index.json lists every shard with its count and content hash"""
+        import hashlib
+        import json
+        from event_shards import EventShards
+
+        shards = EventShards(self.index, self.categories)
+        manifest = json.loads(shards.index)
+
+        self.assertEqual(manifest['count'], 2)
+        self.assertEqual([m['month'] for m in manifest['months']], ['2025-01', '2025-02'])
+        self.assertEqual([m['count'] for m in manifest['months']], [1, 2])
+        february = manifest['months'][1]
+        self.assertEqual(february['path'], '/events/2025-02.json')
+        self.assertEqual(february['sha256'], hashlib.sha256(shards.month(2025, 2)).hexdigest())
+        self.assertEqual(february['compact_sha256'],
+                         hashlib.sha256(shards.month(2025, 2, compact=True)).hexdigest())
+        self.assertEqual({c['slug']: c['count'] for c in manifest['categories']}, {'ai': 2, 'cloud': 0})
+        self.assertIsNone(shards.month(2025, 3))
+        self.assertIsNone(shards.category('missing'))
+
+    def test_compact_variant(self):
+        """Test that the compact shard has short keys, no whitespace and no private fields"""
+        import json
+        from event_shards import EventShards
+
+        shards = EventShards(self.index, self.categories)
+        compact = shards.month(2025, 1, compact=True)
+        full = json.loads(shards.month(2025, 1))
+
+        self.assertNotIn(b' ', compact.replace(b'Long Conference', b''))
+        self.assertEqual(json.loads(compact), [{'d': '2025-01-30', 'e': '2025-02-02',
+                                                't': 'Long Conference', 'c': ['ai']}])
+        self.assertNotIn('hidden', full[0])
+        self.assertEqual(full[0]['title'], 'Long Conference')
+
+    def test_shard_routes(self):
+        """Test the /events/ routes serve the shards and 404 for missing ones"""
+        from unittest.mock import patch
+        import app
+
+        events = tuple(self.events)
+        with patch('app.get_events', return_value=events), \
+                patch('app.get_categories', return_value=self.categories):
+            client = app.app.test_client()
+            self.assertEqual(client.get('/events/2025-02.min.json').data,
+                             app.get_event_shards().month(2025, 2, compact=True))
+            self.assertEqual(client.get('/events/categories/ai.json').status_code, 200)
+            self.assertEqual(client.get('/events/index.json').mimetype, 'application/json')
+            self.assertEqual(client.get('/events/2025-03.json').status_code, 404)
+            self.assertEqual(client.get('/events/categories/missing.min.json').status_code, 404)
+
+
+class TestContentTime(unittest.TestCase):
+    """Test cases for data-derived feed and sitemap timestamps"""
+
+    def setUp(self):
+        import app
+        self.app = app.app
+        self.reproducible = self.app.config['REPRODUCIBLE_BUILD']
+        self.app.config['REPRODUCIBLE_BUILD'] = True
+
+    def tearDown(self):
+        self.app.config['REPRODUCIBLE_BUILD'] = self.reproducible
+
+    def test_newest_event_change_time(self):
+        """Test that the newest last-modified or created time wins"""
+        from app import get_content_time
+
+        events = [
+            {'date': '2025-03-01', 'title': 'A', 'createdAt': '2025-01-02T03:04:05Z'},
+            {'date': '2025-03-02', 'title': 'B', 'createdAt': '2024-12-01T00:00:00Z',
+             'last_modified': '2025-02-01T10:00:00.123456+00:00'},
+            {'date': '2025-03-03', 'title': 'C', 'createdAt': 'garbage'},
+        ]
+        self.assertEqual(get_content_time(events), datetime(2025, 2, 1, 10, 0, tzinfo=pytz.UTC))
+
+    def test_fallback_and_clock_mode(self):
+        """Test the start-of-day fallback and the non-reproducible mode"""
+        import app
+
+        midnight = app.get_content_time([{'date': '2025-03-01', 'title': 'No timestamps'}])
+        self.assertEqual(midnight.astimezone(app.local_tz).strftime('%H:%M:%S'), '00:00:00')
+
+        app.app.config['REPRODUCIBLE_BUILD'] = False
+        self.assertGreater(app.get_content_time([]), midnight)
+
+    def test_off_by_default_on_for_builds(self):
+        """Test that only the freeze takes timestamps from the data"""
+        import subprocess
+        import sys
+
+        code = ("import app, freeze; print(app.app.config['REPRODUCIBLE_BUILD']); "
+                "freeze.configure_app(); print(app.app.config['REPRODUCIBLE_BUILD'])")
+        output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True).stdout
+        self.assertEqual(output.split(), ['False', 'True'])
+
+
+class TestICSWriter(unittest.TestCase):
+    """Conformance tests for the streaming iCalendar writer, checked with the icalendar parser"""
+
+    def setUp(self):
+        from data_cache import FragmentCache
+        from event_utils import as_event
+
+        self.tz = pytz.timezone('US/Eastern')
+        self.cache = FragmentCache()
+        raw = [
+            {'date': '2025-03-01', 'time': '18:30', 'title': 'Data, Pizza; and \\ backslashes',
+             'location': 'Room 1, 1630 7th St NW; Washington, DC', 'url': 'https://example.com/a?x=1,2',
+             'group': 'Group "Quoted", Inc.', 'cost': 'Free'},
+            {'date': '2025-03-02', 'end_date': '2025-03-04', 'title': 'Ünïcode 🎉 ' * 12,
+             'location': 'Online'},
+            {'date': 'not-a-date', 'title': 'Skipped'},
+        ]
+        self.events = [as_event(e, self.tz) for e in raw]
+        self.websites = {'Group "Quoted", Inc.': 'https://group.example.com/'}
+
+    def write(self, events=None):
+        from ics_writer import write_calendar
+
+        return b''.join(write_calendar(self.events if events is None else events,
+                                       '-//Test//dctech.events//', 'Name, with comma', 'Line one, and\nline two',
+                                       lambda event: datetime(2025, 1, 1, 12, 0, tzinfo=pytz.UTC),
+                                       self.websites, self.cache))
+
+    def test_parses_with_icalendar(self):
+        """Test that every property round-trips through icalendar's parser"""
+        from icalendar import Calendar
+
+        cal = Calendar.from_ical(self.write())
+        self.assertEqual(str(cal['x-wr-calname']), 'Name, with comma')
+        self.assertEqual(str(cal['x-wr-caldesc']), 'Line one, and\\nline two')
+
+        timed, all_day = cal.walk('VEVENT')
+        self.assertEqual(str(timed['summary']), 'Data, Pizza; and \\ backslashes')
+        self.assertEqual(str(timed['location']), 'Room 1, 1630 7th St NW; Washington, DC')
+        self.assertEqual(str(timed['description']),
+                         'Event URL: https://example.com/a?x=1,2\nOrganized by: Group "Quoted", Inc.\nCost: Free')
+        self.assertEqual(timed.decoded('dtstart'), datetime(2025, 3, 1, 23, 30, tzinfo=pytz.UTC))
+        self.assertEqual(timed.decoded('dtstamp'), datetime(2025, 1, 1, 12, 0, tzinfo=pytz.UTC))
+        self.assertEqual(str(timed['url']), 'https://example.com/a?x=1,2')
+        self.assertEqual(timed['organizer'].params['CN'], "Group 'Quoted', Inc.")
+        self.assertEqual(str(timed['organizer']), 'https://group.example.com/')
+
+        self.assertEqual(str(all_day['summary']), 'Ünïcode 🎉 ' * 12)
+        self.assertEqual(all_day.decoded('dtstart'), date(2025, 3, 2))
+        self.assertEqual(all_day.decoded('dtend'), date(2025, 3, 5))
+
+    def test_lines_folded_at_75_octets(self):
+        """Test that no physical line exceeds 75 octets and UTF-8 characters aren't split"""
+        body = self.write()
+        self.assertTrue(body.endswith(b'END:VCALENDAR\r\n'))
+        for line in body.split(b'\r\n'):
+            self.assertLessEqual(len(line), 75)
+            line.decode('utf-8')
+        self.assertNotIn(b'\n', body.replace(b'\r\n', b''))
+
+    def test_vevent_blocks_shared_between_feeds(self):
+        """Test that a second feed with the same events reuses the rendered blocks"""
+        self.write()
+        misses = self.cache.misses
+        self.write(self.events[:1])
+        self.assertEqual(self.cache.misses, misses)
+        self.assertEqual(self.cache.hits, 1)
+
+
+class TestRSSWriter(unittest.TestCase):
+    """Test cases for the streaming RSS writer"""
+
+    def test_feed_parses_and_escapes(self):
+        """Test that a feed is well-formed XML with escaped text and attributes"""
+        from xml.etree import ElementTree as ET
+        from event_utils import as_event
+        from rss_writer import upcoming_item, write_feed
+
+        tz = pytz.timezone('US/Eastern')
+        event = as_event({'date': '2025-03-01', 'time': '18:30', 'title': 'Pizza & <Python>',
+                          'url': 'https://example.com/?a=1&b=2'}, tz)
+        body = b''.join(write_feed([upcoming_item(event, 'https://dctech.events', tz)], 'Feed "One"',
+                                   'https://dctech.events/', 'Events & more',
+                                   datetime(2025, 1, 1, tzinfo=pytz.UTC),
+                                   self_link='https://dctech.events/feed.xml?x="1"'))
+
+        channel = ET.fromstring(body).find('channel')
+        self.assertEqual(channel.findtext('title'), 'Feed "One"')
+        self.assertEqual(channel.findtext('lastBuildDate'), 'Wed, 01 Jan 2025 00:00:00 GMT')
+        self.assertEqual(channel.find('{http://www.w3.org/2005/Atom}link').get('href'),
+                         'https://dctech.events/feed.xml?x="1"')
+        item = channel.find('item')
+        self.assertEqual(item.findtext('title'), 'Pizza & <Python> (March 1, 2025)')
+        self.assertEqual(item.findtext('pubDate'), 'Sat, 01 Mar 2025 05:00:00 GMT')
+        self.assertIn('<a href="https://example.com/?a=1&b=2">', item.findtext('description'))
+
+    def test_items_shared_between_feeds(self):
+        """Test that category and location feeds reuse rendered items"""
+        from unittest.mock import patch
+        import app
+
+        events = ({'date': '2030-01-15', 'title': 'Shared Event', 'url': 'https://example.com/e',
+                   'categories': ['ai'], 'location': 'Arlington, VA'},)
+        app._rss_items.clear()
+        before = app.get_rss_item_cache_stats()
+        with patch('app.get_events', return_value=events), \
+                patch('app.get_categories', return_value={'ai': {'name': 'AI'}}):
+            client = app.app.test_client()
+            category_feed = client.get('/categories/ai/feed.xml').data
+            location_feed = client.get('/locations/va/feed.xml').data
+
+        after = app.get_rss_item_cache_stats()
+        self.assertEqual(after['misses'] - before['misses'], 1)
+        self.assertEqual(after['hits'] - before['hits'], 1)
+        self.assertIn(b'<title>Shared Event (January 15, 2030)</title>', category_feed)
+        self.assertIn(b'<title>Shared Event (January 15, 2030)</title>', location_feed)
+
+
+class TestGroupAndWeekFeeds(unittest.TestCase):
+    """Test cases for the per-group and per-week feeds"""
+
+    def setUp(self):
+        from unittest.mock import patch
+        import app
+
+        self.events = (
+            {'date': '2030-01-15', 'time': '18:00', 'title': 'Dojo Night', 'group': 'Python Dojo',
+             'url': 'https://example.com/dojo'},
+            {'date': '2030-01-16', 'title': 'Other Meetup', 'group': 'Other Group',
+             'url': 'https://example.com/other'},
+            {'date': '2030-02-20', 'title': 'Dojo Later', 'group': 'Python Dojo',
+             'url': 'https://example.com/later'},
+        )
+        groups = [{'id': 'python-dojo', 'name': 'Python Dojo', 'website': 'https://dojo.example.com/'},
+                  {'id': 'quiet-group', 'name': 'Quiet Group'}]
+        self.patchers = [patch('app.get_events', return_value=self.events),
+                         patch('app.get_approved_groups', return_value=groups),
+                         patch('app.get_group', side_effect={g['id']: g for g in groups}.get)]
+        for patcher in self.patchers:
+            patcher.start()
+        self.client = app.app.test_client()
+
+    def tearDown(self):
+        for patcher in self.patchers:
+            patcher.stop()
+
+    def test_group_feeds_only_contain_the_group(self):
+        """Test that a group feed lists that group's events and nothing else"""
+        ics = self.client.get('/groups/python-dojo/feed.ics').data
+        self.assertEqual(ics.count(b'BEGIN:VEVENT'), 2)
+        self.assertNotIn(b'Other Meetup', ics)
+
+        rss = self.client.get('/groups/python-dojo/feed.xml').data
+        self.assertIn(b'<link>https://dojo.example.com/</link>', rss)
+        self.assertEqual(rss.count(b'<item>'), 2)
+
+        empty = self.client.get('/groups/quiet-group/feed.ics')
+        self.assertEqual(empty.status_code, 200)
+        self.assertNotIn(b'BEGIN:VEVENT', empty.data)
+        self.assertEqual(self.client.get('/groups/missing/feed.xml').status_code, 404)
+
+    def test_week_feeds(self):
+        """Test that a week feed lists the events overlapping that ISO week"""
+        ics = self.client.get('/week/2030-W03/feed.ics').data
+        self.assertIn(b'Dojo Night', ics)
+        self.assertIn(b'Other Meetup', ics)
+        self.assertNotIn(b'Dojo Later', ics)
+        self.assertIn(b'Week of January 14, 2030', self.client.get('/week/2030-W03/feed.xml').data)
+        self.assertEqual(self.client.get('/week/not-a-week/feed.ics').status_code, 404)
+
+    def test_feeds_page_lists_group_and_week_feeds(self):
+        """Test that the feeds page links groups with events and weeks with events"""
+        html = self.client.get('/feeds/').data.decode()
+        self.assertIn('/groups/python-dojo/feed.ics', html)
+        self.assertNotIn('/groups/quiet-group/', html)
+        self.assertIn('/week/2030-W03/feed.xml', html)
+        self.assertIn('/week/2030-W08/feed.ics', html)
+
+
+class TestEventRecord(unittest.TestCase):
+    """Test cases for the pre-parsed Event record"""
+
+    def setUp(self):
+        self.local_tz = pytz.timezone('US/Eastern')
+
+    def test_dates_and_times_parsed_once(self):
+        """Test that an Event exposes parsed dates, per-day times and UTC instants"""
+        from datetime import time
+        from event_utils import Event
+
+        event = Event({
+            'date': '2026-04-20',
+            'end_date': '2026-04-22',
+            'time': {'2026-04-21': '14:00', '2026-04-22': 'TBD'},
+            'title': 'Data Center World',
+            'location_type': 'virtual',
+        }, self.local_tz)
+
+        self.assertEqual(event.start, date(2026, 4, 20))
+        self.assertEqual(event.end, date(2026, 4, 22))
+        self.assertEqual(event.times, {
+            date(2026, 4, 20): None,
+            date(2026, 4, 21): time(14, 0),
+            date(2026, 4, 22): None,
+        })
+        # Per-day times don't give the event a single start instant
+        self.assertIsNone(event.start_utc)
+        self.assertTrue(event.is_virtual)
+
+        timed = Event({'date': '2026-01-15', 'time': '18:30', 'title': 'Meetup'}, self.local_tz)
+        self.assertEqual(timed.start_utc, datetime(2026, 1, 15, 23, 30, tzinfo=pytz.UTC))
+        self.assertEqual(timed.end_utc, datetime(2026, 1, 16, 0, 30, tzinfo=pytz.UTC))
+
+    def test_behaves_like_event_dict(self):
+        """Test that an Event can be used wherever an event dict is expected"""
+        from event_utils import Event
+
+        data = {'date': '2026-01-15', 'title': 'Meetup', 'categories': ['python'],
+                'location': 'Arlington, VA 22201'}
+        event = Event(data, self.local_tz)
+
+        self.assertEqual(event['title'], 'Meetup')
+        self.assertEqual(event.get('categories'), ['python'])
+        self.assertIn('location', event)
+        self.assertNotIn('url', event)
+        self.assertEqual(dict(event), data)
+        self.assertEqual(event.state, 'VA')
+        self.assertEqual(event.region, 'va')
+
+        copy = event.copy()
+        copy['title'] = 'Changed'
+        self.assertEqual(event['title'], 'Meetup')
+
+    def test_invalid_date_is_skipped(self):
+        """Test that events with unparseable dates don't break day grouping"""
+        from app import prepare_events_by_day
+
+        days = prepare_events_by_day([
+            {'date': 'soon', 'title': 'Broken'},
+            {'date': '2026-01-15', 'time': '9:00', 'title': 'Fine'},
+        ])
+        self.assertEqual([d['date'] for d in days], ['2026-01-15'])
+        self.assertEqual(days[0]['time_slots'][0]['events'][0]['formatted_time'], '9:00 am')
+
+
+class TestSiteRegistry(unittest.TestCase):
+    """Test cases for the load-once category/sponsor/config registry"""
+
+    def setUp(self):
+        import os
+        import tempfile
+
+        self.orig_cwd = os.getcwd()
+        self.tmpdir = tempfile.TemporaryDirectory()
+        os.chdir(self.tmpdir.name)
+        os.makedirs('_categories')
+        os.makedirs('_data')
+
+    def tearDown(self):
+        import os
+        import site_config
+
+        os.chdir(self.orig_cwd)
+        self.tmpdir.cleanup()
+        # Reload the real config.yaml into the shared dict
+        site_config.get_config()
+
+    def test_categories_loaded_once_and_reloaded_on_change(self):
+        """Test that categories are cached until a category file is added"""
+        import os
+        import yaml
+        import site_config
+
+        with open(os.path.join('_categories', 'python.yaml'), 'w') as f:
+            yaml.dump({'name': 'Python'}, f)
+
+        first = site_config.get_categories()
+        self.assertIs(site_config.get_categories(), first)
+        self.assertEqual(first['python']['slug'], 'python')
+
+        with open(os.path.join('_categories', 'rust.yaml'), 'w') as f:
+            yaml.dump({'name': 'Rust'}, f)
+
+        self.assertEqual(sorted(site_config.get_categories()), ['python', 'rust'])
+
+    def test_sponsors_reloaded_on_change(self):
+        """Test that sponsors.json is re-read only after it changes"""
+        import json
+        import os
+        import site_config
+
+        self.assertEqual(site_config.get_sponsors(), [])
+
+        with open(os.path.join('_data', 'sponsors.json'), 'w') as f:
+            json.dump([{'name': 'Acme'}], f)
+
+        sponsors = site_config.get_sponsors()
+        self.assertEqual(sponsors, [{'name': 'Acme'}])
+        self.assertIs(site_config.get_sponsors(), sponsors)
+
+    def test_config_dict_updated_in_place(self):
+        """Test that a held reference to the config sees reloaded values"""
+        import site_config
+
+        config = site_config.get_config()
+        with open('config.yaml', 'w') as f:
+            f.write('site_name: Test Site\n')
+
+        self.assertIs(site_config.get_config(), config)
+        self.assertEqual(config['site_name'], 'Test Site')
+
+
 if __name__ == '__main__':
     unittest.main()
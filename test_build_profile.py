@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Tests for build_profile.py
+"""
+import unittest
+
+
+class TestBuildProfiler(unittest.TestCase):
+    """Test cases for the --profile build report"""
+
+    def setUp(self):
+        import tempfile
+
+        self.tmpdir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_report_contents(self):
+        """Test that stages and routes end up in the JSON report and pstats dump"""
+        import io
+        import json
+        import os
+        import pstats
+        from contextlib import redirect_stdout
+        from build_profile import BuildProfiler
+
+        profiler = BuildProfiler('freeze', directory=self.tmpdir.name)
+        profiler.start()
+        with profiler.stage('load'):
+            data = [bytes(1000) for _ in range(100)]
+        profiler.record_route('/', 0.5, 0.2, 2048)
+        profiler.record_route('/events.ics', 0.9, 0.0, 4096)
+        profiler.record_route('/week/2026-W01/', 0.1, 0.05, 100, skipped=True)
+
+        output = io.StringIO()
+        with redirect_stdout(output):
+            report_path = profiler.finish(top=1)
+
+        with open(report_path) as f:
+            report = json.load(f)
+        stage = report['stages'][0]
+        self.assertEqual(stage['stage'], 'load')
+        self.assertGreaterEqual(stage['peak_traced_bytes'], 100 * 1000)
+        self.assertGreaterEqual(stage['wall_seconds'], 0)
+        self.assertEqual([r['url'] for r in report['routes']], ['/events.ics', '/', '/week/2026-W01/'])
+        self.assertAlmostEqual(report['routes'][1]['data_seconds'], 0.3)
+        self.assertEqual(report['totals']['output_bytes'], 2048 + 4096 + 100)
+        pstats.Stats(os.path.join(self.tmpdir.name, 'freeze.pstats'))
+
+        # Top-N table lists the slowest rendered URL only
+        self.assertIn('/events.ics', output.getvalue())
+        self.assertNotIn('/week/2026-W01/', output.getvalue())
+        self.assertTrue(data)
+
+    def test_disabled_profiler_records_nothing(self):
+        """Test that a disabled profiler is a no-op"""
+        import os
+        from build_profile import BuildProfiler
+
+        profiler = BuildProfiler('freeze', enabled=False, directory=self.tmpdir.name)
+        profiler.start()
+        with profiler.stage('load'):
+            pass
+        profiler.record_route('/', 0.5, 0.2, 2048)
+        self.assertIsNone(profiler.finish())
+        self.assertEqual(profiler.stages, [])
+        self.assertEqual(os.listdir(self.tmpdir.name), [])
+
+    def test_take_profile_flag(self):
+        """Test that --profile is removed before argv reaches calgen"""
+        from build_profile import take_profile_flag
+
+        argv = ['refresh_calendars.py', '--profile', '--force']
+        self.assertTrue(take_profile_flag(argv))
+        self.assertEqual(argv, ['refresh_calendars.py', '--force'])
+        self.assertFalse(take_profile_flag(argv))
+
+
+if __name__ == '__main__':
+    unittest.main()
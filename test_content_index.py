@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Tests for content_index.py
+"""
+import unittest
+
+
+class TestContentIndex(unittest.TestCase):
+    """Test cases for the persisted YAML content index"""
+
+    def setUp(self):
+        import os
+        import tempfile
+        import content_index
+
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.groups_dir = os.path.join(self.tmpdir.name, '_groups')
+        os.makedirs(self.groups_dir)
+        self.orig_index_file = content_index.INDEX_FILE
+        content_index.INDEX_FILE = os.path.join(self.tmpdir.name, '_cache', 'content_index.pickle')
+        content_index.clear()
+
+    def tearDown(self):
+        import content_index
+
+        content_index.INDEX_FILE = self.orig_index_file
+        content_index.clear()
+        self.tmpdir.cleanup()
+
+    def write_group(self, slug, text):
+        import os
+
+        with open(os.path.join(self.groups_dir, f'{slug}.yaml'), 'w') as f:
+            f.write(text)
+
+    def test_unchanged_files_only_statted(self):
+        """Test that a second run reuses persisted documents without parsing"""
+        import os
+        from unittest.mock import patch
+        import content_index
+
+        self.write_group('a', 'name: Group A\n')
+        self.write_group('b', 'name: Group B\nwebsite: https://b.example.com\n')
+
+        tree = content_index.get_tree(self.groups_dir)
+        self.assertEqual(list(tree.documents), ['a', 'b'])
+        self.assertEqual(tree.documents['b']['website'], 'https://b.example.com')
+        self.assertIs(content_index.get_tree(self.groups_dir), tree)
+
+        # Nothing is written until an entry point saves the index
+        self.assertFalse(os.path.exists(content_index.INDEX_FILE))
+        self.assertTrue(content_index.save_index())
+        self.assertEqual(os.listdir(os.path.dirname(content_index.INDEX_FILE)), ['content_index.pickle'])
+
+        # Simulate a new process: in-memory state gone, on-disk index remains
+        content_index.clear()
+        with patch('content_index.yaml.load') as load, patch('content_index._read_and_hash') as read:
+            again = content_index.get_tree(self.groups_dir)
+        load.assert_not_called()
+        read.assert_not_called()
+        self.assertEqual(again.documents, tree.documents)
+
+    def test_changed_and_removed_files(self):
+        """Test that edits are re-parsed and deleted files drop out"""
+        import os
+        import content_index
+
+        self.write_group('a', 'name: Group A\n')
+        self.write_group('b', 'name: Group B\n')
+        content_index.get_tree(self.groups_dir)
+
+        self.write_group('a', 'name: Renamed Group\n')
+        os.remove(os.path.join(self.groups_dir, 'b.yaml'))
+
+        tree = content_index.get_tree(self.groups_dir)
+        self.assertEqual(tree.documents, {'a': {'name': 'Renamed Group'}})
+
+    def test_identical_content_matched_by_hash(self):
+        """Test that a file with known content isn't parsed again"""
+        import content_index
+
+        self.write_group('a', 'name: Same\n')
+        content_index.get_tree(self.groups_dir)
+        before = content_index.stats()
+
+        self.write_group('copy', 'name: Same\n')
+        tree = content_index.get_tree(self.groups_dir)
+        after = content_index.stats()
+
+        self.assertEqual(tree.documents['copy'], {'name': 'Same'})
+        self.assertEqual(after['parsed'], before['parsed'])
+        self.assertEqual(after['hash_hits'], before['hash_hits'] + 1)
+
+    def test_load_documents_returns_copies(self):
+        """Test that callers can annotate documents without affecting the index"""
+        import content_index
+
+        self.write_group('a', 'name: Group A\n')
+        (slug, doc), = content_index.load_documents(self.groups_dir)
+        doc['id'] = slug
+        self.assertNotIn('id', content_index.get_tree(self.groups_dir).documents['a'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Tests for dependency_graph.py
+"""
+import unittest
+from datetime import date
+import pytz
+
+
+class TestDependencyGraph(unittest.TestCase):
+    """Test cases for the event -> URL dependency graph"""
+
+    def setUp(self):
+        self.tz = pytz.timezone('US/Eastern')
+        self.today = date(2026, 1, 26)
+        self.categories = {'ai': {'name': 'AI'}}
+        self.events = [
+            {'guid': 'conf', 'date': '2026-01-30', 'end_date': '2026-02-02', 'title': 'Conference',
+             'categories': ['ai', 'unknown'], 'location': '1 Main St, Arlington, VA 22201'},
+            {'guid': 'online', 'date': '2026-03-10', 'title': 'Webinar', 'location_type': 'virtual'},
+            {'guid': 'hidden', 'date': '2026-03-10', 'title': 'Hidden', 'hidden': True},
+        ]
+
+    def graph(self, events):
+        from dependency_graph import DependencyGraph
+
+        return DependencyGraph(events, self.today, self.tz, self.categories)
+
+    def test_urls_for_multi_day_event(self):
+        """Test that an event maps to every week, month, category and region page it's on"""
+        urls = self.graph(self.events).urls_for('conf')
+        for url in ['/week/2026-W05/', '/week/2026-W06/', '/2026/1/', '/2026/2/',
+                    '/categories/ai/', '/categories/ai/feed.ics', '/categories/ai/feed.xml',
+                    '/locations/va/', '/locations/va/feed.xml', '/', '/newsletter.html', '/events.ics']:
+            self.assertIn(url, urls)
+        self.assertNotIn('/categories/unknown/', urls)
+        self.assertNotIn('/virtual/', urls)
+
+    def test_window_and_hidden_events(self):
+        """Test that far-off virtual events skip the homepage and hidden events appear nowhere"""
+        graph = self.graph(self.events)
+        urls = graph.urls_for('online')
+        self.assertIn('/virtual/', urls)
+        self.assertNotIn('/', urls)
+        self.assertNotIn('/newsletter.html', urls)
+        self.assertEqual(graph.urls_for('hidden'), set())
+
+    def test_edit_only_touches_event_pages(self):
+        """Test that a title edit invalidates the event's pages and the sitemap but not count pages"""
+        from dependency_graph import affected_urls
+
+        edited = [dict(self.events[0]), self.events[1], self.events[2]]
+        edited[1] = dict(self.events[1], title='Webinar (updated)')
+        urls = affected_urls(self.graph(self.events), self.graph(edited))
+
+        self.assertIn('/virtual/', urls)
+        self.assertIn('/2026/3/', urls)
+        self.assertNotIn('/2026/1/', urls)
+        self.assertNotIn('/categories/', urls)
+        # The sitemap's lastmod comes from the events' change times
+        self.assertIn('/sitemap.xml', urls)
+
+    def test_move_includes_old_new_and_count_pages(self):
+        """Test that moving an event invalidates both locations and the count pages"""
+        from dependency_graph import affected_urls
+
+        moved = [self.events[0], dict(self.events[1], date='2026-04-14'), self.events[2]]
+        urls = affected_urls(self.graph(self.events), self.graph(moved))
+
+        self.assertIn('/2026/3/', urls)
+        self.assertIn('/2026/4/', urls)
+        self.assertIn('/sitemap.xml', urls)
+        self.assertIn('/categories/', urls)
+        self.assertNotIn('/2026/1/', urls)
+
+    def test_no_changes_no_urls(self):
+        """Test that identical event files produce an empty list"""
+        from dependency_graph import affected_urls
+
+        self.assertEqual(affected_urls(self.graph(self.events), self.graph(list(self.events))), [])
+
+    def test_event_entering_the_window(self):
+        """Test that an unchanged event moving into the two-week window invalidates the homepage"""
+        from dependency_graph import DependencyGraph, affected_urls
+
+        events = [dict(self.events[0], date='2026-02-09', end_date=None)]
+        graph = lambda today: DependencyGraph(events, today, self.tz, self.categories)
+        urls = affected_urls(graph(date(2026, 1, 25)), graph(date(2026, 1, 26)))
+
+        self.assertIn('/', urls)
+        self.assertIn('/newsletter.html', urls)
+        self.assertIn('/newsletter.txt', urls)
+
+    def test_events_dropped_by_the_date_are_removed(self):
+        """Test that graphing the old events as of the last build catches events that have passed"""
+        from dependency_graph import DependencyGraph, affected_urls
+
+        events = [dict(self.events[0], date='2026-01-27', end_date=None), self.events[1]]
+        graph = lambda today: DependencyGraph(events, today, self.tz, self.categories)
+        self.assertEqual(affected_urls(graph(date(2026, 1, 29)), graph(date(2026, 1, 29))), [])
+
+        urls = affected_urls(graph(date(2026, 1, 25)), graph(date(2026, 1, 29)))
+        self.assertIn('/2026/1/', urls)
+        self.assertIn('/categories/ai/', urls)
+        self.assertIn('/categories/', urls)
+        self.assertNotIn('/virtual/', urls)
+
+    def test_previous_build_date_from_manifest(self):
+        """Test that the manifest records the day a build was made for"""
+        import os
+        import tempfile
+        from build_manifest import BuildManifest
+        from dependency_graph import previous_build_date
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'build_manifest.json')
+            self.assertIsNone(previous_build_date(BuildManifest.load(path)))
+            manifest = BuildManifest(path)
+            manifest.built_for = '2026-01-25'
+            manifest.save()
+            self.assertEqual(previous_build_date(BuildManifest.load(path)), date(2026, 1, 25))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Tests for ndjson_export.py
+"""
+import unittest
+
+
+class TestNDJSONExport(unittest.TestCase):
+    """Test cases for the newline-delimited JSON export"""
+
+    def setUp(self):
+        self.events = [
+            {'date': '2025-03-02', 'time': '18:00', 'title': 'Evening', 'url': 'https://example.com/e'},
+            {'date': '2025-03-01', 'end_date': '2025-03-03', 'title': 'Conference'},
+            {'date': '2025-03-02', 'title': 'All Day', 'hidden': False},
+            {'date': '2025-04-10', 'time': '09:00', 'title': 'Later'},
+        ]
+
+    def test_sorted_compact_lines(self):
+        """Test one compact JSON object per line, in date and time order"""
+        import json
+        from ndjson_export import iter_ndjson
+
+        lines = list(iter_ndjson(self.events))
+        self.assertEqual([json.loads(line)['title'] for line in lines],
+                         ['Conference', 'All Day', 'Evening', 'Later'])
+        self.assertTrue(all(line.endswith(b'\n') and b'\n' not in line[:-1] for line in lines))
+        self.assertNotIn(b': ', lines[2])
+        self.assertNotIn(b'hidden', b''.join(lines))
+
+    def test_window_and_fields(self):
+        """Test date-window filtering (multi-day events overlap) and field projection"""
+        import json
+        from ndjson_export import iter_ndjson
+
+        lines = iter_ndjson(self.events, since='2025-03-03', until='2025-03-31', fields=['title', 'url', 'hidden'])
+        self.assertEqual([json.loads(line) for line in lines], [{'title': 'Conference'}])
+
+    def test_resume_from_offset(self):
+        """Test that resuming at a line boundary gives the rest of the export"""
+        from ndjson_export import iter_ndjson
+
+        full = b''.join(iter_ndjson(self.events))
+        first_line = len(next(iter_ndjson(self.events)))
+        self.assertEqual(b''.join(iter_ndjson(self.events, offset=first_line)), full[first_line:])
+        self.assertEqual(b''.join(iter_ndjson(self.events, offset=len(full))), b'')
+        with self.assertRaises(ValueError):
+            list(iter_ndjson(self.events, offset=first_line + 1))
+
+    def test_cli_resume_appends(self):
+        """Test that --resume completes a partial export file"""
+        import json
+        import os
+        import tempfile
+        from ndjson_export import iter_ndjson, main
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source = os.path.join(tmpdir, 'all_events.json')
+            output = os.path.join(tmpdir, 'events.ndjson')
+            with open(source, 'w') as f:
+                json.dump(self.events, f)
+            with open(output, 'wb') as f:
+                f.write(next(iter_ndjson(self.events)))
+
+            self.assertEqual(main(['--input', source, '--output', output, '--resume']), 0)
+            with open(output, 'rb') as f:
+                self.assertEqual(f.read(), b''.join(iter_ndjson(self.events)))
+
+    def test_route_serves_upcoming_events(self):
+        """Test that /events.ndjson streams the site's events"""
+        from unittest.mock import patch
+        import app
+
+        with patch('app.get_events', return_value=tuple(self.events)):
+            response = app.app.test_client().get('/events.ndjson')
+        self.assertEqual(response.mimetype, 'application/x-ndjson')
+        self.assertEqual(len(response.data.splitlines()), 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Tests for precompress.py
+"""
+import unittest
+
+
+class TestPrecompress(unittest.TestCase):
+    """Test cases for precompressed build artifacts"""
+
+    def setUp(self):
+        import os
+        import tempfile
+
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.root = os.path.join(self.tmpdir.name, 'build')
+        self.manifest_file = os.path.join(self.tmpdir.name, 'artifact_manifest.json')
+        os.makedirs(os.path.join(self.root, 'week'))
+        self.write('events.ics', 'BEGIN:VCALENDAR\n' * 100)
+        self.write('week/index.html', '<p>events</p>' * 100)
+        self.write('tiny.json', '{}')
+        self.write('logo.png', 'not really a png' * 100)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def write(self, name, text):
+        import os
+
+        with open(os.path.join(self.root, name), 'w') as f:
+            f.write(text)
+
+    def run_precompress(self):
+        import json
+        import precompress
+
+        counts = precompress.precompress_build(self.root, self.manifest_file)
+        with open(self.manifest_file) as f:
+            return counts, json.load(f)
+
+    def test_variants_and_manifest(self):
+        """Test that text artifacts get .gz variants recorded in the manifest"""
+        import gzip
+        import os
+
+        counts, manifest = self.run_precompress()
+        with gzip.open(os.path.join(self.root, 'events.ics.gz'), 'rt') as f:
+            self.assertEqual(f.read(), 'BEGIN:VCALENDAR\n' * 100)
+
+        entry = manifest['files']['events.ics']
+        self.assertEqual(entry['content_type'], 'text/calendar')
+        self.assertEqual(entry['size'], len('BEGIN:VCALENDAR\n' * 100))
+        self.assertEqual(entry['variants']['.gz']['content_encoding'], 'gzip')
+        self.assertIn('week/index.html.gz', manifest['changed'])
+
+        # Binary and tiny files are listed but not compressed
+        self.assertEqual(manifest['files']['logo.png']['variants'], {})
+        self.assertFalse(os.path.exists(os.path.join(self.root, 'tiny.json.gz')))
+        self.assertNotIn('events.ics.gz', manifest['files'])
+
+    def test_unchanged_sources_reuse_variants(self):
+        """Test that a second run only recompresses changed sources"""
+        import os
+
+        self.run_precompress()
+        gz_path = os.path.join(self.root, 'week', 'index.html.gz')
+        os.utime(gz_path, (0, 0))
+
+        counts, manifest = self.run_precompress()
+        self.assertEqual(counts['compressed'], 0)
+        self.assertEqual(manifest['changed'], [])
+        self.assertEqual(os.stat(gz_path).st_mtime, 0)
+
+        self.write('events.ics', 'BEGIN:VCALENDAR\nX\n' * 100)
+        counts, manifest = self.run_precompress()
+        self.assertIn('events.ics', manifest['changed'])
+        self.assertIn('events.ics.gz', manifest['changed'])
+        self.assertEqual(os.stat(gz_path).st_mtime, 0)
+
+    def test_removed_sources_drop_variants(self):
+        """Test that variants of deleted files are removed"""
+        import os
+
+        self.run_precompress()
+        os.remove(os.path.join(self.root, 'events.ics'))
+        counts, manifest = self.run_precompress()
+        self.assertFalse(os.path.exists(os.path.join(self.root, 'events.ics.gz')))
+        self.assertNotIn('events.ics', manifest['files'])
+
+    def test_shipped_compressed_files_are_kept(self):
+        """Test that .gz/.br files the tool didn't write are artifacts, not orphans"""
+        import os
+
+        self.write('archive.tar.gz', 'not really gzip')
+        self.write('logo.png.br', 'shipped next to its source')
+        self.run_precompress()
+        os.remove(os.path.join(self.root, 'logo.png'))
+        counts, manifest = self.run_precompress()
+
+        for name in ('archive.tar.gz', 'logo.png.br'):
+            self.assertTrue(os.path.exists(os.path.join(self.root, name)))
+            self.assertIn(name, manifest['files'])
+        self.assertNotIn('week/index.html.gz', manifest['files'])
+
+
+if __name__ == '__main__':
+    unittest.main()